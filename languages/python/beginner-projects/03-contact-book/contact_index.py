@@ -0,0 +1,424 @@
+"""
+contact_index.py — Search index for large contact books
+========================================================
+
+The starter code searches with one linear scan:
+
+    [c for c in contacts if query.lower() in c["name"].lower()]
+
+That is the right answer for a personal contact book. For a shared
+address book with hundreds of thousands of entries, every keystroke
+rescans every name. This module keeps three in-memory indexes instead,
+built once at load time and updated on every add/update/delete:
+
+    1. A sorted list of full names — prefix queries are a binary search
+       (bisect) followed by a short walk, O(log n + results).
+    2. A sorted list of (word, key) pairs — finds "smi" in "Alice Smith"
+       the same way.
+    3. A trigram index: every 3-character slice of a name maps to the set
+       of contacts containing it. A substring query can only match names
+       that contain ALL of its trigrams, so we intersect a few sets
+       (smallest first) and check just those candidates.
+
+Fuzzy (typo-tolerant) search works on the vocabulary of distinct words,
+with its own trigram index: a word within k edits of a query word still
+shares most of its trigrams, so only words appearing in the query's
+rarest trigram lists get the (expensive) edit-distance check. A 500k
+contact book typically only has a few thousand different first and
+last names, so that is a much smaller haystack than the names themselves.
+
+Ranking, best first:
+    exact name  >  name prefix  >  word prefix  >  substring  >  fuzzy
+Each tier is only computed when the better tiers have not already
+filled the requested number of results — typing "ann" in a 500k book
+stops after the prefix tier and never touches the other indexes.
+
+Usage:
+    from contacts import load_contacts
+    from contact_index import ContactIndex
+
+    index = ContactIndex(load_contacts())
+    key = index.add({"name": "Alice Smith", "phone": "555-0101", "email": ""})
+    index.search("ali")             # ranked list of contact dicts
+    index.search("alcie", limit=5)  # typos fall through to fuzzy matching
+    index.update(key, {"name": "Alice Jones", "phone": "555-0101", "email": ""})
+    index.remove(key)
+
+Keys:
+    Every contact gets an integer key when it enters the index. Keys
+    never change, unlike list positions, which shift after a delete.
+    contacts() returns the contacts in key order, ready for save_contacts().
+"""
+
+import heapq
+from collections import Counter, defaultdict
+from bisect import bisect_left, insort
+
+# Queries shorter than this are too ambiguous for typo matching.
+FUZZY_MIN_LENGTH = 4
+
+
+def normalize(text):
+    """
+    Case-fold a name and collapse runs of whitespace.
+
+    casefold() is a stronger lower(): it also matches "STRASSE" with
+    "straße". Collapsing whitespace means "Alice  Smith" (two spaces)
+    still matches a search for "alice smith".
+    """
+    return " ".join(text.casefold().split())
+
+
+def trigrams(text):
+    """Return the set of 3-character slices of ``text``."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def padded_trigrams(name):
+    """
+    Trigrams of a name with a space on each side.
+
+    The padding adds slices like " al" and "ce " that mark where words
+    start and end, so even a short word such as "bob" has three trigrams
+    (" bo", "bob", "ob ") for fuzzy matching to work with. The spaces
+    inside a name already mark the inner word boundaries.
+    """
+    return trigrams(f" {name} ")
+
+
+def edit_distance(a, b, limit):
+    """
+    Number of single-character edits (insert, delete, substitute, or swap
+    two neighbouring characters) that turn ``a`` into ``b`` — or
+    ``limit + 1`` if it is larger than ``limit``.
+
+    Counting a swap as one edit matters for typing: "jonh" is one slip
+    away from "john", not two.
+
+    Classic dynamic programming, one row at a time. Two shortcuts keep
+    it cheap when most candidates are far away:
+        - strings whose lengths differ by more than ``limit`` need at
+          least that many inserts, so we skip the table entirely
+        - once every cell in a row exceeds ``limit`` the final answer
+          can only be larger, so we stop early
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before = None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            cost = min(
+                previous[j] + 1,  # delete from a
+                current[j - 1] + 1,  # insert into a
+                previous[j - 1] + (char_a != char_b),  # substitute
+            )
+            if before and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b:
+                cost = min(cost, before[j - 2] + 1)  # swap neighbours
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+class ContactIndex:
+    """
+    Contacts plus the indexes needed to search them without a full scan.
+
+    Attributes:
+        by_key (dict[int, dict]): Every contact, keyed by its stable key.
+
+    The indexes are private (leading underscore): callers go through
+    add/update/remove so the indexes can never drift out of sync with
+    the contacts themselves.
+    """
+
+    def __init__(self, contacts=()):
+        self.by_key = {}
+        self._names = {}  # key -> normalized name
+        self._sorted_names = []  # (name, key), sorted
+        self._sorted_words = []  # (word, key), sorted
+        self._trigrams = defaultdict(set)  # trigram -> set of keys
+        self._word_counts = {}  # word -> number of names using it
+        self._word_trigrams = defaultdict(set)  # trigram -> words, for fuzzy search
+        self._next_key = 0
+
+        # Building sorted lists by appending and sorting once is
+        # O(n log n); calling insort() n times would be O(n²).
+        for contact in contacts:
+            key = self._next_key
+            self._next_key += 1
+            self.by_key[key] = contact
+            name = normalize(contact["name"])
+            self._names[key] = name
+            self._sorted_names.append((name, key))
+            for word in set(name.split()):
+                self._sorted_words.append((word, key))
+                self._count_word(word)
+            for gram in padded_trigrams(name):
+                self._trigrams[gram].add(key)
+        self._sorted_names.sort()
+        self._sorted_words.sort()
+
+    def __len__(self):
+        return len(self.by_key)
+
+    def contacts(self):
+        """Return all contacts in key (insertion) order, e.g. for saving."""
+        return list(self.by_key.values())
+
+    # ============================================================
+    # KEEPING THE INDEXES UP TO DATE
+    # ============================================================
+
+    def add(self, contact):
+        """Index a new contact and return its key."""
+        key = self._next_key
+        self._next_key += 1
+        self.by_key[key] = contact
+        self._index_name(key, normalize(contact["name"]))
+        return key
+
+    def update(self, key, contact):
+        """
+        Replace the contact stored under ``key``.
+
+        Only a changed name touches the indexes — editing a phone
+        number is a plain dictionary assignment.
+        """
+        if key not in self.by_key:
+            raise KeyError(key)
+        self.by_key[key] = contact
+        name = normalize(contact["name"])
+        if name != self._names[key]:
+            self._unindex_name(key)
+            self._index_name(key, name)
+
+    def remove(self, key):
+        """Remove and return the contact stored under ``key``."""
+        contact = self.by_key.pop(key)
+        self._unindex_name(key)
+        return contact
+
+    def _index_name(self, key, name):
+        self._names[key] = name
+        insort(self._sorted_names, (name, key))
+        for word in set(name.split()):
+            insort(self._sorted_words, (word, key))
+            self._count_word(word)
+        for gram in padded_trigrams(name):
+            self._trigrams[gram].add(key)
+
+    def _unindex_name(self, key):
+        name = self._names.pop(key)
+        # Each (name, key) pair is unique, so bisect lands exactly on it.
+        del self._sorted_names[bisect_left(self._sorted_names, (name, key))]
+        for word in set(name.split()):
+            del self._sorted_words[bisect_left(self._sorted_words, (word, key))]
+            self._uncount_word(word)
+        for gram in padded_trigrams(name):
+            keys = self._trigrams[gram]
+            keys.discard(key)
+            if not keys:
+                del self._trigrams[gram]  # don't keep empty sets around
+
+    def _count_word(self, word):
+        if word not in self._word_counts:
+            self._word_counts[word] = 0
+            for gram in padded_trigrams(word):
+                self._word_trigrams[gram].add(word)
+        self._word_counts[word] += 1
+
+    def _uncount_word(self, word):
+        self._word_counts[word] -= 1
+        if not self._word_counts[word]:
+            del self._word_counts[word]
+            for gram in padded_trigrams(word):
+                words = self._word_trigrams[gram]
+                words.discard(word)
+                if not words:
+                    del self._word_trigrams[gram]
+
+    # ============================================================
+    # QUERIES
+    # ============================================================
+    # Each query returns keys; search() combines them into ranked
+    # contacts. All of them accept a ``limit`` so the caller only pays
+    # for the results it is going to show.
+    # ============================================================
+
+    def prefix(self, query, limit=None):
+        """Keys of names starting with ``query``, in name order."""
+        return self._walk(self._sorted_names, normalize(query), limit)
+
+    def word_prefix(self, query, limit=None):
+        """Keys of names with any word starting with ``query``, in word order."""
+        return self._walk(self._sorted_words, normalize(query), limit)
+
+    @staticmethod
+    def _walk(pairs, query, limit):
+        """Collect keys from a sorted (text, key) list while text starts with query."""
+        # A dict rather than a list: "Ann Annis" has two words starting
+        # with "ann" but should only be returned once.
+        keys = {}
+        for i in range(bisect_left(pairs, (query,)), len(pairs)):
+            text, key = pairs[i]
+            if not text.startswith(query) or len(keys) == limit:
+                break
+            keys[key] = None
+        return list(keys)
+
+    def substring(self, query, limit=None):
+        """Keys of names containing ``query``, in name order."""
+        query = normalize(query)
+        if len(query) < 3:
+            # No trigram to look up — a prefix/word-prefix search is the
+            # useful answer for one or two characters.
+            return self.word_prefix(query, limit)
+
+        grams = sorted(trigrams(query), key=lambda g: len(self._trigrams.get(g, ())))
+        candidates = set(self._trigrams.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not candidates:
+                break
+            candidates &= self._trigrams.get(gram, set())
+
+        # Sharing every trigram is necessary but not sufficient:
+        # "abcxbcd" contains "abc" and "bcd" but not "abcd".
+        matches = [(self._names[k], k) for k in candidates if query in self._names[k]]
+        if limit is None:
+            return [key for _, key in sorted(matches)]
+        return [key for _, key in heapq.nsmallest(limit, matches)]
+
+    def close_words(self, word, max_distance):
+        """
+        Return ``{indexed_word: distance}`` for every word within
+        ``max_distance`` edits of ``word``.
+        """
+        grams = padded_trigrams(word)
+        # One edit changes at most 4 trigrams (a swap touches the slices
+        # around both characters), so a close word shares at least
+        # ``needed`` trigrams with ``word``...
+        needed = len(grams) - 4 * max_distance
+        if needed < 1:
+            # Too many typos for such a short word: any word could match,
+            # so check them all.
+            shared = Counter(dict.fromkeys(self._word_counts, 0))
+            lists = []
+            split = needed = 0
+        else:
+            lists = sorted((self._word_trigrams.get(g, set()) for g in grams), key=len)
+            # ...and by the pigeonhole principle it must appear in at least
+            # one of the rarest ``len(grams) - needed + 1`` lists, so only
+            # those lists are scanned. The rest are membership checks.
+            split = len(lists) - needed + 1
+            shared = Counter()
+            for candidates in lists[:split]:
+                shared.update(candidates)
+
+        close = {}
+        for candidate, count in shared.items():
+            count += sum(candidate in rest for rest in lists[split:])
+            if count >= needed:
+                distance = edit_distance(word, candidate, max_distance)
+                if distance <= max_distance:
+                    close[candidate] = distance
+        return close
+
+    def fuzzy(self, query, max_distance=None, limit=None):
+        """
+        Keys of names where every query word is within ``max_distance``
+        edits of some word of the name, closest first.
+
+        "jonh smiht" finds "John Smith"; "alcie" finds "Alice Smith" and
+        "Alice Jones".
+
+        Parameters:
+            query (str): What the user typed.
+            max_distance (int | None): Allowed typos per word. Defaults to
+                1, or 2 for words of 10 characters or more. Words shorter
+                than FUZZY_MIN_LENGTH must always match exactly.
+            limit (int | None): Maximum number of keys to return.
+        """
+        distances = None  # key -> total distance over the query words so far
+        # Rarest words first, so the running set of keys stays small.
+        per_word = []
+        for word in normalize(query).split():
+            if len(word) < FUZZY_MIN_LENGTH:
+                allowed = 0
+            elif max_distance is None:
+                allowed = 1 if len(word) < 10 else 2
+            else:
+                allowed = max_distance
+            close = self.close_words(word, allowed)
+            per_word.append((sum(self._word_counts[w] for w in close), close))
+
+        for _, close in sorted(per_word, key=lambda pair: pair[0]):
+            best = {}  # key -> closest distance for this query word
+            for word, distance in close.items():
+                for key in self._exact_word_keys(word):
+                    if distances is None or key in distances:
+                        if distance < best.get(key, distance + 1):
+                            best[key] = distance
+            if distances is None:
+                distances = best
+            else:
+                distances = {key: distances[key] + best[key] for key in best}
+            if not distances:
+                return []
+
+        scored = [(d, self._names[key], key) for key, d in (distances or {}).items()]
+        return [key for _, _, key in heapq.nsmallest(limit or len(scored), scored)]
+
+    def _exact_word_keys(self, word):
+        """Keys of names containing ``word`` as a whole word."""
+        pairs = self._sorted_words
+        for i in range(bisect_left(pairs, (word,)), len(pairs)):
+            text, key = pairs[i]
+            if text != word:
+                break
+            yield key
+
+    def search(self, query, limit=10, fuzzy=True):
+        """
+        Ranked search combining every query type.
+
+        Parameters:
+            query (str): The search string.
+            limit (int): Maximum number of contacts to return.
+            fuzzy (bool): Fall back to typo-tolerant matching when the
+                exact tiers find fewer than ``limit`` contacts.
+
+        Returns:
+            list[dict]: Matching contacts, best match first — the same
+            shape search_contacts() returns, so the menu code can use
+            either one.
+        """
+        query = normalize(query)
+        if not query:
+            return []
+
+        # A dict as an ordered set: it keeps keys in the order they were
+        # ranked and ignores a key that a better tier already added.
+        ranked = {}
+
+        def collect(keys):
+            for key in keys:
+                if len(ranked) == limit:
+                    return
+                ranked.setdefault(key, None)
+
+        # Exact matches are the first entries of the prefix walk.
+        prefix_keys = self.prefix(query, limit)
+        collect(k for k in prefix_keys if self._names[k] == query)
+        collect(prefix_keys)
+        if len(ranked) < limit:
+            # Ask for extra keys: some may already be ranked above.
+            collect(self.word_prefix(query, limit + len(ranked)))
+        if len(ranked) < limit and len(query) >= 3:
+            collect(self.substring(query, limit + len(ranked)))
+        if fuzzy and len(ranked) < limit and len(query) >= FUZZY_MIN_LENGTH:
+            collect(self.fuzzy(query, limit=limit + len(ranked)))
+        return [self.by_key[key] for key in ranked]
@@ -198,6 +198,13 @@ def search_contacts(contacts, query):
         Users rarely remember full names exactly. Typing "ali" should
         find "Alice Smith". This is the same behavior as Ctrl+F in a
         browser — users expect it to work this way.
+
+    Scaling up:
+        This scan checks every contact on every search, which is fine
+        for a personal contact book. contact_index.py shows how a shared
+        book with hundreds of thousands of entries stays instant: indexes
+        built once at load time, plus prefix, typo-tolerant and ranked
+        search. Read it AFTER your own version works.
     """
     # TODO: Implement this function
     # Hints:
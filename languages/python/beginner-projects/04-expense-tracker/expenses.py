@@ -242,6 +242,11 @@ def delete_expense(expenses):
 # ============================================================
 # These functions compute aggregate statistics from the raw data.
 # Each one has an algorithm comment explaining the approach.
+#
+# Each summary is one pass over the list — fine for a personal
+# tracker. For ledgers with millions of rows, ledger.py stores the
+# same data column by column and computes these summaries as
+# vectorised operations. Read it AFTER your own version works.
 # ============================================================
 
 
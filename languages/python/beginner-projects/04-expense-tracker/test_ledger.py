@@ -0,0 +1,58 @@
+import random
+from datetime import date, timedelta
+
+import pytest
+
+import ledger
+
+pytest.importorskip("numpy")  # the vectorised side of the comparison
+
+FILTERS = [
+    {},
+    {"category": "rent"},
+    {"category": "unknown"},
+    {"start": "2023-03-01", "end": "2023-09-30"},
+    {"min_amount": 0, "max_amount": 0},
+    {"min_amount": 20, "max_amount": 80},
+    {"start": "2030-01-01"},
+]
+
+
+@pytest.fixture
+def book(tmp_path):
+    rng = random.Random(5)
+    book = ledger.ExpenseLedger(str(tmp_path))
+    start = date(2022, 1, 1)
+    for _ in range(2_000):
+        book.add(
+            rng.choice([0, 5, 12.5, 40, 99.99, 250]),
+            rng.choice(["food", "rent", "travel", "gifts", "free"]),
+            "expense",
+            start + timedelta(days=rng.randrange(900)),
+        )
+    book.add(0, "refunds", "nothing owed", "2023-05-05")
+    for expense_id in rng.sample(range(1, 2_000), 300):
+        book.delete(expense_id)
+    return book
+
+
+@pytest.mark.parametrize("filters", FILTERS)
+def test_numpy_and_plain_python_agree(book, filters, monkeypatch):
+    queries = {
+        "total": lambda: book.total(**filters),
+        "by_category": lambda: list(book.by_category(**filters).items()),
+        "by_month": lambda: list(book.by_month(**filters).items()),
+        "rollup": lambda: list(book.rollup(**filters).items()),
+        "top": lambda: book.top(25, **filters),
+        "select": lambda: book.select(**filters),
+    }
+    vectorised = {name: query() for name, query in queries.items()}
+    monkeypatch.setattr(ledger, "np", None)
+    assert {name: query() for name, query in queries.items()} == vectorised
+
+
+def test_by_category_keeps_zero_totals(book, monkeypatch):
+    expected = {"refunds": 0.0}
+    assert book.by_category(category="refunds") == expected
+    monkeypatch.setattr(ledger, "np", None)
+    assert book.by_category(category="refunds") == expected
@@ -101,6 +101,12 @@ def load_grades(filepath):
         DictReader gives us named columns (row["student_name"])
         instead of index-based access (row[0]). More readable and
         less error-prone if column order changes.
+
+    Scaling up:
+        Keeping every row in memory is fine for a class. For exports
+        with millions of rows, grade_stream.py computes the same report
+        in one pass with running totals. Read it AFTER your own
+        version works.
     """
     # TODO: Implement this function
     # Hints:
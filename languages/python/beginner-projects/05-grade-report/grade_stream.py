@@ -0,0 +1,434 @@
+"""
+grade_stream.py — Streaming grade report for very large CSV exports
+=====================================================================
+
+The starter pipeline loads every row into memory first:
+
+    load_grades() → {"Alice": [row, row, ...], "Bob": [...], ...}
+
+then computes results and class statistics from those lists. That is
+the clearest design for one class. A district-wide export with tens of
+millions of rows would not fit in memory, so this module makes ONE
+pass over the file and never keeps a row after reading it:
+
+    1. Fold each row into its student's running totals:
+           {"Alice": [earned, possible], ...}       O(students) memory
+       With --grouped (all of a student's rows are next to each other,
+       as in most exports) even that dict disappears: a student is
+       finished as soon as the next student's rows start.
+    2. Feed each finished student's percentage into three online
+       summaries, each a fixed size no matter how many students:
+           RunningStats  mean and standard deviation (Welford's method)
+           TDigest       median and other percentiles (approximate)
+           Leaderboard   top N and bottom N students (bounded heaps)
+
+Usage:
+    python grade_stream.py district.csv
+    python grade_stream.py district.csv --grouped --top 25
+    python grade_stream.py district.csv --details results.csv
+
+    --details writes one line per student (name, earned, possible,
+    percentage, grade) to a CSV as it goes, instead of keeping them.
+"""
+
+import argparse
+import csv
+import heapq
+import math
+import sys
+
+REQUIRED_COLUMNS = ("student_name", "score", "max_score")
+
+# (lowest percentage, letter), checked from the top down.
+GRADE_SCALE = ((90, "A"), (80, "B"), (70, "C"), (60, "D"), (0, "F"))
+
+# Percentiles shown in the class summary.
+PERCENTILES = (
+    ("10th", 0.1),
+    ("25th", 0.25),
+    ("median", 0.5),
+    ("75th", 0.75),
+    ("90th", 0.9),
+)
+
+
+def letter_grade(percentage):
+    """Letter for a percentage on the same A–F scale as grade_report.py."""
+    for cutoff, letter in GRADE_SCALE:
+        if percentage >= cutoff:
+            return letter
+    return "F"
+
+
+# ============================================================
+# ONLINE STATISTICS
+# ============================================================
+# "Online" means each value is seen once and then thrown away.
+# statistics.mean() and statistics.stdev() need the whole list;
+# these classes keep a few numbers instead.
+# ============================================================
+
+
+class RunningStats:
+    """
+    Count, mean, standard deviation, minimum and maximum in O(1) memory.
+
+    Welford's method: instead of summing x and x² (which loses
+    precision badly when the values are large and close together),
+    it updates the mean and the sum of squared differences from the
+    mean one value at a time.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._squares = 0.0  # sum of squared differences from the mean
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        # Uses the difference from both the old and the new mean.
+        self._squares += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def stdev(self):
+        """Sample standard deviation, like statistics.stdev() (0.0 below 2 values)."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self._squares / (self.count - 1))
+
+
+class TDigest:
+    """
+    Approximate percentiles in a fixed amount of memory.
+
+    A t-digest summarises the values as a sorted list of "centroids" —
+    (mean, weight) pairs, each standing for ``weight`` nearby values.
+    Centroids near the middle may grow large, but near 0% and 100%
+    they stay tiny, so the tails (the 1st or 99th percentile) stay
+    accurate while the whole digest holds at most a few hundred
+    centroids.
+
+    New values collect in a buffer. When it fills up, the buffer and
+    the existing centroids are sorted together and merged from left
+    to right. Neighbours are combined as long as the result stays
+    under the size limit for its position in the distribution.
+
+    Parameters:
+        compression (int): More centroids = more accurate and more
+            memory. 100 typically gives percentiles within a fraction
+            of a percent.
+    """
+
+    def __init__(self, compression=100):
+        self.compression = compression
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._centroids = []  # (mean, weight), sorted by mean
+        self._buffer = []
+
+    def add(self, value):
+        self._buffer.append(value)
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if len(self._buffer) >= 5 * self.compression:
+            self._merge()
+
+    def _scale(self, q):
+        """The k1 scale function: steep near 0 and 1, flat in the middle."""
+        return self.compression / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _inverse_scale(self, k):
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+    def _merge(self):
+        if not self._buffer:
+            return
+        points = sorted(self._centroids + [(value, 1) for value in self._buffer])
+        self._buffer = []
+        total = self.count
+
+        merged = []
+        mean, weight = points[0]
+        before = 0  # weight of all centroids already finished
+        # A centroid may grow until it spans one unit of the scale function.
+        limit = total * self._inverse_scale(self._scale(0) + 1)
+        for next_mean, next_weight in points[1:]:
+            if before + weight + next_weight <= limit:
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+            else:
+                merged.append((mean, weight))
+                before += weight
+                limit = total * self._inverse_scale(self._scale(before / total) + 1)
+                mean, weight = next_mean, next_weight
+        merged.append((mean, weight))
+        self._centroids = merged
+
+    def quantile(self, q):
+        """
+        Estimate the value below which a fraction ``q`` of values fall.
+
+        quantile(0.5) is the median. Each centroid is treated as sitting
+        at the middle of the weight it covers, and the answer is
+        interpolated between the two nearest centroids (or between the
+        outermost centroid and the true minimum/maximum).
+        """
+        self._merge()
+        if not self._centroids:
+            return None
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        target = q * self.count
+        previous_mean, previous_center = self.min, 0.0
+        cumulative = 0.0
+        for mean, weight in self._centroids:
+            center = cumulative + weight / 2
+            if target < center:
+                span = center - previous_center
+                fraction = (target - previous_center) / span if span else 0.0
+                return previous_mean + fraction * (mean - previous_mean)
+            previous_mean, previous_center = mean, center
+            cumulative += weight
+        span = self.count - previous_center
+        fraction = (target - previous_center) / span if span else 0.0
+        return previous_mean + fraction * (self.max - previous_mean)
+
+    def __len__(self):
+        """Number of centroids currently kept (not the number of values)."""
+        self._merge()
+        return len(self._centroids)
+
+
+class Leaderboard:
+    """
+    The ``size`` highest and lowest scorers, without sorting everyone.
+
+    Two heaps of at most ``size`` entries each. The top heap is a
+    min-heap, so its root is the WEAKEST of the current top students:
+    a new student only gets in by beating that root, which heappushpop
+    replaces in O(log size). The bottom heap does the same with
+    negated percentages.
+
+    Ties go to whoever appeared first in the file, so the ranking is
+    the same as a stable sort of the full list would give.
+    """
+
+    def __init__(self, size=10):
+        self.size = size
+        self._top = []  # (percentage, -order, name)
+        self._bottom = []  # (-percentage, -order, name)
+        self._order = 0
+
+    def add(self, name, percentage):
+        if self.size <= 0:
+            return
+        self._order += 1
+        for heap, entry in (
+            (self._top, (percentage, -self._order, name)),
+            (self._bottom, (-percentage, -self._order, name)),
+        ):
+            if len(heap) < self.size:
+                heapq.heappush(heap, entry)
+            else:
+                heapq.heappushpop(heap, entry)
+
+    def top(self):
+        """[(name, percentage)] best first."""
+        return [(name, pct) for pct, _, name in sorted(self._top, reverse=True)]
+
+    def bottom(self):
+        """[(name, percentage)] lowest first."""
+        return [(name, -neg) for neg, _, name in sorted(self._bottom, reverse=True)]
+
+
+# ============================================================
+# THE SINGLE PASS
+# ============================================================
+
+
+def read_rows(file):
+    """
+    Yield (student_name, score, max_score) for every row of a grades CSV.
+
+    Uses csv.reader with column positions looked up once from the
+    header — about twice as fast as building a dict per row with
+    csv.DictReader, which adds up over tens of millions of rows.
+
+    Raises:
+        ValueError: If a required column is missing.
+    """
+    reader = csv.reader(file)
+    header = next(reader, [])
+    missing = [column for column in REQUIRED_COLUMNS if column not in header]
+    if missing:
+        raise ValueError(f"CSV is missing required columns: {', '.join(missing)}")
+    name_at, score_at, max_at = (header.index(column) for column in REQUIRED_COLUMNS)
+    for row in reader:
+        if row:
+            yield row[name_at], float(row[score_at]), float(row[max_at])
+
+
+def student_totals(rows, grouped=False):
+    """
+    Fold rows into (name, earned, possible) — one tuple per student.
+
+    Parameters:
+        rows: (name, score, max_score) tuples, e.g. from read_rows().
+        grouped (bool): True if each student's rows are contiguous.
+            Then a student is yielded as soon as their run ends and
+            nothing else is kept. (If a name shows up again later it
+            is reported as a second student, so only use this for
+            files that really are grouped.)
+
+    Memory: O(students), or O(1) with grouped=True.
+    """
+    if grouped:
+        current, earned, possible = None, 0.0, 0.0
+        for name, score, max_score in rows:
+            if name != current:
+                if current is not None:
+                    yield current, earned, possible
+                current, earned, possible = name, 0.0, 0.0
+            earned += score
+            possible += max_score
+        if current is not None:
+            yield current, earned, possible
+        return
+
+    totals = {}
+    for name, score, max_score in rows:
+        total = totals.get(name)
+        if total is None:
+            totals[name] = [score, max_score]
+        else:
+            total[0] += score
+            total[1] += max_score
+    for name, (earned, possible) in totals.items():
+        yield name, earned, possible
+
+
+def summarize(totals, top=10, details=None):
+    """
+    Run every student through the online statistics.
+
+    Parameters:
+        totals: (name, earned, possible) tuples from student_totals().
+        top (int): How many students the leaderboard keeps at each end.
+        details (csv.writer | None): If given, one row per student is
+            written here as it is processed.
+
+    Returns:
+        dict: "stats" (RunningStats), "digest" (TDigest),
+        "leaderboard" (Leaderboard) and "distribution" ({"A": count, ...}).
+    """
+    stats, digest, leaderboard = RunningStats(), TDigest(), Leaderboard(top)
+    distribution = dict.fromkeys((letter for _, letter in GRADE_SCALE), 0)
+    for name, earned, possible in totals:
+        if not possible:
+            continue  # no graded work yet — there is no percentage to report
+        percentage = round(earned / possible * 100, 1)
+        grade = letter_grade(percentage)
+        stats.add(percentage)
+        digest.add(percentage)
+        leaderboard.add(name, percentage)
+        distribution[grade] += 1
+        if details is not None:
+            details.writerow([name, earned, possible, percentage, grade])
+    return {
+        "stats": stats,
+        "digest": digest,
+        "leaderboard": leaderboard,
+        "distribution": distribution,
+    }
+
+
+def format_summary(summary):
+    """Turn the result of summarize() into the report text."""
+    stats, digest = summary["stats"], summary["digest"]
+    if not stats.count:
+        return "No students with graded work found."
+
+    leaderboard = summary["leaderboard"]
+    lines = [
+        f"Students:           {stats.count:,}",
+        f"Average:            {stats.mean:.1f}%",
+        f"Standard deviation: {stats.stdev:.1f}",
+        f"Highest / lowest:   {stats.max:.1f}% / {stats.min:.1f}%",
+        "Percentiles (approximate):",
+    ]
+    for label, q in PERCENTILES:
+        lines.append(f"  {label:<7} {digest.quantile(q):5.1f}%")
+
+    lines.append("Grade distribution:")
+    widest = max(summary["distribution"].values()) or 1
+    for letter, count in summary["distribution"].items():
+        bar = "█" * round(count / widest * 20)
+        lines.append(f"  {letter}  {bar:<20} {count:,}")
+
+    for title, ranking in (
+        (f"Top {len(leaderboard.top())}:", leaderboard.top()),
+        (f"Bottom {len(leaderboard.bottom())}:", leaderboard.bottom()),
+    ):
+        lines.append(title)
+        for rank, (name, percentage) in enumerate(ranking, 1):
+            lines.append(f"  {rank:>3}. {name:<25} {percentage:5.1f}%")
+    return "\n".join(lines)
+
+
+def stream_report(filepath, top=10, grouped=False, details_path=None):
+    """
+    Read ``filepath`` once and return the summary report text.
+
+    The only things that grow with the input are the per-student
+    totals (skipped with ``grouped=True``) and the optional details
+    file, which is written to disk rather than kept in memory.
+    """
+    with open(filepath, newline="", encoding="utf-8") as file:
+        totals = student_totals(read_rows(file), grouped)
+        if details_path is None:
+            summary = summarize(totals, top)
+        else:
+            with open(details_path, "w", newline="", encoding="utf-8") as out:
+                details = csv.writer(out)
+                details.writerow(
+                    ["student_name", "earned", "possible", "percentage", "grade"]
+                )
+                summary = summarize(totals, top, details)
+    return format_summary(summary)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming grade report")
+    parser.add_argument("csv", nargs="?", default="grades.csv")
+    parser.add_argument("--top", type=int, default=10, help="students per ranking")
+    parser.add_argument(
+        "--grouped",
+        action="store_true",
+        help="rows are grouped by student: constant memory",
+    )
+    parser.add_argument("--details", help="write one CSV row per student here")
+    args = parser.parse_args()
+
+    try:
+        print(stream_report(args.csv, args.top, args.grouped, args.details))
+    except FileNotFoundError:
+        print(f"Error: File '{args.csv}' not found.")
+        sys.exit(1)
+    except ValueError as error:
+        print(f"Error: {error}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
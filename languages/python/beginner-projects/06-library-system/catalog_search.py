@@ -0,0 +1,207 @@
+"""
+catalog_search.py — Inverted index for searching books and members
+====================================================================
+
+search_books() checks every book's title, author and genre for the
+query. This module does what a search engine does instead: it keeps an
+INVERTED INDEX — for every word, the records that contain it — so a
+search only looks at records that can actually match.
+
+    "dune"     → {B001: title}
+    "herbert"  → {B001: author, B417: author}
+    "sf"       → {B001: genre, B002: genre, ...}
+
+How a search works:
+    1. Split the query into words ("terms"), case-folded the same way
+       the records were: "Dune herb" → ["dune", "herb"].
+    2. Every term may be a PREFIX: "herb" matches "herbert". The sorted
+       vocabulary finds all words starting with a term by binary search.
+    3. Multi-term queries are AND queries: a record must match every
+       term. The term with the fewest matching records is looked up
+       first; the other terms are only checked against those records.
+    4. Results are RANKED: a match in the title counts more than one in
+       the author, which counts more than one in the genre, and a whole
+       word counts double compared with a prefix.
+
+LibraryStore (library_store.py) keeps one index for books and one for
+members, updated on every insert, update and delete.
+
+Usage:
+    index = InvertedIndex({"title": 3, "author": 2, "genre": 1})
+    index.add({"id": "B001", "title": "Dune", "author": "Frank Herbert", ...})
+    index.search("dune herb")          # ["B001"]
+"""
+
+import heapq
+import re
+from bisect import bisect_left, insort
+
+BOOK_FIELDS = {"title": 3, "author": 2, "genre": 1}
+MEMBER_FIELDS = {"name": 2, "email": 1}
+
+# A "word" is a run of letters and digits: "alice@example.com" is the
+# three words "alice", "example" and "com".
+WORD = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Case-folded words of ``text``, in order."""
+    return WORD.findall(text.casefold())
+
+
+class InvertedIndex:
+    """
+    Word → records index over some text fields of dict records.
+
+    Parameters:
+        fields (dict[str, int]): Field name → ranking weight.
+
+    Each posting stores WHICH fields a word appeared in as a bitmask
+    (title = 1, author = 2, genre = 4, ...), so ranking never has to
+    reopen the record itself.
+    """
+
+    def __init__(self, fields):
+        self.fields = fields
+        self._bits = {name: 1 << n for n, name in enumerate(fields)}
+        # Weight of every possible bitmask = its best field's weight.
+        self._mask_weight = [
+            max([w for name, w in fields.items() if mask & self._bits[name]], default=0)
+            for mask in range(1 << len(fields))
+        ]
+        self._postings = {}  # word → {record_id: field bitmask}
+        self._words_of = {}  # record_id → {word: field bitmask}
+        self._vocabulary = []  # every indexed word, sorted
+
+    def __len__(self):
+        return len(self._words_of)
+
+    # ============================================================
+    # KEEPING THE INDEX UP TO DATE
+    # ============================================================
+
+    def add(self, record):
+        """Index a record (re-indexes it if its id is already present)."""
+        record_id = record["id"]
+        if record_id in self._words_of:
+            self.remove(record_id)
+        words = {}
+        for field, bit in self._bits.items():
+            for word in tokenize(str(record.get(field) or "")):
+                words[word] = words.get(word, 0) | bit
+        self._words_of[record_id] = words
+        for word, mask in words.items():
+            postings = self._postings.get(word)
+            if postings is None:
+                postings = self._postings[word] = {}
+                insort(self._vocabulary, word)
+            postings[record_id] = mask
+
+    def remove(self, record_id):
+        """Drop a record from the index (no-op if it isn't there)."""
+        for word in self._words_of.pop(record_id, ()):
+            postings = self._postings[word]
+            del postings[record_id]
+            if not postings:
+                del self._postings[word]
+                del self._vocabulary[bisect_left(self._vocabulary, word)]
+
+    # ============================================================
+    # SEARCHING
+    # ============================================================
+
+    def _expand(self, term):
+        """Indexed words starting with ``term``, as a slice of the vocabulary."""
+        start = bisect_left(self._vocabulary, term)
+        # Every word starting with the term sorts before term + a
+        # character larger than any real one.
+        end = bisect_left(self._vocabulary, term + "\U0010ffff", start)
+        return self._vocabulary[start:end]
+
+    def _count(self, term, stop=None):
+        """
+        Number of postings for ``term`` (records may count more than once
+        if they match several words); gives up once it reaches ``stop``.
+        """
+        size = 0
+        for word in self._expand(term):
+            size += len(self._postings[word])
+            if stop is not None and size >= stop:
+                break
+        return size
+
+    def _term_scores(self, term):
+        """
+        Score of one term for every record it matches: the weight of the
+        best field the term appears in, doubled for a whole-word match.
+        """
+        scores = {}
+        for word in self._expand(term):
+            factor = 2 if word == term else 1
+            for record_id, mask in self._postings[word].items():
+                score = factor * self._mask_weight[mask]
+                if score > scores.get(record_id, 0):
+                    scores[record_id] = score
+        return scores
+
+    def _record_score(self, record_id, term):
+        """Like _term_scores, for one record, via its forward index."""
+        best = 0
+        for word, mask in self._words_of[record_id].items():
+            if word.startswith(term):
+                score = (2 if word == term else 1) * self._mask_weight[mask]
+                best = max(best, score)
+        return best
+
+    def search(self, query, limit=20):
+        """
+        Record ids matching EVERY term of ``query`` (as words or word
+        prefixes), best match first; ties in ID order.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        # Start from the term with the fewest candidate records. Counting
+        # stops as soon as a term is worse than the best one so far, so a
+        # very common prefix like "a" costs little unless it is alone.
+        best_term, best_size = None, None
+        for term in terms:
+            size = self._count(term, best_size)
+            if best_size is None or size < best_size:
+                best_term, best_size = term, size
+            if best_size == 0:
+                return []
+
+        scores = self._term_scores(best_term)
+        for term in terms:
+            if term == best_term or not scores:
+                continue
+            # Each remaining term is checked only against the records still
+            # in the running: by looking them up in the term's own postings
+            # when those are small enough, otherwise through the forward
+            # index (a handful of words per record).
+            if self._count(term, 4 * len(scores)) < 4 * len(scores):
+                term_scores = self._term_scores(term)
+            else:
+                term_scores = None
+            for record_id in list(scores):
+                if term_scores is not None:
+                    term_score = term_scores.get(record_id)
+                else:
+                    term_score = self._record_score(record_id, term)
+                if term_score:
+                    scores[record_id] += term_score
+                else:
+                    del scores[record_id]
+
+        scored = [
+            (-score, _id_order(record_id), record_id)
+            for record_id, score in scores.items()
+        ]
+        return [record_id for _, _, record_id in heapq.nsmallest(limit, scored)]
+
+
+def _id_order(record_id):
+    """Sort key for "B012"-style IDs: by prefix, then by number."""
+    return (record_id[:1], int(record_id[1:]) if record_id[1:].isdigit() else 0)
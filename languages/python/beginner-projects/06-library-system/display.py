@@ -79,7 +79,10 @@ def format_books_table(books, loans):
     #   - If no books, return "No books in the library."
     #   - Define column widths (e.g., ID: 6, Title: 30, Author: 20, Genre: 10, Avail: 15)
     #   - Build header row, separator, data rows, footer
-    #   - For availability: count loans where book_id matches AND return_date is None
+    #   - For availability: count active loans (return_date is None) per
+    #     book ONCE, before the loop, into a dict {book_id: count}.
+    #     Counting inside the loop rescans every loan for every book —
+    #     O(books × loans), which gets slow fast as the library grows.
     #   - Use f-string alignment: f"{value:<width}" for left-align
     #   - You can use simple borders (|, -, +) or box-drawing characters
     #
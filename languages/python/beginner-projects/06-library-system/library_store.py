@@ -0,0 +1,672 @@
+"""
+library_store.py — Indexed, transactional storage for a large library
+=======================================================================
+
+storage.py loads and saves whole JSON files, and operations.py answers
+questions by scanning lists:
+
+    get_available_copies(book_id)   → scan every loan
+    get_member_active_loans(m_id)   → scan every loan
+    get_overdue_loans()             → scan every loan
+    format_books_table(books, ...)  → availability per book → books × loans
+
+That is the right design while you learn. At consortium scale — 100k
+books, a million loans — listing the catalog would mean 100 billion
+comparisons. This module keeps the same three tables in memory with
+the INDEXES a database would build, and makes every change durable
+with a small append-only journal instead of rewriting whole files.
+
+Indexes (all updated automatically on every insert/update/delete):
+    books / members / loans     id → row dicts        (primary key)
+    loans for each book          book_id → loan ids    (history)
+    loans for each member        member_id → loan ids  (history)
+    active loans per book        book_id → count       (availability)
+    active loans per member      member_id → loan ids  (3-book limit)
+    active loans by due date     sorted (due_date, loan_id) list (overdue)
+    book / member search         word → ids            (catalog_search.py)
+
+Transactions:
+    with store.transaction():
+        store.insert("loans", loan)
+        store.update("books", book_id, {"total_copies": 2})
+
+    Every change inside the block is applied to memory right away (so
+    later checks see it), and remembered. When the block ends, ALL of
+    them are written as ONE journal line with a single fsync. If
+    anything raises inside the block, every change is undone and
+    nothing is written. Either all of a checkout happens, or none of it.
+
+    One transaction runs at a time: another thread that starts one
+    waits until the first has finished (it never joins it). Only one
+    process can have the store open — it holds data/library.lock until
+    close() — because each process keeps its own copy of the tables,
+    and a second writer's checkpoint would wipe out the first one's
+    journal.
+
+On disk (in data/):
+    library.snapshot.json   every row, written now and then
+    library.journal         one JSON line per committed transaction
+    Loading = read the snapshot, then replay the journal. Once the
+    journal gets long, checkpoint() writes a fresh snapshot and empties
+    the journal. The first time, existing books.json / members.json /
+    loans.json files are imported.
+
+Usage:
+    from library_store import LibraryStore, checkout_book, get_overdue_loans
+
+    with LibraryStore() as store:
+        result = checkout_book(store, "B001", "M001")
+        for loan in get_overdue_loans(store):
+            ...
+"""
+
+import json
+import os
+import sys
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date, timedelta
+
+from catalog_search import BOOK_FIELDS, MEMBER_FIELDS, InvertedIndex
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+TABLES = ("books", "members", "loans")
+ID_PREFIXES = {"books": "B", "members": "M", "loans": "L"}
+
+# Same business rules as operations.py.
+MAX_ACTIVE_LOANS = 3
+LOAN_DAYS = 14
+
+# Write a fresh snapshot once the journal holds this many changes.
+CHECKPOINT_CHANGES = 50_000
+
+
+def _today():
+    return date.today().isoformat()
+
+
+class LibraryStore:
+    """
+    The library's three tables plus their indexes.
+
+    Read rows through the table dicts (store.books["B001"]) and the
+    query methods below. Change them ONLY through insert / update /
+    delete, so the indexes and the journal always match the data.
+    """
+
+    def __init__(self, data_dir=DATA_DIR, checkpoint_changes=CHECKPOINT_CHANGES):
+        self.data_dir = data_dir
+        self.checkpoint_changes = checkpoint_changes
+        self.snapshot_path = os.path.join(data_dir, "library.snapshot.json")
+        self.journal_path = os.path.join(data_dir, "library.journal")
+        self.lock_path = os.path.join(data_dir, "library.lock")
+
+        self.books, self.members, self.loans = {}, {}, {}
+        self._loans_by_book = defaultdict(set)
+        self._loans_by_member = defaultdict(set)
+        self._active_count = defaultdict(int)  # book_id → active loans
+        self._active_by_member = defaultdict(set)  # member_id → active loan ids
+        self._active_by_due = []  # sorted (due_date, loan_id) of active loans
+        self._loading_due = None  # unsorted set of those pairs during a bulk load
+        self._next_number = dict.fromkeys(TABLES, 1)
+        self.book_search = InvertedIndex(BOOK_FIELDS)
+        self.member_search = InvertedIndex(MEMBER_FIELDS)
+
+        self._lock = threading.RLock()  # held by the thread in a transaction
+        self._pending = None  # changes of the open transaction, or None
+        self._undo = None
+        self._journal_changes = 0
+        self._lock_file = self._lock_data_dir()
+        try:
+            self._load()
+        except BaseException:
+            self.close()
+            raise
+
+    def _lock_data_dir(self):
+        """Take the data directory's lock file, or fail if another process has it."""
+        os.makedirs(self.data_dir, exist_ok=True)
+        lock_file = open(self.lock_path, "a+b")
+        try:
+            if sys.platform == "win32":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise RuntimeError(
+                f"{self.data_dir} is already open in another process"
+            ) from None
+        return lock_file
+
+    def close(self):
+        """Release the data directory so another process can open it."""
+        if self._lock_file is not None:
+            # Closing the file releases the lock on every platform.
+            self._lock_file.close()
+            self._lock_file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ============================================================
+    # INDEX MAINTENANCE
+    # ============================================================
+    # _index_row and _unindex_row are the ONLY places that touch the
+    # indexes. Every write goes: unindex the old row → store → index
+    # the new row. Keeping it in two functions means a new index only
+    # has to be added in two places.
+    # ============================================================
+
+    def _table(self, name):
+        if name not in TABLES:
+            raise ValueError(f"unknown table {name!r}")
+        return getattr(self, name)
+
+    @staticmethod
+    def _check_row(table, row):
+        """
+        Raise ValueError if _index_row couldn't index ``row``.
+
+        Called before anything is changed, so a bad row can't leave
+        the table updated but the indexes not.
+        """
+        row_id = row.get("id")
+        if not (
+            isinstance(row_id, str)
+            and row_id[:1] == ID_PREFIXES[table]
+            and row_id[1:].isdigit()
+        ):
+            raise ValueError(f"bad {table} id {row_id!r}")
+        if table != "loans":
+            return
+        missing = [field for field in ("book_id", "member_id") if field not in row]
+        if row.get("return_date") is None and not isinstance(row.get("due_date"), str):
+            missing.append("due_date")
+        if missing:
+            raise ValueError(f"loan {row_id} needs {', '.join(missing)}")
+
+    def _index_row(self, table, row):
+        number = int(row["id"][1:])
+        self._next_number[table] = max(self._next_number[table], number + 1)
+        if table == "books":
+            self.book_search.add(row)
+        elif table == "members":
+            self.member_search.add(row)
+        if table != "loans":
+            return
+        loan_id = row["id"]
+        self._loans_by_book[row["book_id"]].add(loan_id)
+        self._loans_by_member[row["member_id"]].add(loan_id)
+        if row.get("return_date") is None:
+            self._active_count[row["book_id"]] += 1
+            self._active_by_member[row["member_id"]].add(loan_id)
+            if self._loading_due is not None:
+                self._loading_due.add((row["due_date"], loan_id))
+            else:
+                insort(self._active_by_due, (row["due_date"], loan_id))
+
+    def _unindex_row(self, table, row):
+        if table == "books":
+            self.book_search.remove(row["id"])
+        elif table == "members":
+            self.member_search.remove(row["id"])
+        if table != "loans":
+            return
+        loan_id = row["id"]
+        self._discard(self._loans_by_book, row["book_id"], loan_id)
+        self._discard(self._loans_by_member, row["member_id"], loan_id)
+        if row.get("return_date") is None:
+            self._active_count[row["book_id"]] -= 1
+            if not self._active_count[row["book_id"]]:
+                del self._active_count[row["book_id"]]
+            self._discard(self._active_by_member, row["member_id"], loan_id)
+            if self._loading_due is not None:
+                self._loading_due.discard((row["due_date"], loan_id))
+                return
+            # (due_date, loan_id) is unique, so bisect finds exactly this entry.
+            del self._active_by_due[
+                bisect_left(self._active_by_due, (row["due_date"], loan_id))
+            ]
+
+    @staticmethod
+    def _discard(index, key, value):
+        """Remove ``value`` from ``index[key]``, dropping the key once it is empty."""
+        values = index[key]
+        values.discard(value)
+        if not values:
+            del index[key]
+
+    def _apply(self, change):
+        """
+        Apply one change to the tables and indexes; return the row it replaced.
+
+        A change is ["put", table, row] or ["delete", table, row_id].
+        Both are idempotent — applying one twice gives the same result —
+        which makes replaying the journal safe even if part of it is
+        already in the snapshot.
+        """
+        action, table, value = change
+        rows = self._table(table)
+        if action == "put":
+            self._check_row(table, value)
+        row_id = value["id"] if action == "put" else value
+        old = rows.get(row_id)
+        if old is not None:
+            self._unindex_row(table, old)
+        if action == "put":
+            rows[row_id] = value  # an existing row keeps its place in the table
+            self._index_row(table, value)
+        elif old is not None:
+            del rows[row_id]
+        return old
+
+    # ============================================================
+    # WRITES AND TRANSACTIONS
+    # ============================================================
+
+    @contextmanager
+    def transaction(self):
+        """
+        Group changes into one atomic, durable journal write.
+
+        Nested transactions join the outermost one, so a function that
+        opens its own transaction can still be batched with others:
+
+            with store.transaction():
+                for title in titles:
+                    add_book(store, title, ...)   # one journal write in total
+
+        Only the thread that opened a transaction can join it; other
+        threads wait for it to finish first.
+        """
+        with self._lock:
+            if self._pending is not None:
+                yield  # already inside a transaction (of this thread)
+                return
+            self._pending, self._undo = [], []
+            try:
+                yield
+                if self._pending:
+                    self._append_journal(self._pending)
+            except BaseException:
+                # Roll back in reverse order: each undo restores the row that
+                # the matching change replaced (or removes what it added).
+                for table, row_id, old in reversed(self._undo):
+                    if old is None:
+                        self._apply(["delete", table, row_id])
+                    else:
+                        self._apply(["put", table, old])
+                raise
+            finally:
+                changes = len(self._pending)
+                self._pending = self._undo = None
+            self._journal_changes += changes
+            if self._journal_changes >= self.checkpoint_changes:
+                self.checkpoint()
+
+    def _write(self, change):
+        with self.transaction():
+            row_id = change[2]["id"] if change[0] == "put" else change[2]
+            old = self._apply(change)
+            self._pending.append(change)
+            self._undo.append((change[1], row_id, old))
+
+    def insert(self, table, row):
+        """Add a new row. Its "id" must not be in use yet."""
+        if row["id"] in self._table(table):
+            raise KeyError(f"{row['id']} already exists")
+        self._write(["put", table, dict(row)])
+
+    def update(self, table, row_id, changes):
+        """Change some fields of an existing row; return the updated row."""
+        row = {**self._table(table)[row_id], **changes, "id": row_id}
+        self._write(["put", table, row])
+        return row
+
+    def delete(self, table, row_id):
+        """Remove a row; return it."""
+        row = self._table(table)[row_id]
+        self._write(["delete", table, row_id])
+        return row
+
+    def next_id(self, table):
+        """
+        The next unused ID, like models._generate_id() but O(1).
+
+        The counter is raised whenever a row is indexed, so it is always
+        above every ID ever stored — IDs are never reused.
+        """
+        return f"{ID_PREFIXES[table]}{self._next_number[table]:03d}"
+
+    # ============================================================
+    # PERSISTENCE
+    # ============================================================
+
+    def _append_journal(self, changes):
+        os.makedirs(self.data_dir, exist_ok=True)
+        line = json.dumps(changes, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with open(self.journal_path, "a", encoding="utf-8") as journal:
+            journal.write(line)
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    @contextmanager
+    def _bulk_load(self):
+        """
+        Collect due dates unsorted while loading many rows, then sort once.
+
+        One insort per row is O(n) each, so O(n²) for a whole snapshot;
+        a single sort at the end is O(n log n).
+        """
+        self._loading_due = set(self._active_by_due)
+        try:
+            yield
+        finally:
+            self._active_by_due = sorted(self._loading_due)
+            self._loading_due = None
+
+    def _load(self):
+        """Snapshot + journal replay, or a one-time import of the old JSON files."""
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as file:
+                snapshot = json.load(file)
+        except FileNotFoundError:
+            snapshot = None
+
+        if snapshot is None and not os.path.exists(self.journal_path):
+            self._import_json_files()
+            return
+
+        with self._bulk_load():
+            for table in TABLES:
+                for row in (snapshot or {}).get(table, []):
+                    self._apply(["put", table, row])
+            try:
+                with open(self.journal_path, "r+b") as journal:
+                    committed = 0  # bytes of complete, readable lines
+                    for line in journal:
+                        try:
+                            if not line.endswith(b"\n"):
+                                raise ValueError("incomplete line")
+                            changes = json.loads(line)
+                        except ValueError:
+                            break  # torn last line from a crash: never committed
+                        for change in changes:
+                            self._apply(change)
+                        self._journal_changes += len(changes)
+                        committed += len(line)
+                    # Cut the torn line off, or the next append would be glued
+                    # onto it and be unreadable too.
+                    journal.truncate(committed)
+            except FileNotFoundError:
+                pass
+
+    def _import_json_files(self):
+        imported = False
+        for table in TABLES:
+            try:
+                with open(
+                    os.path.join(self.data_dir, f"{table}.json"), encoding="utf-8"
+                ) as file:
+                    rows = json.load(file)
+            except (FileNotFoundError, ValueError):
+                continue
+            with self._bulk_load():
+                for row in rows:
+                    self._apply(["put", table, row])
+            imported = True
+        if imported:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """
+        Write every row to a new snapshot and empty the journal.
+
+        Written to a temporary file and renamed into place, so a crash
+        leaves either the old snapshot or the new one. If the crash comes
+        after the rename but before the journal is emptied, the next load
+        replays changes the snapshot already has — harmless, because
+        every change is idempotent.
+        """
+        with self._lock:
+            os.makedirs(self.data_dir, exist_ok=True)
+            temporary = self.snapshot_path + ".tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                json.dump(
+                    {table: list(self._table(table).values()) for table in TABLES},
+                    file,
+                    ensure_ascii=False,
+                )
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, self.snapshot_path)
+            with open(self.journal_path, "w", encoding="utf-8"):
+                pass
+            self._journal_changes = 0
+
+    # ============================================================
+    # INDEXED QUERIES
+    # ============================================================
+
+    def copies_on_loan(self, book_id):
+        """Number of active loans of one book — O(1), no loan scan."""
+        return self._active_count.get(book_id, 0)
+
+    def available_copies(self, book_id):
+        """total_copies minus active loans (0 for an unknown book)."""
+        book = self.books.get(book_id)
+        if book is None:
+            return 0
+        return book["total_copies"] - self.copies_on_loan(book_id)
+
+    def active_loans_for_member(self, member_id):
+        """Active loans of one member, oldest due date first."""
+        loans = [
+            self.loans[loan_id] for loan_id in self._active_by_member.get(member_id, ())
+        ]
+        return sorted(loans, key=lambda loan: (loan["due_date"], loan["id"]))
+
+    def loans_for_member(self, member_id):
+        """Every loan of one member, returned or not, in ID order."""
+        return self._rows_by_id(self._loans_by_member.get(member_id, ()))
+
+    def loans_for_book(self, book_id):
+        """Every loan of one book, returned or not, in ID order."""
+        return self._rows_by_id(self._loans_by_book.get(book_id, ()))
+
+    def _rows_by_id(self, loan_ids):
+        return [self.loans[i] for i in sorted(loan_ids, key=lambda i: int(i[1:]))]
+
+    def active_loans(self):
+        """Every active loan, earliest due date first."""
+        return [self.loans[loan_id] for _, loan_id in self._active_by_due]
+
+    def loans_due_before(self, day):
+        """
+        Active loans due strictly before ``day`` ("YYYY-MM-DD").
+
+        The due-date index is sorted, so the overdue loans are exactly
+        the entries before bisect_left(day) — O(log n + overdue), no
+        matter how many loans are still on time.
+        """
+        end = bisect_left(self._active_by_due, (day,))
+        return [self.loans[loan_id] for _, loan_id in self._active_by_due[:end]]
+
+    def active_loan_count(self, member_id=None):
+        """Active loans in the whole library, or of one member."""
+        if member_id is None:
+            return len(self._active_by_due)
+        return len(self._active_by_member.get(member_id, ()))
+
+
+# ============================================================
+# OPERATIONS ON AN INDEXED STORE
+# ============================================================
+# The same operations and business rules as operations.py, using the
+# indexes instead of scans. Each returns the same shapes as its
+# operations.py counterpart and never prints.
+# ============================================================
+
+
+def add_book(store, title, author, isbn, genre, total_copies=1):
+    """Add a book; return the new record."""
+    book = {
+        "id": store.next_id("books"),
+        "title": title,
+        "author": author,
+        "isbn": isbn,
+        "genre": genre,
+        "total_copies": total_copies,
+    }
+    store.insert("books", book)
+    return book
+
+
+def register_member(store, name, email):
+    """Register a member; return the new record."""
+    member = {
+        "id": store.next_id("members"),
+        "name": name,
+        "email": email,
+        "join_date": _today(),
+    }
+    store.insert("members", member)
+    return member
+
+
+def search_books(store, query, limit=20):
+    """
+    Books matching every word of ``query`` in title, author or genre
+    (words may be typed partially), best match first.
+
+    Looks words up in the inverted index instead of checking every book.
+    """
+    return [store.books[book_id] for book_id in store.book_search.search(query, limit)]
+
+
+def search_members(store, query, limit=20):
+    """Members matching every word of ``query`` in name or email, best first."""
+    return [
+        store.members[member_id]
+        for member_id in store.member_search.search(query, limit)
+    ]
+
+
+def remove_book(store, book_id):
+    """Remove a book unless copies are on loan. O(1) instead of a loan scan."""
+    if book_id not in store.books:
+        return {"success": False, "message": f"No book with ID {book_id}."}
+    if store.copies_on_loan(book_id):
+        return {"success": False, "message": "Can't remove a book with copies on loan."}
+    book = store.delete("books", book_id)
+    return {"success": True, "message": f"Removed '{book['title']}'."}
+
+
+def checkout_book(store, book_id, member_id, today=None):
+    """
+    Check out a book, enforcing the same four rules as operations.py.
+
+    The checks and the insert run in one transaction, and transactions
+    run one at a time, so two front desks (threads sharing the store)
+    can't both take the last copy between the check and the write.
+    """
+    today = today or _today()
+    with store.transaction():
+        book = store.books.get(book_id)
+        if book is None:
+            return {"success": False, "message": f"No book with ID {book_id}."}
+        if member_id not in store.members:
+            return {"success": False, "message": f"No member with ID {member_id}."}
+        if store.available_copies(book_id) <= 0:
+            return {"success": False, "message": "No copies available."}
+        if store.active_loan_count(member_id) >= MAX_ACTIVE_LOANS:
+            return {
+                "success": False,
+                "message": f"Member has reached the {MAX_ACTIVE_LOANS}-book limit.",
+            }
+        due = date.fromisoformat(today) + timedelta(days=LOAN_DAYS)
+        loan = {
+            "id": store.next_id("loans"),
+            "book_id": book_id,
+            "member_id": member_id,
+            "checkout_date": today,
+            "due_date": due.isoformat(),
+            "return_date": None,
+        }
+        store.insert("loans", loan)
+    return {"success": True, "loan": loan, "message": f"Due back {loan['due_date']}."}
+
+
+def return_book(store, loan_id, today=None):
+    """Close a loan by setting its return_date."""
+    loan = store.loans.get(loan_id)
+    if loan is None:
+        return {"success": False, "message": f"No loan with ID {loan_id}."}
+    if loan["return_date"] is not None:
+        return {"success": False, "message": "This loan was already returned."}
+    store.update("loans", loan_id, {"return_date": today or _today()})
+    return {"success": True, "message": "Book returned."}
+
+
+def _enrich(store, loans):
+    """Add "book_title" and "member_name" — one dict lookup each."""
+    enriched = []
+    for loan in loans:
+        book = store.books.get(loan["book_id"])
+        member = store.members.get(loan["member_id"])
+        enriched.append(
+            {
+                **loan,
+                "book_title": book["title"] if book else "(removed)",
+                "member_name": member["name"] if member else "(removed)",
+            }
+        )
+    return enriched
+
+
+def list_current_loans(store):
+    """Active loans, enriched, earliest due date first."""
+    return _enrich(store, store.active_loans())
+
+
+def get_overdue_loans(store, today=None):
+    """Overdue loans, enriched, most overdue first. O(log n + overdue)."""
+    return _enrich(store, store.loans_due_before(today or _today()))
+
+
+def books_with_availability(store):
+    """
+    [(book, available_copies)] for every book — what format_books_table
+    needs, in O(books) instead of O(books × loans).
+    """
+    return [(book, store.available_copies(book["id"])) for book in store.books.values()]
+
+
+def get_library_summary(store, today=None):
+    """The same summary dict as operations.get_library_summary()."""
+    genres = defaultdict(int)
+    total_copies = 0
+    for book in store.books.values():
+        genres[book["genre"]] += 1
+        total_copies += book["total_copies"]
+    return {
+        "total_books": len(store.books),
+        "total_copies": total_copies,
+        "total_members": len(store.members),
+        "active_loans": store.active_loan_count(),
+        "overdue_loans": len(store.loans_due_before(today or _today())),
+        "genre_breakdown": dict(genres),
+    }
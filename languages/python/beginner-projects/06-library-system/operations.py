@@ -70,6 +70,10 @@ def search_books(query):
         For each book, check if query.lower() appears in any of
         title.lower(), author.lower(), or genre.lower().
         This is O(n) where n = number of books.
+
+        catalog_search.py shows how a search index avoids that scan: it
+        looks words up instead of checking every book. Read it AFTER your
+        own version works.
     """
     # TODO: Implement this
     # Hint: [b for b in load_books() if query.lower() in b["title"].lower()
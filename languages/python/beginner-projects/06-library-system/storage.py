@@ -13,6 +13,9 @@ Why JSON and not a database:
     open them in any text editor), require no extra dependencies, and
     teach the same persistence concepts. In a real library system,
     you'd use a relational database (PostgreSQL, SQLite) — see stretch goals.
+    library_store.py shows the in-between step: the same tables kept in
+    memory with indexes, and an append-only journal instead of whole-file
+    rewrites. Read it AFTER your own version works.
 
 File locations:
     All data files live in the data/ subdirectory, relative to this script.
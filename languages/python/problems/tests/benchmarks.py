@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import gc
+import json
+import math
+import platform
+import random
+import string
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from harness import (
+    SOLUTIONS_DIR,
+    build_cycle_linked_list,
+    build_linked_list,
+    build_tree,
+    solution_instance,
+)
+
+MODELS: dict[str, Callable[[int], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n^2)": lambda n: float(n) ** 2,
+    "O(n^3)": lambda n: float(n) ** 3,
+}
+
+# Log-log slope each model converges to; log factors are within timing noise.
+EXPONENTS = {
+    "O(1)": 0.0,
+    "O(log n)": 0.0,
+    "O(n)": 1.0,
+    "O(n log n)": 1.0,
+    "O(n^2)": 2.0,
+    "O(n^3)": 3.0,
+}
+
+DEFAULT_SIZES = (1_000, 2_000, 4_000, 8_000, 16_000, 32_000)
+
+
+def geometric_sizes(start: int, factor: int = 2, steps: int = 6) -> tuple[int, ...]:
+    return tuple(start * factor**step for step in range(steps))
+
+
+def _letters(rng: random.Random, n: int, alphabet: str) -> str:
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+def _rotated(rng: random.Random, n: int) -> list[int]:
+    pivot = rng.randrange(n)
+    return list(range(pivot, n)) + list(range(pivot))
+
+
+def _merge_args(rng: random.Random, n: int) -> tuple[Any, ...]:
+    m = n // 2
+    nums1 = sorted(rng.randrange(n) for _ in range(m)) + [0] * (n - m)
+    nums2 = sorted(rng.randrange(n) for _ in range(n - m))
+    return (nums1, m, nums2, n - m)
+
+
+def _anagram_args(rng: random.Random, n: int) -> tuple[Any, ...]:
+    s = _letters(rng, n, string.ascii_lowercase)
+    return (s, "".join(rng.sample(s, len(s))))
+
+
+def _palindrome_args(rng: random.Random, n: int) -> tuple[Any, ...]:
+    half = _letters(rng, n // 2, string.ascii_letters)
+    return (half + ", " + half[::-1],)
+
+
+def _islands_grid(rng: random.Random, n: int) -> list[list[str]]:
+    side = max(1, math.isqrt(n))
+    return [
+        ["1" if rng.random() < 0.4 else "0" for _ in range(side)] for _ in range(side)
+    ]
+
+
+@dataclass(frozen=True)
+class BenchmarkSpec:
+    problem_number: int
+    method_name: str
+    target: str
+    make_args: Callable[[random.Random, int], tuple[Any, ...]]
+    sizes: tuple[int, ...] = DEFAULT_SIZES
+
+
+# Inputs are built outside the timed region and aim at each solution's worst
+# case (answer at the end, no pair at all, no early exit) so the growth curve
+# is not flattered.
+SPECS: dict[int, BenchmarkSpec] = {
+    spec.problem_number: spec
+    for spec in [
+        BenchmarkSpec(
+            1,
+            "twoSum",
+            "O(n)",
+            lambda rng, n: ([4 * i for i in range(n - 2)] + [1, 2], 3),
+        ),
+        BenchmarkSpec(
+            2, "isValid", "O(n)", lambda rng, n: ("([{" * (n // 6) + "}])" * (n // 6),)
+        ),
+        BenchmarkSpec(3, "merge", "O(n)", _merge_args),
+        BenchmarkSpec(
+            4,
+            "maxProfit",
+            "O(n)",
+            lambda rng, n: ([rng.randrange(n) for _ in range(n)],),
+        ),
+        BenchmarkSpec(
+            5,
+            "containsDuplicate",
+            "O(n)",
+            lambda rng, n: (rng.sample(range(n * 10), n),),
+        ),
+        BenchmarkSpec(6, "isAnagram", "O(n log n)", _anagram_args),
+        BenchmarkSpec(
+            7,
+            "productExceptSelf",
+            "O(n)",
+            lambda rng, n: ([rng.choice((-1, 1)) for _ in range(n)],),
+        ),
+        BenchmarkSpec(
+            8,
+            "groupAnagrams",
+            "O(n)",
+            lambda rng, n: ([_letters(rng, 5, "abcdef") for _ in range(n)],),
+        ),
+        BenchmarkSpec(
+            9,
+            "topKFrequent",
+            "O(n log n)",
+            lambda rng, n: ([rng.randrange(n // 10 + 10) for _ in range(n)], 10),
+        ),
+        BenchmarkSpec(
+            11,
+            "lengthOfLongestSubstring",
+            "O(n)",
+            lambda rng, n: (_letters(rng, n, string.ascii_letters),),
+        ),
+        BenchmarkSpec(
+            12,
+            "characterReplacement",
+            "O(n)",
+            lambda rng, n: (_letters(rng, n, "AB"), 2),
+        ),
+        BenchmarkSpec(
+            13,
+            "checkInclusion",
+            "O(n)",
+            lambda rng, n: ("abc", _letters(rng, n, "defgh")),
+        ),
+        BenchmarkSpec(
+            14,
+            "minWindow",
+            "O(n)",
+            lambda rng, n: (_letters(rng, n, "ABCDEFG"), "ABC"),
+        ),
+        BenchmarkSpec(15, "isPalindrome", "O(n)", _palindrome_args),
+        BenchmarkSpec(
+            16,
+            "twoSum",
+            "O(n)",
+            lambda rng, n: (list(range(0, 2 * n, 2)), 1),
+        ),
+        BenchmarkSpec(
+            17,
+            "threeSum",
+            "O(n^2)",
+            lambda rng, n: ([rng.randrange(-n, n) for _ in range(n)],),
+            geometric_sizes(100),
+        ),
+        BenchmarkSpec(
+            18,
+            "maxArea",
+            "O(n)",
+            lambda rng, n: ([rng.randrange(n) for _ in range(n)],),
+        ),
+        BenchmarkSpec(
+            19,
+            "search",
+            "O(log n)",
+            lambda rng, n: (_rotated(rng, n), rng.randrange(n)),
+            geometric_sizes(1_000, 4),
+        ),
+        BenchmarkSpec(
+            20,
+            "findMin",
+            "O(log n)",
+            lambda rng, n: (_rotated(rng, n),),
+            geometric_sizes(1_000, 4),
+        ),
+        BenchmarkSpec(
+            21,
+            "search",
+            "O(log n)",
+            lambda rng, n: (list(range(n)), rng.randrange(n)),
+            geometric_sizes(1_000, 4),
+        ),
+        BenchmarkSpec(
+            22,
+            "minEatingSpeed",
+            "O(n)",
+            lambda rng, n: ([rng.randrange(1, 1_000) for _ in range(n)], 2 * n),
+        ),
+        BenchmarkSpec(
+            24,
+            "merge",
+            "O(n log n)",
+            lambda rng, n: (
+                [[s, s + rng.randrange(1, 10)] for s in rng.sample(range(10 * n), n)],
+            ),
+        ),
+        BenchmarkSpec(
+            25,
+            "insert",
+            "O(n)",
+            lambda rng, n: (
+                [[4 * i, 4 * i + 1] for i in range(n)],
+                [4 * (n // 2) + 2, 4 * (n // 2) + 3],
+            ),
+        ),
+        BenchmarkSpec(
+            26, "reverseList", "O(n)", lambda rng, n: (build_linked_list(range(n)),)
+        ),
+        BenchmarkSpec(
+            27,
+            "hasCycle",
+            "O(n)",
+            lambda rng, n: (build_cycle_linked_list(list(range(n)), n // 2),),
+        ),
+        BenchmarkSpec(
+            28,
+            "mergeTwoLists",
+            "O(n)",
+            lambda rng, n: (
+                build_linked_list(range(0, n, 2)),
+                build_linked_list(range(1, n, 2)),
+            ),
+        ),
+        BenchmarkSpec(
+            30, "levelOrder", "O(n)", lambda rng, n: (build_tree(list(range(n))),)
+        ),
+        BenchmarkSpec(
+            32, "numIslands", "O(n)", lambda rng, n: (_islands_grid(rng, n),)
+        ),
+        BenchmarkSpec(
+            34,
+            "findKthLargest",
+            "O(n log n)",
+            lambda rng, n: ([rng.randrange(n) for _ in range(n)], 10),
+        ),
+        BenchmarkSpec(
+            35,
+            "coinChange",
+            "O(n)",
+            lambda rng, n: ([1, 5, 10, 25], n),
+        ),
+    ]
+}
+
+
+@dataclass
+class GrowthFit:
+    model: str
+    exponent: float
+
+
+@dataclass
+class BenchmarkResult:
+    problem_number: int
+    method_name: str
+    target: str
+    sizes: list[int]
+    timings: list[float]
+    fit: GrowthFit
+    flagged: bool
+    solutions_dir: str = field(default=str(SOLUTIONS_DIR))
+
+
+def fit_growth(sizes: Iterable[int], timings: Iterable[float]) -> GrowthFit:
+    """Fit measured timings to the closest growth model.
+
+    ``exponent`` is the least-squares slope of log(time) against log(n).
+    ``model`` is the entry of ``MODELS`` that best explains the timings when
+    scaled by a constant, measured by relative (not absolute) error so the
+    largest size does not dominate the fit.
+    """
+    points = [(n, max(t, 1e-9)) for n, t in zip(sizes, timings, strict=True)]
+    if len(points) < 2:
+        raise ValueError("at least two measurements are required")
+
+    log_n = [math.log(n) for n, _ in points]
+    log_t = [math.log(t) for _, t in points]
+    mean_n = sum(log_n) / len(log_n)
+    mean_t = sum(log_t) / len(log_t)
+    spread = sum((x - mean_n) ** 2 for x in log_n)
+    exponent = (
+        sum((x - mean_n) * (y - mean_t) for x, y in zip(log_n, log_t, strict=True))
+        / spread
+        if spread
+        else 0.0
+    )
+
+    best_model = "O(1)"
+    best_residual = math.inf
+    for model, growth in MODELS.items():
+        ratios = [growth(n) / t for n, t in points]
+        scale = sum(ratios) / sum(ratio * ratio for ratio in ratios)
+        residual = sum((scale * ratio - 1) ** 2 for ratio in ratios)
+        if residual < best_residual:
+            best_model, best_residual = model, residual
+
+    return GrowthFit(best_model, round(exponent, 3))
+
+
+def is_worse_than(fit: GrowthFit, target: str, tolerance: float = 0.5) -> bool:
+    return fit.exponent > EXPONENTS[target] + tolerance
+
+
+def _time_call(
+    spec: BenchmarkSpec,
+    size: int,
+    rng: random.Random,
+    solutions_dir: Path,
+    repeats: int,
+) -> float:
+    best = math.inf
+    for _ in range(repeats):
+        method = getattr(
+            solution_instance(spec.problem_number, solutions_dir), spec.method_name
+        )
+        args = spec.make_args(rng, size)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            method(*args)
+            best = min(best, time.perf_counter() - start)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+    return best
+
+
+def run_benchmark(
+    spec: BenchmarkSpec,
+    solutions_dir: Path = SOLUTIONS_DIR,
+    sizes: Iterable[int] | None = None,
+    repeats: int = 5,
+    tolerance: float = 0.5,
+    seed: int = 0,
+) -> BenchmarkResult:
+    rng = random.Random(seed)
+    measured_sizes = list(sizes or spec.sizes)
+    timings = [
+        _time_call(spec, size, rng, Path(solutions_dir), repeats)
+        for size in measured_sizes
+    ]
+    fit = fit_growth(measured_sizes, timings)
+    return BenchmarkResult(
+        problem_number=spec.problem_number,
+        method_name=spec.method_name,
+        target=spec.target,
+        sizes=measured_sizes,
+        timings=timings,
+        fit=fit,
+        flagged=is_worse_than(fit, spec.target, tolerance),
+        solutions_dir=str(solutions_dir),
+    )
+
+
+def run_benchmarks(
+    problem_numbers: Iterable[int] | None = None,
+    solutions_dir: Path = SOLUTIONS_DIR,
+    repeats: int = 5,
+    tolerance: float = 0.5,
+    seed: int = 0,
+) -> list[BenchmarkResult]:
+    numbers = sorted(SPECS) if problem_numbers is None else list(problem_numbers)
+    return [
+        run_benchmark(
+            SPECS[number],
+            solutions_dir,
+            repeats=repeats,
+            tolerance=tolerance,
+            seed=seed,
+        )
+        for number in numbers
+    ]
+
+
+def write_report(
+    results: Iterable[BenchmarkResult], output_file: Path
+) -> dict[str, Any]:
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    }
+    report["flagged"] = [
+        result["problem_number"] for result in report["results"] if result["flagged"]
+    ]
+    Path(output_file).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return report
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure solution growth curves")
+    parser.add_argument(
+        "problems", nargs="*", type=int, help="Problem numbers (default: all)"
+    )
+    parser.add_argument("--solutions-dir", type=Path, default=SOLUTIONS_DIR)
+    parser.add_argument(
+        "--output", "-o", type=Path, default=Path("complexity_report.json")
+    )
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    args = parser.parse_args()
+
+    results = run_benchmarks(
+        args.problems or None,
+        args.solutions_dir,
+        repeats=args.repeats,
+        tolerance=args.tolerance,
+    )
+    report = write_report(results, args.output)
+
+    for result in results:
+        marker = "FLAG" if result.flagged else "ok"
+        print(
+            f"{result.problem_number:>3}  {marker:4}  target {result.target:<10}"
+            f"  fit {result.fit.model:<10}  slope {result.fit.exponent:.2f}"
+        )
+    print(f"\n{len(report['flagged'])} flagged; report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,22 @@
 from __future__ import annotations
 
+import gc
 import importlib.util
+from array import array
 from collections import deque
+from contextlib import contextmanager
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator, Sequence
 
 PROBLEMS_DIR = Path(__file__).resolve().parents[1]
 SOLUTIONS_DIR = PROBLEMS_DIR / "solutions"
 
 
 @lru_cache(maxsize=None)
-def _load_module(problem_number: int):
+def _load_module(problem_number: int, solutions_dir: Path = SOLUTIONS_DIR):
     pattern = f"{problem_number:02d}-*.py"
-    matches = sorted(SOLUTIONS_DIR.glob(pattern))
+    matches = sorted(Path(solutions_dir).glob(pattern))
     if not matches:
         raise FileNotFoundError(
             f"No solution file found for problem {problem_number:02d}"
@@ -30,13 +33,13 @@ def _load_module(problem_number: int):
     return module
 
 
-def solution_instance(problem_number: int) -> Any:
-    module = _load_module(problem_number)
+def solution_instance(problem_number: int, solutions_dir: Path = SOLUTIONS_DIR) -> Any:
+    module = _load_module(problem_number, solutions_dir)
     return module.Solution()
 
 
-def solution_module(problem_number: int) -> Any:
-    return _load_module(problem_number)
+def solution_module(problem_number: int, solutions_dir: Path = SOLUTIONS_DIR) -> Any:
+    return _load_module(problem_number, solutions_dir)
 
 
 def run_method(problem_number: int, method_name: str, *args: Any, **kwargs: Any) -> Any:
@@ -46,12 +49,16 @@ def run_method(problem_number: int, method_name: str, *args: Any, **kwargs: Any)
 
 
 class ListNode:
+    __slots__ = ("val", "next")
+
     def __init__(self, val: int = 0, next: "ListNode | None" = None) -> None:
         self.val = val
         self.next = next
 
 
 class TreeNode:
+    __slots__ = ("val", "left", "right")
+
     def __init__(
         self,
         val: int = 0,
@@ -64,6 +71,8 @@ class TreeNode:
 
 
 class GraphNode:
+    __slots__ = ("val", "neighbors")
+
     def __init__(
         self, val: int = 0, neighbors: list["GraphNode"] | None = None
     ) -> None:
@@ -71,19 +80,24 @@ class GraphNode:
         self.neighbors = neighbors if neighbors is not None else []
 
 
-def build_linked_list(values: Iterable[int]) -> ListNode | None:
-    head: ListNode | None = None
-    tail: ListNode | None = None
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Bulk node allocation otherwise triggers a cyclic GC pass every few
+    # hundred nodes, which dominates build time for large inputs.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
 
-    for value in values:
-        node = ListNode(value)
-        if head is None:
-            head = node
-            tail = node
-        else:
-            tail.next = node
-            tail = node
 
+def build_linked_list(values: Iterable[int]) -> ListNode | None:
+    head: ListNode | None = None
+    with _gc_paused():
+        for value in reversed(list(values)):
+            head = ListNode(value, head)
     return head
 
 
@@ -96,6 +110,15 @@ def linked_list_to_list(head: ListNode | None) -> list[int]:
     return values
 
 
+def linked_list_to_array(head: ListNode | None) -> array:
+    values = array("q")
+    current = head
+    while current is not None:
+        values.append(current.val)
+        current = current.next
+    return values
+
+
 def build_cycle_linked_list(values: list[int], cycle_pos: int) -> ListNode | None:
     head = build_linked_list(values)
     if head is None or cycle_pos < 0:
@@ -119,30 +142,77 @@ def build_cycle_linked_list(values: list[int], cycle_pos: int) -> ListNode | Non
     return head
 
 
+def _link_level_order(nodes: list[TreeNode | None]) -> TreeNode | None:
+    # In level order every present node owns the next two slots as children,
+    # so one pass with a child cursor links the whole tree without a queue.
+    total = len(nodes)
+    child = 1
+    for node in nodes:
+        if child >= total:
+            break
+        if node is None:
+            continue
+        node.left = nodes[child]
+        if child + 1 < total:
+            node.right = nodes[child + 1]
+        child += 2
+    return nodes[0] if nodes else None
+
+
 def build_tree(level_values: list[int | None]) -> TreeNode | None:
-    if not level_values:
-        return None
-    if level_values[0] is None:
-        return None
+    with _gc_paused():
+        return _link_level_order(
+            [None if value is None else TreeNode(value) for value in level_values]
+        )
 
-    root = TreeNode(level_values[0])
-    queue: deque[TreeNode] = deque([root])
-    index = 1
 
-    while queue and index < len(level_values):
-        node = queue.popleft()
+def pack_level_order(level_values: list[int | None]) -> tuple[array, bytearray]:
+    values = array("q", [0 if value is None else value for value in level_values])
+    present = bytearray((len(level_values) + 7) // 8)
+    for index, value in enumerate(level_values):
+        if value is not None:
+            present[index >> 3] |= 1 << (index & 7)
+    return values, present
+
+
+def build_tree_from_arrays(
+    values: Sequence[int], present: bytes | bytearray | None = None
+) -> TreeNode | None:
+    with _gc_paused():
+        if present is None:
+            return _link_level_order([TreeNode(value) for value in values])
+        return _link_level_order(
+            [
+                TreeNode(value) if present[index >> 3] >> (index & 7) & 1 else None
+                for index, value in enumerate(values)
+            ]
+        )
 
-        if index < len(level_values) and level_values[index] is not None:
-            node.left = TreeNode(level_values[index])
-            queue.append(node.left)
-        index += 1
 
-        if index < len(level_values) and level_values[index] is not None:
-            node.right = TreeNode(level_values[index])
-            queue.append(node.right)
-        index += 1
+def tree_to_arrays(root: TreeNode | None) -> tuple[array, bytearray]:
+    values = array("q")
+    present = bytearray()
+    if root is None:
+        return values, present
+
+    queue: list[TreeNode | None] = [root]
+    last_present = 0
+    for index, node in enumerate(queue):
+        if index & 7 == 0:
+            present.append(0)
+        if node is None:
+            values.append(0)
+            continue
+        values.append(node.val)
+        present[index >> 3] |= 1 << (index & 7)
+        last_present = index
+        queue.append(node.left)
+        queue.append(node.right)
 
-    return root
+    # Trailing null children carry no information, as in LeetCode's format.
+    del values[last_present + 1 :]
+    del present[(last_present >> 3) + 1 :]
+    return values, present
 
 
 def find_bst_node(root: TreeNode | None, target: int) -> TreeNode | None:
@@ -168,6 +238,31 @@ def build_graph(adj_list: list[list[int]]) -> GraphNode | None:
     return nodes[1]
 
 
+def build_graph_from_csr(
+    offsets: Sequence[int], targets: Sequence[int]
+) -> GraphNode | None:
+    count = len(offsets) - 1
+    if count <= 0:
+        return None
+
+    with _gc_paused():
+        nodes = [GraphNode(value) for value in range(count + 1)]
+        for index in range(count):
+            nodes[index + 1].neighbors = [
+                nodes[target] for target in targets[offsets[index] : offsets[index + 1]]
+            ]
+    return nodes[1]
+
+
+def graph_to_csr(node: GraphNode | None) -> tuple[array, array]:
+    offsets = array("q", [0])
+    targets = array("q")
+    for neighbors in graph_to_adj_list(node):
+        targets.extend(neighbors)
+        offsets.append(len(targets))
+    return offsets, targets
+
+
 def graph_to_adj_list(node: GraphNode | None) -> list[list[int]]:
     if node is None:
         return []
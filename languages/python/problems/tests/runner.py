@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import copy
+import multiprocessing
+import os
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from harness import SOLUTIONS_DIR, solution_instance
+
+STARTUP_TIMEOUT = 60.0
+
+
+@dataclass
+class Call:
+    problem_number: int
+    method_name: str
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class CallResult:
+    call: Call
+    status: str  # ok, error, timeout, crashed
+    value: Any = None
+    error: str | None = None
+    wall_time: float = 0.0  # measured with tracemalloc off
+    peak_memory: int = 0  # from a second, traced run of the same call
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+@dataclass
+class ProblemReport:
+    problem_number: int
+    solutions_dir: Path
+    results: list[CallResult]
+
+    @property
+    def ok(self) -> bool:
+        return all(result.ok for result in self.results)
+
+    @property
+    def wall_time(self) -> float:
+        return sum(result.wall_time for result in self.results)
+
+    @property
+    def peak_memory(self) -> int:
+        return max((result.peak_memory for result in self.results), default=0)
+
+
+def _peak_memory(solutions_dir: str, call: Call) -> int:
+    """Run ``call`` on a fresh instance under tracemalloc; return its peak bytes."""
+    instance = solution_instance(call.problem_number, Path(solutions_dir))
+    method = getattr(instance, call.method_name)
+    tracemalloc.start()
+    try:
+        method(*call.args, **call.kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _worker(
+    conn: Any, solutions_dir: str, calls: list[Call], trace_memory: bool
+) -> None:
+    conn.send(None)
+
+    for call in calls:
+        value: Any = None
+        error: str | None = None
+        wall_time = 0.0
+        peak = 0
+        try:
+            # Tracing slows every allocation down, so the timed run is untraced
+            # and memory is measured in a second run. That run gets the original
+            # arguments, so the timed one works on a copy it may mutate.
+            args, kwargs = call.args, call.kwargs
+            if trace_memory:
+                args, kwargs = copy.deepcopy((args, kwargs))
+            instance = solution_instance(call.problem_number, Path(solutions_dir))
+            method = getattr(instance, call.method_name)
+            start = time.perf_counter()
+            try:
+                value = method(*args, **kwargs)
+            finally:
+                wall_time = time.perf_counter() - start
+            if trace_memory:
+                peak = _peak_memory(solutions_dir, call)
+            status = "ok"
+        except Exception as exc:  # noqa: BLE001 - learner code may raise anything
+            status = "error"
+            error = f"{type(exc).__name__}: {exc}"
+
+        try:
+            conn.send((status, value, error, wall_time, peak))
+        except Exception:  # noqa: BLE001 - unpicklable return values
+            conn.send((status, repr(value), error, wall_time, peak))
+
+    conn.close()
+
+
+def _run_shard(
+    solutions_dir: Path,
+    problem_number: int,
+    calls: list[Call],
+    timeout: float,
+    trace_memory: bool,
+    context: Any,
+) -> ProblemReport:
+    results: list[CallResult] = []
+    pending = list(calls)
+
+    # Each pass runs the remaining calls in a fresh process, so a call that hangs
+    # or kills its interpreter only costs that call, not the rest of the shard.
+    while pending:
+        parent_conn, child_conn = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_worker,
+            args=(child_conn, str(solutions_dir), pending, trace_memory),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+
+        try:
+            ready = parent_conn.poll(STARTUP_TIMEOUT)
+            if ready:
+                parent_conn.recv()
+            while pending:
+                call = pending.pop(0)
+                if not ready or not parent_conn.poll(timeout):
+                    results.append(
+                        CallResult(
+                            call,
+                            "timeout",
+                            error=f"exceeded {timeout:g}s",
+                            wall_time=timeout,
+                        )
+                    )
+                    break
+                try:
+                    status, value, error, wall_time, peak = parent_conn.recv()
+                except EOFError:
+                    process.join()
+                    results.append(
+                        CallResult(
+                            call,
+                            "crashed",
+                            error=f"worker exited with code {process.exitcode}",
+                        )
+                    )
+                    break
+                results.append(CallResult(call, status, value, error, wall_time, peak))
+        finally:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+            parent_conn.close()
+
+    return ProblemReport(problem_number, solutions_dir, results)
+
+
+def run_parallel(
+    calls: Iterable[Call],
+    solutions_dirs: Iterable[Path] = (SOLUTIONS_DIR,),
+    workers: int | None = None,
+    timeout: float = 10.0,
+    trace_memory: bool = True,
+    start_method: str = "spawn",
+) -> list[ProblemReport]:
+    """Run ``calls`` against every solutions directory, sharded by problem.
+
+    Each (solutions directory, problem number) shard runs in its own process;
+    up to ``workers`` shards run at once. A call that exceeds ``timeout``
+    seconds or crashes its process is recorded and the shard carries on with
+    the next call. Reports come back in submission order, then problem order.
+
+    With ``trace_memory`` each call runs twice: once timed, once under
+    tracemalloc for its peak memory. ``timeout`` covers both runs.
+    """
+    grouped: dict[int, list[Call]] = {}
+    for call in calls:
+        grouped.setdefault(call.problem_number, []).append(call)
+
+    shards = [
+        (Path(solutions_dir), problem_number, problem_calls)
+        for solutions_dir in solutions_dirs
+        for problem_number, problem_calls in sorted(grouped.items())
+    ]
+    if not shards:
+        return []
+
+    context = multiprocessing.get_context(start_method)
+    max_workers = min(workers or os.cpu_count() or 1, len(shards))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                _run_shard,
+                solutions_dir,
+                problem_number,
+                problem_calls,
+                timeout,
+                trace_memory,
+                context,
+            )
+            for solutions_dir, problem_number, problem_calls in shards
+        ]
+        return [future.result() for future in futures]
+
+
+def format_reports(reports: Iterable[ProblemReport]) -> str:
+    lines = [
+        f"{'problem':>7}  {'status':8}  {'wall (ms)':>10}  {'peak (KiB)':>10}  source"
+    ]
+    for report in reports:
+        failed = [result.status for result in report.results if not result.ok]
+        status = failed[0] if failed else "ok"
+        lines.append(
+            f"{report.problem_number:>7}  {status:8}  "
+            f"{report.wall_time * 1000:>10.2f}  {report.peak_memory / 1024:>10.1f}  "
+            f"{report.solutions_dir}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from benchmarks import SPECS, fit_growth, is_worse_than, run_benchmark, write_report
+
+SIZES = [250, 500, 1_000, 2_000]
+
+
+def test_fit_growth_recognises_models() -> None:
+    sizes = [1_000, 2_000, 4_000, 8_000]
+
+    linear = fit_growth(sizes, [n * 1e-7 for n in sizes])
+    assert linear.model == "O(n)"
+    assert abs(linear.exponent - 1) < 0.01
+
+    quadratic = fit_growth(sizes, [n * n * 1e-9 for n in sizes])
+    assert quadratic.model == "O(n^2)"
+    assert is_worse_than(quadratic, "O(n)")
+    assert not is_worse_than(linear, "O(n log n)")
+
+
+def test_benchmark_flags_quadratic_two_sum(tmp_path: Path) -> None:
+    (tmp_path / "01-two-sum.py").write_text(
+        "class Solution:\n"
+        "    def twoSum(self, nums, target):\n"
+        "        for i in range(len(nums)):\n"
+        "            for j in range(i + 1, len(nums)):\n"
+        "                if nums[i] + nums[j] == target:\n"
+        "                    return [i, j]\n"
+        "        return []\n",
+        encoding="utf-8",
+    )
+
+    reference = run_benchmark(SPECS[1], sizes=SIZES, repeats=3)
+    brute_force = run_benchmark(SPECS[1], tmp_path, sizes=SIZES, repeats=1)
+
+    assert not reference.flagged
+    assert brute_force.flagged
+    assert brute_force.fit.exponent > 1.5
+
+    report = write_report([reference, brute_force], tmp_path / "report.json")
+    saved = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+    assert saved["flagged"] == report["flagged"] == [1]
+    assert saved["results"][1]["fit"]["model"] == "O(n^2)"
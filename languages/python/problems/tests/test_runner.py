@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from runner import Call, format_reports, run_parallel
+
+
+def test_run_parallel_reference_solutions() -> None:
+    reports = run_parallel(
+        [
+            Call(2, "isValid", ("()[]{}",)),
+            Call(1, "twoSum", ([2, 7, 11, 15], 9)),
+            Call(1, "twoSum", ([3, 2, 4], 6)),
+        ],
+        workers=2,
+    )
+
+    assert [report.problem_number for report in reports] == [1, 2]
+    assert all(report.ok for report in reports)
+    assert [result.value for result in reports[0].results] == [[0, 1], [1, 2]]
+    assert reports[1].results[0].value is True
+    assert all(report.wall_time > 0 for report in reports)
+    assert all(report.peak_memory > 0 for report in reports)
+    assert "ok" in format_reports(reports)
+
+
+def test_run_parallel_isolates_broken_submissions(tmp_path: Path) -> None:
+    (tmp_path / "01-two-sum.py").write_text(
+        "class Solution:\n"
+        "    def twoSum(self, nums, target):\n"
+        "        if target < 0:\n"
+        "            while True:\n"
+        "                pass\n"
+        "        return [0, 1]\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "02-valid-parentheses.py").write_text(
+        "import os\n\n\n"
+        "class Solution:\n"
+        "    def isValid(self, s):\n"
+        "        os._exit(3)\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "05-contains-duplicate.py").write_text(
+        "class Solution:\n"
+        "    def containsDuplicate(self, nums):\n"
+        "        return nums[10]\n",
+        encoding="utf-8",
+    )
+
+    reports = run_parallel(
+        [
+            Call(1, "twoSum", ([1, 2], -1)),
+            Call(1, "twoSum", ([1, 2], 3)),
+            Call(2, "isValid", ("()",)),
+            Call(5, "containsDuplicate", ([1, 2],)),
+        ],
+        solutions_dirs=[tmp_path],
+        timeout=1.0,
+    )
+
+    by_problem = {report.problem_number: report for report in reports}
+    assert [result.status for result in by_problem[1].results] == ["timeout", "ok"]
+    assert by_problem[1].results[1].value == [0, 1]
+    assert by_problem[2].results[0].status == "crashed"
+    assert by_problem[5].results[0].status == "error"
+    assert "IndexError" in by_problem[5].results[0].error
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from array import array
+
+from harness import (
+    GraphNode,
+    ListNode,
+    TreeNode,
+    build_cycle_linked_list,
+    build_graph,
+    build_graph_from_csr,
+    build_linked_list,
+    build_tree,
+    build_tree_from_arrays,
+    find_bst_node,
+    graph_to_adj_list,
+    graph_to_csr,
+    linked_list_to_array,
+    pack_level_order,
+    solution_instance,
+    solution_module,
+    tree_to_arrays,
+)
+
+LARGE = 100_000
+
+
+def _complete_bst_values(count: int) -> array:
+    # Level-order values of a complete tree numbered in in-order, i.e. a BST.
+    values = array("q", bytes(8 * count))
+    stack: list[int] = []
+    index = 0
+    rank = 0
+    while stack or index < count:
+        while index < count:
+            stack.append(index)
+            index = 2 * index + 1
+        index = stack.pop()
+        values[index] = rank
+        rank += 1
+        index = 2 * index + 2
+    return values
+
+
+def test_nodes_use_slots() -> None:
+    assert not hasattr(ListNode(), "__dict__")
+    assert not hasattr(TreeNode(), "__dict__")
+
+
+def test_tree_arrays_round_trip() -> None:
+    level_values = [5, 1, 4, None, None, 3, 6]
+    values, present = pack_level_order(level_values)
+
+    root = build_tree_from_arrays(values, present)
+    assert tree_to_arrays(root) == (values, present)
+    assert tree_to_arrays(build_tree(level_values)) == (values, present)
+    assert tree_to_arrays(build_tree_from_arrays(array("q", [1, 2, 3]))) == (
+        array("q", [1, 2, 3]),
+        bytearray([0b111]),
+    )
+    assert build_tree_from_arrays(*pack_level_order([None, 1])) is None
+
+
+def test_graph_csr_round_trip() -> None:
+    adj_list = [[2, 4], [1, 3], [2, 4], [1, 3]]
+    offsets, targets = graph_to_csr(build_graph(adj_list))
+
+    assert list(offsets) == [0, 2, 4, 6, 8]
+    assert graph_to_adj_list(build_graph_from_csr(offsets, targets)) == adj_list
+
+
+def test_26_reverse_linked_list_large() -> None:
+    head = build_linked_list(array("q", range(LARGE)))
+    result = solution_instance(26).reverseList(head)
+    assert linked_list_to_array(result) == array("q", range(LARGE - 1, -1, -1))
+
+
+def test_27_linked_list_cycle_large() -> None:
+    head = build_cycle_linked_list(list(range(LARGE)), cycle_pos=LARGE // 2)
+    assert solution_instance(27).hasCycle(head) is True
+
+
+def test_28_merge_two_sorted_lists_large() -> None:
+    left = build_linked_list(range(0, LARGE, 2))
+    right = build_linked_list(range(1, LARGE, 2))
+    merged = solution_instance(28).mergeTwoLists(left, right)
+    assert linked_list_to_array(merged) == array("q", range(LARGE))
+
+
+def test_29_to_31_large_bst() -> None:
+    root = build_tree_from_arrays(_complete_bst_values(LARGE))
+
+    assert solution_instance(29).isValidBST(root) is True
+
+    levels = solution_instance(30).levelOrder(root)
+    assert sum(len(level) for level in levels) == LARGE
+    assert len(levels) == LARGE.bit_length()
+
+    p = find_bst_node(root, 10)
+    q = find_bst_node(root, LARGE - 10)
+    lca = solution_instance(31).lowestCommonAncestor(root, p, q)
+    assert lca is root
+
+
+def test_33_clone_graph_large_star() -> None:
+    module = solution_module(33)
+    module.Node = GraphNode
+
+    # Node 1 links to every leaf and each leaf links back, keeping DFS shallow.
+    offsets = array("q", [0, LARGE - 1, *range(LARGE, 2 * LARGE - 1)])
+    targets = array("q", [*range(2, LARGE + 1), *([1] * (LARGE - 1))])
+    source = build_graph_from_csr(offsets, targets)
+
+    clone = module.Solution().cloneGraph(source)
+    assert clone is not source
+    assert graph_to_csr(clone) == (offsets, targets)
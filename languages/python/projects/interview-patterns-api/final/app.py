@@ -6,13 +6,40 @@ Run:
 
 from __future__ import annotations
 
-from collections import Counter
-from typing import List
-
-from fastapi import FastAPI, HTTPException
+import asyncio
+import hashlib
+import heapq
+import json
+import multiprocessing
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, List, Literal, Optional, Sequence
+
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
-app = FastAPI(title="Interview Patterns API (Final)")
+try:
+    import orjson
+except ImportError:  # optional: faster encoding when installed
+    orjson = None
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    shutdown_worker_pool()
+
+
+app = FastAPI(title="Interview Patterns API (Final)", lifespan=lifespan)
+
+MAX_BATCH_ITEMS = 1_000
+MAX_EVENT_MINUTES = 24 * 60
 
 
 class TwoSumRequest(BaseModel):
@@ -41,9 +68,40 @@ class TopKResponse(BaseModel):
     values: List[int]
 
 
+class TwoSumBatchRequest(BaseModel):
+    items: List[TwoSumRequest] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class TwoSumBatchResponse(BaseModel):
+    results: List[TwoSumResponse]
+
+
+class ParenthesesBatchRequest(BaseModel):
+    items: List[ParenthesesRequest] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class ParenthesesBatchResponse(BaseModel):
+    results: List[ParenthesesResponse]
+
+
+class TopKBatchRequest(BaseModel):
+    items: List[TopKRequest] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class TopKBatchResponse(BaseModel):
+    results: List[TopKResponse]
+
+
+class RouteLatency(BaseModel):
+    count: int
+    p50_ms: float
+    p99_ms: float
+
+
 class PracticeEvent(BaseModel):
     topic: str
-    minutes: int = Field(gt=0)
+    # At most a day; this also bounds the distinct values MinutesPairIndex scans.
+    minutes: int = Field(gt=0, le=MAX_EVENT_MINUTES)
     difficulty: str
 
 
@@ -59,9 +117,6 @@ class MinutesPairResponse(BaseModel):
     indices: List[int]
 
 
-EVENTS: List[PracticeEventOut] = []
-
-
 def two_sum_indices(nums: List[int], target: int) -> List[int]:
     seen: dict[int, int] = {}
     for index, value in enumerate(nums):
@@ -92,14 +147,418 @@ def top_k_frequent(nums: List[int], k: int) -> List[int]:
     return [value for value, _ in counts.most_common(k)]
 
 
-def top_practiced_topics(k: int) -> List[str]:
-    counts = Counter(event.topic for event in EVENTS)
-    return [topic for topic, _ in counts.most_common(k)]
+def solve_two_sum_batch(items: List[tuple[List[int], int]]) -> List[List[int]]:
+    return [two_sum_indices(nums, target) for nums, target in items]
+
+
+def solve_parentheses_batch(items: List[str]) -> List[bool]:
+    return [is_valid_parentheses(s) for s in items]
+
+
+def solve_top_k_batch(items: List[tuple[List[int], int]]) -> List[List[int]]:
+    return [top_k_frequent(nums, k) for nums, k in items]
+
+
+class ResponseCache:
+    """Thread-safe LRU of algorithm results keyed by (route, payload hash)."""
+
+    def __init__(self, maxsize: int = 4_096) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, bytes], Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(route: str, payload: BaseModel) -> tuple[str, bytes]:
+        digest = hashlib.blake2b(payload.model_dump_json().encode(), digest_size=16)
+        return route, digest.digest()
+
+    def get(self, key: tuple[str, bytes]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return MISSING
+
+    def put(self, key: tuple[str, bytes], value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class LatencyHistogram:
+    """Request latencies in geometric buckets (about 10% wide) from 10us to 60s."""
+
+    BOUNDS = [1e-5 * 1.1**i for i in range(165)]
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.total = 0
+
+    def record(self, seconds: float) -> None:
+        self.counts[bisect_left(self.BOUNDS, seconds)] += 1
+        self.total += 1
+
+    def percentile(self, q: float) -> float:
+        rank = q * self.total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.BOUNDS[min(index, len(self.BOUNDS) - 1)]
+        return 0.0
+
+
+class LatencyMiddleware:
+    """ASGI middleware recording latency per route template, e.g. /items/{id}."""
+
+    def __init__(self, app: Callable[..., Any]) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None)
+            if path is not None:
+                with LATENCY_LOCK:
+                    histogram = LATENCIES.get(path)
+                    if histogram is None:
+                        histogram = LATENCIES[path] = LatencyHistogram()
+                    histogram.record(time.perf_counter() - start)
+
+
+MISSING = object()
+RESPONSE_CACHE = ResponseCache()
+LATENCIES: dict[str, LatencyHistogram] = {}
+LATENCY_LOCK = threading.Lock()
+
+# Batches whose total input size is below this run on a thread; larger ones are
+# split across worker processes so they neither block the event loop nor hold
+# the GIL.
+OFFLOAD_THRESHOLD = 200_000
+WORKER_COUNT = os.cpu_count() or 1
+WORKER_POOL: Optional[ProcessPoolExecutor] = None
+_WORKER_POOL_LOCK = threading.Lock()
+
+app.add_middleware(LatencyMiddleware)
+
+
+def get_worker_pool() -> ProcessPoolExecutor:
+    global WORKER_POOL
+    with _WORKER_POOL_LOCK:
+        if WORKER_POOL is None:
+            WORKER_POOL = ProcessPoolExecutor(
+                max_workers=WORKER_COUNT,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return WORKER_POOL
+
+
+def shutdown_worker_pool() -> None:
+    global WORKER_POOL
+    with _WORKER_POOL_LOCK:
+        if WORKER_POOL is not None:
+            WORKER_POOL.shutdown(cancel_futures=True)
+            WORKER_POOL = None
+
+
+def cached_result(route: str, payload: BaseModel, compute: Callable[[], Any]) -> Any:
+    key = RESPONSE_CACHE.key(route, payload)
+    result = RESPONSE_CACHE.get(key)
+    if result is MISSING:
+        result = compute()
+        RESPONSE_CACHE.put(key, result)
+    return result
+
+
+def _cached_lookup(
+    route: str, payloads: Sequence[BaseModel]
+) -> tuple[List[tuple[str, bytes]], List[Any], List[int]]:
+    keys = [RESPONSE_CACHE.key(route, payload) for payload in payloads]
+    results = [RESPONSE_CACHE.get(key) for key in keys]
+    missing = [index for index, result in enumerate(results) if result is MISSING]
+    return keys, results, missing
+
+
+def _store_results(
+    keys: List[tuple[str, bytes]],
+    results: List[Any],
+    missing: List[int],
+    computed: List[Any],
+) -> None:
+    for index, result in zip(missing, computed, strict=True):
+        results[index] = result
+        RESPONSE_CACHE.put(keys[index], result)
+
+
+def _run_batch_inline(
+    route: str,
+    payloads: Sequence[BaseModel],
+    solver: Callable[[List[Any]], List[Any]],
+    inputs: Callable[[Any], Any],
+) -> List[Any]:
+    keys, results, missing = _cached_lookup(route, payloads)
+    if missing:
+        computed = solver([inputs(payloads[index]) for index in missing])
+        _store_results(keys, results, missing, computed)
+    return results
+
+
+async def run_cached_batch(
+    route: str,
+    payloads: Sequence[BaseModel],
+    solver: Callable[[List[Any]], List[Any]],
+    inputs: Callable[[Any], Any],
+    size: Callable[[Any], int],
+) -> List[Any]:
+    # Hashing payloads for the cache is as costly as solving small inputs, so
+    # neither happens on the event loop: small batches run in one thread-pool
+    # call, larger ones (even a single item) are hashed there and solved in
+    # worker processes.
+    if sum(size(payload) for payload in payloads) < OFFLOAD_THRESHOLD:
+        return await run_in_threadpool(
+            _run_batch_inline, route, payloads, solver, inputs
+        )
+
+    keys, results, missing = await run_in_threadpool(_cached_lookup, route, payloads)
+    if not missing:
+        return results
+
+    items = [inputs(payloads[index]) for index in missing]
+    pool = get_worker_pool()
+    chunk = -(-len(items) // WORKER_COUNT)
+    loop = asyncio.get_running_loop()
+    parts = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, solver, items[start : start + chunk])
+            for start in range(0, len(items), chunk)
+        )
+    )
+    computed = [result for part in parts for result in part]
+    _store_results(keys, results, missing, computed)
+    return results
+
+
+class TopKCounter:
+    """Counts with a lazily updated max-heap for top-k queries.
+
+    Ties keep first-seen order, matching ``Counter.most_common``. Each increment
+    pushes one heap entry; entries whose count has since changed are stale and
+    are dropped as they surface.
+    """
+
+    def __init__(self) -> None:
+        self.counts: dict[str, int] = {}
+        self._first_seen: dict[str, int] = {}
+        self._heap: list[tuple[int, int, str]] = []
+
+    def add(self, key: str) -> None:
+        count = self.counts.get(key, 0) + 1
+        self.counts[key] = count
+        order = self._first_seen.setdefault(key, len(self._first_seen))
+        heapq.heappush(self._heap, (-count, order, key))
+        if len(self._heap) > 2 * len(self.counts) + 64:
+            self._heap = [
+                (-count, self._first_seen[key], key)
+                for key, count in self.counts.items()
+            ]
+            heapq.heapify(self._heap)
+
+    def most_common(self, k: int) -> List[str]:
+        top: list[tuple[int, int, str]] = []
+        while self._heap and len(top) < k:
+            entry = heapq.heappop(self._heap)
+            if self.counts.get(entry[2]) == -entry[0]:
+                top.append(entry)
+        for entry in top:
+            heapq.heappush(self._heap, entry)
+        return [key for _, _, key in top]
+
+
+class MinutesPairIndex:
+    """Minutes-pair lookups over all events so far, without a table of sums.
+
+    Gives the same pair ``two_sum_indices`` would find over all minutes so far:
+    the earliest second index, paired with the latest matching earlier one.
+    Only the positions of each minutes value are kept (one entry per event), so
+    memory grows with the events rather than with the number of possible sums;
+    ``find`` scans the distinct values, of which there are at most
+    ``MAX_EVENT_MINUTES``.
+    """
+
+    def __init__(self) -> None:
+        self.positions: dict[int, List[int]] = {}
+
+    def add(self, index: int, minutes: int) -> None:
+        self.positions.setdefault(minutes, []).append(index)
+
+    def find(self, target: int) -> List[int]:
+        best: List[int] = []
+        for value, positions in self.positions.items():
+            other = self.positions.get(target - value)
+            if other is None:
+                continue
+            if other is positions:
+                # A doubled value pairs its first two occurrences.
+                if len(positions) < 2:
+                    continue
+                pair = [positions[0], positions[1]]
+            elif positions[0] > other[0]:
+                # The pair completes where ``value`` first appears, with the
+                # latest ``target - value`` before it.
+                earlier = other[bisect_left(other, positions[0]) - 1]
+                pair = [earlier, positions[0]]
+            else:
+                continue
+            if not best or pair[1] < best[1]:
+                best = pair
+        return best
+
+
+class WindowedCounter:
+    """Counts over a sliding window kept as a ring of fixed-width time buckets."""
+
+    def __init__(self, bucket_seconds: int, bucket_count: int) -> None:
+        self.bucket_seconds = bucket_seconds
+        self.bucket_count = bucket_count
+        self.totals: Counter[str] = Counter()
+        self._buckets: deque[tuple[int, Counter[str]]] = deque()
+
+    def _expire(self, now: float) -> None:
+        oldest = int(now // self.bucket_seconds) - self.bucket_count + 1
+        while self._buckets and self._buckets[0][0] < oldest:
+            _, counts = self._buckets.popleft()
+            self.totals.subtract(counts)
+            for key in counts:
+                if self.totals[key] <= 0:
+                    del self.totals[key]
+
+    def add(self, key: str, now: float) -> None:
+        self._expire(now)
+        bucket = int(now // self.bucket_seconds)
+        if not self._buckets or self._buckets[-1][0] != bucket:
+            self._buckets.append((bucket, Counter()))
+        self._buckets[-1][1][key] += 1
+        self.totals[key] += 1
+
+    def most_common(self, k: int, now: float) -> List[str]:
+        self._expire(now)
+        return [key for key, _ in self.totals.most_common(k)]
+
+
+def encode_json(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class PracticeEventStore:
+    """Practice events plus insight indexes updated as each event is added.
+
+    Each event is also JSON-encoded once on insert and listed by position under
+    its topic, its difficulty and the pair, so a filtered page is a bisect and a
+    slice of ready-made bytes.
+    """
+
+    WINDOWS = {"hour": (60, 60), "day": (3_600, 24), "week": (3_600, 168)}
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.events: List[PracticeEventOut] = []
+            self.rows: List[bytes] = []
+            self.positions: dict[tuple[Optional[str], Optional[str]], List[int]] = {}
+            self.topics = TopKCounter()
+            self.minutes = MinutesPairIndex()
+            self.windows = {
+                name: WindowedCounter(*spec) for name, spec in self.WINDOWS.items()
+            }
+
+    def add(self, payload: PracticeEvent) -> PracticeEventOut:
+        with self._lock:
+            event = PracticeEventOut(id=len(self.events) + 1, **payload.model_dump())
+            now = self.clock()
+            position = len(self.events)
+            self.minutes.add(position, event.minutes)
+            self.events.append(event)
+            self.rows.append(encode_json(event.model_dump()))
+            for key in (
+                (event.topic, None),
+                (None, event.difficulty),
+                (event.topic, event.difficulty),
+            ):
+                self.positions.setdefault(key, []).append(position)
+            self.topics.add(event.topic)
+            for window in self.windows.values():
+                window.add(event.topic, now)
+        return event
+
+    def page(
+        self,
+        after: int = 0,
+        limit: int = 100,
+        topic: Optional[str] = None,
+        difficulty: Optional[str] = None,
+    ) -> tuple[List[bytes], Optional[int]]:
+        """Return encoded events with id > ``after`` and the next cursor, if any."""
+        with self._lock:
+            # Ids are positions + 1, so "id > after" means "position >= after".
+            if topic is None and difficulty is None:
+                start = min(after, len(self.rows))
+                end = min(start + limit, len(self.rows))
+                rows = self.rows[start:end]
+                more = end < len(self.rows)
+                last_id = end
+            else:
+                positions = self.positions.get((topic, difficulty), [])
+                start = bisect_left(positions, after)
+                selected = positions[start : start + limit]
+                rows = [self.rows[position] for position in selected]
+                more = start + limit < len(positions)
+                last_id = selected[-1] + 1 if selected else after
+        return rows, last_id if more else None
+
+    def top_topics(self, k: int, window: Optional[str] = None) -> List[str]:
+        with self._lock:
+            if window is None:
+                return self.topics.most_common(k)
+            return self.windows[window].most_common(k, self.clock())
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+
+EVENTS = PracticeEventStore()
+
+
+def top_practiced_topics(k: int, window: Optional[str] = None) -> List[str]:
+    return EVENTS.top_topics(k, window)
 
 
 def find_minutes_pair(target: int) -> List[int]:
-    minutes = [event.minutes for event in EVENTS]
-    return two_sum_indices(minutes, target)
+    return EVENTS.minutes.find(target)
 
 
 @app.get("/health")
@@ -109,7 +568,9 @@ def health() -> dict[str, str]:
 
 @app.post("/algorithms/two-sum", response_model=TwoSumResponse)
 def api_two_sum(payload: TwoSumRequest) -> TwoSumResponse:
-    indices = two_sum_indices(payload.nums, payload.target)
+    indices = cached_result(
+        "two-sum", payload, lambda: two_sum_indices(payload.nums, payload.target)
+    )
     if not indices:
         raise HTTPException(status_code=404, detail="No valid pair found")
     return TwoSumResponse(indices=indices)
@@ -117,33 +578,116 @@ def api_two_sum(payload: TwoSumRequest) -> TwoSumResponse:
 
 @app.post("/algorithms/valid-parentheses", response_model=ParenthesesResponse)
 def api_valid_parentheses(payload: ParenthesesRequest) -> ParenthesesResponse:
-    return ParenthesesResponse(valid=is_valid_parentheses(payload.s))
+    valid = cached_result(
+        "valid-parentheses", payload, lambda: is_valid_parentheses(payload.s)
+    )
+    return ParenthesesResponse(valid=valid)
 
 
 @app.post("/algorithms/top-k-frequent", response_model=TopKResponse)
 def api_top_k(payload: TopKRequest) -> TopKResponse:
     if payload.k > len(payload.nums):
         raise HTTPException(status_code=400, detail="k cannot exceed number of items")
-    return TopKResponse(values=top_k_frequent(payload.nums, payload.k))
+    values = cached_result(
+        "top-k-frequent", payload, lambda: top_k_frequent(payload.nums, payload.k)
+    )
+    return TopKResponse(values=values)
+
+
+@app.post("/algorithms/two-sum/batch", response_model=TwoSumBatchResponse)
+async def api_two_sum_batch(payload: TwoSumBatchRequest) -> TwoSumBatchResponse:
+    # Unlike the single endpoint, a missing pair is an empty list rather than 404.
+    results = await run_cached_batch(
+        "two-sum",
+        payload.items,
+        solve_two_sum_batch,
+        lambda item: (item.nums, item.target),
+        lambda item: len(item.nums),
+    )
+    return TwoSumBatchResponse(
+        results=[TwoSumResponse(indices=indices) for indices in results]
+    )
+
+
+@app.post(
+    "/algorithms/valid-parentheses/batch", response_model=ParenthesesBatchResponse
+)
+async def api_valid_parentheses_batch(
+    payload: ParenthesesBatchRequest,
+) -> ParenthesesBatchResponse:
+    results = await run_cached_batch(
+        "valid-parentheses",
+        payload.items,
+        solve_parentheses_batch,
+        lambda item: item.s,
+        lambda item: len(item.s),
+    )
+    return ParenthesesBatchResponse(
+        results=[ParenthesesResponse(valid=valid) for valid in results]
+    )
+
+
+@app.post("/algorithms/top-k-frequent/batch", response_model=TopKBatchResponse)
+async def api_top_k_batch(payload: TopKBatchRequest) -> TopKBatchResponse:
+    for index, item in enumerate(payload.items):
+        if item.k > len(item.nums):
+            raise HTTPException(
+                status_code=400,
+                detail=f"items[{index}]: k cannot exceed number of items",
+            )
+    results = await run_cached_batch(
+        "top-k-frequent",
+        payload.items,
+        solve_top_k_batch,
+        lambda item: (item.nums, item.k),
+        lambda item: len(item.nums),
+    )
+    return TopKBatchResponse(
+        results=[TopKResponse(values=values) for values in results]
+    )
+
+
+@app.get("/metrics/latency", response_model=dict[str, RouteLatency])
+def api_latency() -> dict[str, RouteLatency]:
+    with LATENCY_LOCK:
+        return {
+            path: RouteLatency(
+                count=histogram.total,
+                p50_ms=round(histogram.percentile(0.50) * 1000, 3),
+                p99_ms=round(histogram.percentile(0.99) * 1000, 3),
+            )
+            for path, histogram in sorted(LATENCIES.items())
+        }
 
 
 @app.post("/practice/events", response_model=PracticeEventOut)
 def add_practice_event(payload: PracticeEvent) -> PracticeEventOut:
-    event = PracticeEventOut(id=len(EVENTS) + 1, **payload.model_dump())
-    EVENTS.append(event)
-    return event
+    return EVENTS.add(payload)
 
 
 @app.get("/practice/events", response_model=List[PracticeEventOut])
-def list_practice_events() -> List[PracticeEventOut]:
-    return EVENTS
+def list_practice_events(
+    after: int = Query(0, ge=0),
+    limit: int = Query(100, gt=0, le=1_000),
+    topic: Optional[str] = None,
+    difficulty: Optional[str] = None,
+) -> Response:
+    # Rows were encoded on insert; the page is joined as bytes, skipping model
+    # validation and serialisation. X-Next-Cursor is the `after` for the next page.
+    rows, next_cursor = EVENTS.page(after, limit, topic, difficulty)
+    headers = {} if next_cursor is None else {"X-Next-Cursor": str(next_cursor)}
+    return Response(
+        b"[" + b",".join(rows) + b"]", media_type="application/json", headers=headers
+    )
 
 
 @app.get("/practice/insights/top-topics", response_model=TopTopicsResponse)
-def api_top_topics(k: int = 3) -> TopTopicsResponse:
+def api_top_topics(
+    k: int = 3, window: Optional[Literal["hour", "day", "week"]] = None
+) -> TopTopicsResponse:
     if k <= 0:
         raise HTTPException(status_code=400, detail="k must be positive")
-    return TopTopicsResponse(topics=top_practiced_topics(k))
+    return TopTopicsResponse(topics=top_practiced_topics(k, window))
 
 
 @app.get("/practice/insights/minutes-pair", response_model=MinutesPairResponse)
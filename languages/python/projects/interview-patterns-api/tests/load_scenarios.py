@@ -0,0 +1,117 @@
+"""Load-test scenarios for the Interview Patterns API, used by ``../loadtest.py``."""
+
+from __future__ import annotations
+
+import random
+
+import final.app as api
+from loadtest import Request, RouteSpec
+
+app = api.app
+
+TOPICS = ["arrays", "strings", "hashing", "trees", "graphs", "dp", "heaps", "greedy"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+BATCH_ITEMS = 50
+
+
+def _two_sum(rng: random.Random) -> dict:
+    nums = [rng.randrange(-1_000, 1_000) for _ in range(100)]
+    i, j = rng.sample(range(len(nums)), 2)
+    return {"nums": nums, "target": nums[i] + nums[j]}
+
+
+def _parentheses(rng: random.Random) -> dict:
+    stack: list[str] = []
+    chars = []
+    for _ in range(100):
+        if stack and rng.random() < 0.5:
+            chars.append(stack.pop())
+        else:
+            opening, closing = rng.choice(["()", "[]", "{}"])
+            chars.append(opening)
+            stack.append(closing)
+    return {"s": "".join(chars + stack[::-1])}
+
+
+def _top_k(rng: random.Random) -> dict:
+    return {"nums": [rng.randrange(20) for _ in range(200)], "k": 3}
+
+
+def _event(rng: random.Random) -> dict:
+    return {
+        "topic": rng.choice(TOPICS),
+        "minutes": rng.randint(1, 120),
+        "difficulty": rng.choice(DIFFICULTIES),
+    }
+
+
+def _top_topics(rng: random.Random, _: int) -> Request:
+    window = rng.choice(["", "&window=hour", "&window=day", "&window=week"])
+    return Request("GET", f"/practice/insights/top-topics?k=3{window}")
+
+
+def _events_page(rng: random.Random, size: int) -> Request:
+    query = f"after={rng.randrange(size + 1)}&limit=100"
+    if rng.random() < 0.5:
+        query += f"&topic={rng.choice(TOPICS)}"
+    return Request("GET", f"/practice/events?{query}")
+
+
+def _single(path: str, make: object) -> RouteSpec:
+    return RouteSpec(
+        f"POST {path}", lambda rng, size: Request("POST", path, json=make(rng)), 2
+    )
+
+
+def _batch(path: str, make: object) -> RouteSpec:
+    return RouteSpec(
+        f"POST {path}/batch",
+        lambda rng, size: Request(
+            "POST",
+            f"{path}/batch",
+            json={"items": [make(rng) for _ in range(BATCH_ITEMS)]},
+        ),
+        0.5,
+    )
+
+
+ROUTES = [
+    RouteSpec("GET /health", lambda rng, size: Request("GET", "/health"), 0.5),
+    _single("/algorithms/two-sum", _two_sum),
+    _single("/algorithms/valid-parentheses", _parentheses),
+    _single("/algorithms/top-k-frequent", _top_k),
+    _batch("/algorithms/two-sum", _two_sum),
+    _batch("/algorithms/valid-parentheses", _parentheses),
+    _batch("/algorithms/top-k-frequent", _top_k),
+    RouteSpec(
+        "GET /metrics/latency",
+        lambda rng, size: Request("GET", "/metrics/latency"),
+        0.2,
+    ),
+    RouteSpec(
+        "POST /practice/events",
+        lambda rng, size: Request("POST", "/practice/events", json=_event(rng)),
+        3,
+    ),
+    RouteSpec("GET /practice/events", _events_page, 1),
+    RouteSpec("GET /practice/insights/top-topics", _top_topics, 2),
+    RouteSpec(
+        "GET /practice/insights/minutes-pair",
+        lambda rng, size: Request(
+            "GET",
+            f"/practice/insights/minutes-pair?target={rng.randint(2, 240)}",
+            expected=(200, 404),
+        ),
+        2,
+    ),
+]
+
+
+def seed(size: int) -> None:
+    api.EVENTS.clear()
+    api.RESPONSE_CACHE.clear()
+    api.LATENCIES.clear()
+
+    rng = random.Random(size)
+    for _ in range(size):
+        api.EVENTS.add(api.PracticeEvent(**_event(rng)))
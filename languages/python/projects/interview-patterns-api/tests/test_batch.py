@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+import final.app as api
+
+client = TestClient(api.app)
+
+
+def setup_function() -> None:
+    api.RESPONSE_CACHE.clear()
+    api.LATENCIES.clear()
+
+
+def test_two_sum_batch() -> None:
+    response = client.post(
+        "/algorithms/two-sum/batch",
+        json={
+            "items": [
+                {"nums": [2, 7, 11, 15], "target": 9},
+                {"nums": [1, 2, 3], "target": 999},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    assert response.json() == {"results": [{"indices": [0, 1]}, {"indices": []}]}
+
+
+def test_batch_results_are_cached_per_item() -> None:
+    items = [{"s": "()[]{}"}, {"s": "(]"}]
+    response = client.post("/algorithms/valid-parentheses/batch", json={"items": items})
+    assert response.json() == {"results": [{"valid": True}, {"valid": False}]}
+    assert api.RESPONSE_CACHE.misses == 2
+
+    client.post("/algorithms/valid-parentheses", json={"s": "(]"})
+    response = client.post(
+        "/algorithms/valid-parentheses/batch", json={"items": items[::-1]}
+    )
+    assert response.json() == {"results": [{"valid": False}, {"valid": True}]}
+    assert (api.RESPONSE_CACHE.hits, api.RESPONSE_CACHE.misses) == (3, 2)
+
+
+def test_top_k_batch_rejects_invalid_item() -> None:
+    response = client.post(
+        "/algorithms/top-k-frequent/batch",
+        json={"items": [{"nums": [1, 1, 2], "k": 1}, {"nums": [1], "k": 2}]},
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("items[1]")
+
+    response = client.post("/algorithms/top-k-frequent/batch", json={"items": []})
+    assert response.status_code == 422
+
+
+def test_large_batch_runs_in_worker_pool(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(api, "OFFLOAD_THRESHOLD", 10)
+    items = [{"nums": [i, i, i + 1], "k": 1} for i in range(20)]
+    try:
+        response = client.post(
+            "/algorithms/top-k-frequent/batch", json={"items": items}
+        )
+        assert api.WORKER_POOL is not None
+    finally:
+        api.shutdown_worker_pool()
+    assert response.json() == {"results": [{"values": [i]} for i in range(20)]}
+
+
+def test_single_large_item_runs_in_worker_pool(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(api, "OFFLOAD_THRESHOLD", 10)
+    try:
+        response = client.post(
+            "/algorithms/two-sum/batch",
+            json={"items": [{"nums": list(range(20)), "target": 37}]},
+        )
+        assert api.WORKER_POOL is not None
+    finally:
+        api.shutdown_worker_pool()
+    assert response.json() == {"results": [{"indices": [18, 19]}]}
+
+
+def test_small_batch_runs_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    solve = api.solve_parentheses_batch
+
+    def solver(items: list[str]) -> list[bool]:
+        with pytest.raises(RuntimeError):
+            asyncio.get_running_loop()
+        return solve(items)
+
+    monkeypatch.setattr(api, "solve_parentheses_batch", solver)
+    response = client.post(
+        "/algorithms/valid-parentheses/batch", json={"items": [{"s": "()"}]}
+    )
+    assert response.json() == {"results": [{"valid": True}]}
+
+
+def test_latency_metrics_per_route() -> None:
+    for _ in range(3):
+        client.post("/algorithms/two-sum", json={"nums": [2, 7], "target": 9})
+
+    metrics = client.get("/metrics/latency").json()
+    assert metrics["/algorithms/two-sum"]["count"] == 3
+    assert (
+        0
+        < metrics["/algorithms/two-sum"]["p50_ms"]
+        <= metrics["/algorithms/two-sum"]["p99_ms"]
+    )
@@ -103,3 +103,45 @@ def test_minutes_pair_not_found() -> None:
 def test_minutes_pair_bad_request() -> None:
     response = client.get("/practice/insights/minutes-pair?target=0")
     assert response.status_code == 400
+
+
+def test_practice_events_keyset_pagination() -> None:
+    for minutes in range(1, 6):
+        client.post(
+            "/practice/events",
+            json={"topic": "arrays", "minutes": minutes, "difficulty": "easy"},
+        )
+
+    response = client.get("/practice/events?limit=2")
+    assert [event["id"] for event in response.json()] == [1, 2]
+    assert response.headers["x-next-cursor"] == "2"
+
+    response = client.get("/practice/events?limit=2&after=4")
+    assert response.json() == [
+        {"topic": "arrays", "minutes": 5, "difficulty": "easy", "id": 5}
+    ]
+    assert "x-next-cursor" not in response.headers
+
+
+def test_practice_events_filters() -> None:
+    payloads = [
+        {"topic": "arrays", "minutes": 10, "difficulty": "easy"},
+        {"topic": "graphs", "minutes": 20, "difficulty": "medium"},
+        {"topic": "arrays", "minutes": 30, "difficulty": "medium"},
+        {"topic": "graphs", "minutes": 40, "difficulty": "easy"},
+        {"topic": "arrays", "minutes": 50, "difficulty": "medium"},
+    ]
+    for payload in payloads:
+        client.post("/practice/events", json=payload)
+
+    def ids(query: str) -> list[int]:
+        return [event["id"] for event in client.get(f"/practice/events?{query}").json()]
+
+    assert ids("topic=arrays") == [1, 3, 5]
+    assert ids("difficulty=easy") == [1, 4]
+    assert ids("topic=arrays&difficulty=medium") == [3, 5]
+    assert ids("topic=arrays&difficulty=medium&after=3") == [5]
+
+    response = client.get("/practice/events?topic=arrays&limit=1&after=1")
+    assert response.headers["x-next-cursor"] == "3"
+    assert client.get("/practice/events?limit=0").status_code == 422
@@ -0,0 +1,79 @@
+import random
+from collections import Counter
+
+import pytest
+from fastapi.testclient import TestClient
+
+import final.app as api
+
+client = TestClient(api.app)
+
+
+def setup_function() -> None:
+    api.EVENTS.clear()
+
+
+def test_incremental_insights_match_full_scan() -> None:
+    rng = random.Random(7)
+    minutes: list[int] = []
+    topics: list[str] = []
+
+    for _ in range(200):
+        event = api.PracticeEvent(
+            topic=rng.choice("abcde"), minutes=rng.randint(1, 20), difficulty="easy"
+        )
+        api.EVENTS.add(event)
+        minutes.append(event.minutes)
+        topics.append(event.topic)
+
+    for target in range(1, 45):
+        assert api.find_minutes_pair(target) == api.two_sum_indices(minutes, target)
+    for k in (1, 3, 5):
+        expected = [topic for topic, _ in Counter(topics).most_common(k)]
+        assert api.top_practiced_topics(k) == expected
+
+
+def test_minutes_pair_index_stays_linear() -> None:
+    rng = random.Random(11)
+    minutes = [rng.randint(1, api.MAX_EVENT_MINUTES) for _ in range(20_000)]
+    for value in minutes:
+        api.EVENTS.add(
+            api.PracticeEvent(topic="arrays", minutes=value, difficulty="easy")
+        )
+
+    index = api.EVENTS.minutes
+    assert len(index.positions) <= api.MAX_EVENT_MINUTES
+    assert sum(len(positions) for positions in index.positions.values()) == 20_000
+    for target in rng.sample(range(2, 2 * api.MAX_EVENT_MINUTES + 2), 50):
+        assert api.find_minutes_pair(target) == api.two_sum_indices(minutes, target)
+
+
+def test_minutes_are_capped_at_a_day() -> None:
+    response = client.post(
+        "/practice/events",
+        json={"topic": "arrays", "minutes": 24 * 60 + 1, "difficulty": "easy"},
+    )
+    assert response.status_code == 422
+
+
+def test_top_topics_time_windows(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [0.0]
+    monkeypatch.setattr(api.EVENTS, "clock", lambda: now[0])
+
+    for offset, topic in [(0, "graphs"), (0, "graphs"), (7_200, "arrays")]:
+        now[0] = offset
+        client.post(
+            "/practice/events",
+            json={"topic": topic, "minutes": 10, "difficulty": "easy"},
+        )
+
+    response = client.get("/practice/insights/top-topics?k=2&window=hour")
+    assert response.json() == {"topics": ["arrays"]}
+    response = client.get("/practice/insights/top-topics?k=2&window=day")
+    assert response.json() == {"topics": ["graphs", "arrays"]}
+
+    now[0] = 8 * 24 * 3_600
+    response = client.get("/practice/insights/top-topics?k=2&window=week")
+    assert response.json() == {"topics": []}
+    response = client.get("/practice/insights/top-topics?k=2&window=month")
+    assert response.status_code == 422
@@ -0,0 +1,39 @@
+import copy
+
+from loadtest import compare_to_baseline, missing_routes, run_load, write_report
+from tests.load_scenarios import ROUTES, app, seed
+
+
+def test_load_scenarios_cover_every_route():
+    assert missing_routes(app, ROUTES) == []
+
+
+def test_small_load_run_has_no_errors(tmp_path):
+    results = run_load(
+        app, ROUTES, seed, seed_sizes=[0, 50], requests=60, concurrency=4
+    )
+
+    assert [result.seed_size for result in results] == [0, 50]
+    for result in results:
+        assert result.requests == 60
+        assert set(result.routes) == {route.name for route in ROUTES}
+        for stats in result.routes.values():
+            assert stats.count >= 1
+            assert stats.errors == 0
+            assert stats.p50_ms <= stats.p95_ms <= stats.p99_ms
+
+    report = write_report(results, tmp_path / "load.json")
+    assert compare_to_baseline(report, report) == []
+
+    faster = copy.deepcopy(report)
+    for run in faster["runs"]:
+        run["throughput"] *= 10
+        for stats in run["routes"].values():
+            stats["p95_ms"] /= 10
+    slower = copy.deepcopy(report)
+    for run in slower["runs"]:
+        for stats in run["routes"].values():
+            stats["p95_ms"] = stats["p95_ms"] * 10 + 5
+    assert compare_to_baseline(report, faster)
+    assert compare_to_baseline(slower, report)
+    assert compare_to_baseline(report, slower) == []
@@ -6,12 +6,22 @@ Run:
 
 from __future__ import annotations
 
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import List
-
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+import heapq
+import itertools
+import json
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Protocol
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 app = FastAPI(title="Interview Prep Platform Capstone (Final)")
 
@@ -29,6 +39,12 @@ class AttemptOut(AttemptIn):
     id: int
 
 
+class AttemptBatchOut(BaseModel):
+    inserted: int
+    first_id: int
+    last_id: int
+
+
 class ProgressOut(BaseModel):
     user_id: int
     total_attempts: int
@@ -61,20 +77,359 @@ class AttemptRecord:
     minutes_spent: int
 
 
-ATTEMPTS: List[AttemptRecord] = []
+@dataclass
+class TopicTally:
+    attempts: int = 0
+    solved: int = 0
+
+
+@dataclass
+class UserStats:
+    """Running per-user aggregates, updated on every insert."""
+
+    total_attempts: int = 0
+    solved_attempts: int = 0
+    topics: dict[str, TopicTally] = field(default_factory=dict)
+
+
+class AttemptRepository(Protocol):
+    """Storage for attempts plus the per-user aggregates derived from them."""
+
+    def add(self, payload: AttemptIn) -> AttemptRecord: ...
+
+    def add_many(self, payloads: List[AttemptIn]) -> List[AttemptRecord]: ...
+
+    def iter_attempts(
+        self, after_id: int = 0, user_id: Optional[int] = None
+    ) -> Iterator[AttemptRecord]: ...
+
+    def user_stats(self, user_id: int) -> UserStats: ...
+
+    def clear(self) -> None: ...
+
+
+class InMemoryAttemptRepository:
+    def __init__(self) -> None:
+        self._records: List[AttemptRecord] = []
+        self._stats: dict[int, UserStats] = {}
+        self._lock = threading.Lock()
+
+    def add(self, payload: AttemptIn) -> AttemptRecord:
+        return self.add_many([payload])[0]
+
+    def add_many(self, payloads: List[AttemptIn]) -> List[AttemptRecord]:
+        with self._lock:
+            first_id = len(self._records) + 1
+            records = [
+                AttemptRecord(id=first_id + offset, **payload.model_dump())
+                for offset, payload in enumerate(payloads)
+            ]
+            self._records.extend(records)
+
+            for record in records:
+                stats = self._stats.setdefault(record.user_id, UserStats())
+                tally = stats.topics.setdefault(record.topic, TopicTally())
+                stats.total_attempts += 1
+                tally.attempts += 1
+                if record.solved:
+                    stats.solved_attempts += 1
+                    tally.solved += 1
+        return records
+
+    def iter_attempts(
+        self, after_id: int = 0, user_id: Optional[int] = None
+    ) -> Iterator[AttemptRecord]:
+        # Ids are list positions + 1, so the cursor is a direct index.
+        index = max(after_id, 0)
+        while index < len(self._records):
+            record = self._records[index]
+            index += 1
+            if user_id is None or record.user_id == user_id:
+                yield record
+
+    def user_stats(self, user_id: int) -> UserStats:
+        return self._stats.get(user_id) or UserStats()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+            self._stats.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+
+class SQLiteAttemptRepository:
+    """SQLite-backed attempts with aggregate tables maintained in the same
+    transaction as each insert.
+
+    Connections run in WAL mode so readers never block the writer, and are
+    pooled so request threads reuse them instead of reconnecting.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS attempts (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            problem_id TEXT NOT NULL,
+            topic TEXT NOT NULL,
+            difficulty TEXT NOT NULL,
+            solved INTEGER NOT NULL,
+            minutes_spent INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS attempts_by_user ON attempts (user_id, id);
+        CREATE TABLE IF NOT EXISTS user_stats (
+            user_id INTEGER PRIMARY KEY,
+            total_attempts INTEGER NOT NULL,
+            solved_attempts INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS user_topic_stats (
+            user_id INTEGER NOT NULL,
+            topic TEXT NOT NULL,
+            attempts INTEGER NOT NULL,
+            solved INTEGER NOT NULL,
+            PRIMARY KEY (user_id, topic)
+        ) WITHOUT ROWID;
+    """
+
+    COLUMNS = "id, user_id, problem_id, topic, difficulty, solved, minutes_spent"
+
+    def __init__(self, path: str, pool_size: int = 8, page_size: int = 1000) -> None:
+        self.path = path
+        self.page_size = page_size
+        self._pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        with self._connection() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        with self._slots:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                conn = self._connect()
+            try:
+                yield conn
+            finally:
+                self._pool.put(conn)
+
+    def add(self, payload: AttemptIn) -> AttemptRecord:
+        return self.add_many([payload])[0]
+
+    def add_many(self, payloads: List[AttemptIn]) -> List[AttemptRecord]:
+        if not payloads:
+            return []
+
+        rows = [payload.model_dump() for payload in payloads]
+        user_deltas: dict[int, list[int]] = {}
+        topic_deltas: dict[tuple[int, str], list[int]] = {}
+        for row in rows:
+            solved = int(row["solved"])
+            user_delta = user_deltas.setdefault(row["user_id"], [0, 0])
+            user_delta[0] += 1
+            user_delta[1] += solved
+            topic_delta = topic_deltas.setdefault(
+                (row["user_id"], row["topic"]), [0, 0]
+            )
+            topic_delta[0] += 1
+            topic_delta[1] += solved
+
+        with self._connection() as conn, conn:
+            # Take the write lock up front so the new ids are contiguous.
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                "INSERT INTO attempts (user_id, problem_id, topic, difficulty, solved,"
+                " minutes_spent) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        row["user_id"],
+                        row["problem_id"],
+                        row["topic"],
+                        row["difficulty"],
+                        int(row["solved"]),
+                        row["minutes_spent"],
+                    )
+                    for row in rows
+                ],
+            )
+            last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+            conn.executemany(
+                "INSERT INTO user_stats VALUES (?, ?, ?) ON CONFLICT(user_id) DO UPDATE"
+                " SET total_attempts = total_attempts + excluded.total_attempts,"
+                " solved_attempts = solved_attempts + excluded.solved_attempts",
+                [(user_id, *delta) for user_id, delta in user_deltas.items()],
+            )
+            conn.executemany(
+                "INSERT INTO user_topic_stats VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(user_id, topic) DO UPDATE"
+                " SET attempts = attempts + excluded.attempts,"
+                " solved = solved + excluded.solved",
+                [(*key, *delta) for key, delta in topic_deltas.items()],
+            )
+
+        first_id = last_id - len(rows) + 1
+        return [
+            AttemptRecord(id=first_id + offset, **row)
+            for offset, row in enumerate(rows)
+        ]
+
+    def iter_attempts(
+        self, after_id: int = 0, user_id: Optional[int] = None
+    ) -> Iterator[AttemptRecord]:
+        # Keyset pagination: each page is an index range scan starting after the
+        # last id seen, and no connection is held between pages.
+        if user_id is None:
+            sql = (
+                f"SELECT {self.COLUMNS} FROM attempts WHERE id > ? ORDER BY id LIMIT ?"
+            )
+            params: tuple[int, ...] = ()
+        else:
+            sql = (
+                f"SELECT {self.COLUMNS} FROM attempts WHERE user_id = ? AND id > ?"
+                " ORDER BY id LIMIT ?"
+            )
+            params = (user_id,)
+
+        while True:
+            with self._connection() as conn:
+                rows = conn.execute(sql, (*params, after_id, self.page_size)).fetchall()
+            for row in rows:
+                yield AttemptRecord(
+                    id=row[0],
+                    user_id=row[1],
+                    problem_id=row[2],
+                    topic=row[3],
+                    difficulty=row[4],
+                    solved=bool(row[5]),
+                    minutes_spent=row[6],
+                )
+            if len(rows) < self.page_size:
+                return
+            after_id = rows[-1][0]
+
+    def user_stats(self, user_id: int) -> UserStats:
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT total_attempts, solved_attempts FROM user_stats"
+                " WHERE user_id = ?",
+                (user_id,),
+            ).fetchone()
+            if row is None:
+                return UserStats()
+            topics = conn.execute(
+                "SELECT topic, attempts, solved FROM user_topic_stats"
+                " WHERE user_id = ?",
+                (user_id,),
+            ).fetchall()
+        return UserStats(
+            total_attempts=row[0],
+            solved_attempts=row[1],
+            topics={
+                topic: TopicTally(attempts, solved)
+                for topic, attempts, solved in topics
+            },
+        )
+
+    def clear(self) -> None:
+        with self._connection() as conn, conn:
+            conn.execute("DELETE FROM attempts")
+            conn.execute("DELETE FROM user_stats")
+            conn.execute("DELETE FROM user_topic_stats")
+            conn.execute("DELETE FROM sqlite_sequence WHERE name = 'attempts'")
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def build_repository(database_path: Optional[str] = None) -> AttemptRepository:
+    if database_path:
+        return SQLiteAttemptRepository(database_path)
+    return InMemoryAttemptRepository()
+
+
+# Set CAPSTONE_DATABASE to a file path to persist attempts in SQLite.
+ATTEMPTS: AttemptRepository = build_repository(os.environ.get("CAPSTONE_DATABASE"))
 STUDY_PLANS: dict[int, StudyPlanOut] = {}
 
+MAX_BATCH_SIZE = 50_000
+EXPORT_CHUNK_ROWS = 1_000
+NDJSON_MEDIA_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+_ATTEMPT_LIST = TypeAdapter(List[AttemptIn])
+
 
 def create_attempt(payload: AttemptIn) -> AttemptOut:
-    record = AttemptRecord(id=len(ATTEMPTS) + 1, **payload.model_dump())
-    ATTEMPTS.append(record)
+    record = ATTEMPTS.add(payload)
     return AttemptOut(**record.__dict__)
 
 
+def parse_attempt_batch(body: bytes, content_type: str) -> List[AttemptIn]:
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type not in NDJSON_MEDIA_TYPES:
+        try:
+            return _ATTEMPT_LIST.validate_json(body)
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [
+                    {**error, "loc": ("body", *error["loc"])}
+                    for error in exc.errors(include_url=False, include_context=False)
+                ]
+            ) from None
+
+    # NDJSON: one attempt per line; errors are reported by 1-based line number.
+    payloads = []
+    errors = []
+    for line_number, line in enumerate(body.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            payloads.append(AttemptIn.model_validate_json(line))
+        except ValidationError as exc:
+            errors.extend(
+                {**error, "loc": ("body", line_number, *error["loc"])}
+                for error in exc.errors(include_url=False, include_context=False)
+            )
+    if errors:
+        raise RequestValidationError(errors)
+    return payloads
+
+
+def create_attempts(payloads: List[AttemptIn]) -> AttemptBatchOut:
+    records = ATTEMPTS.add_many(payloads)
+    return AttemptBatchOut(
+        inserted=len(records), first_id=records[0].id, last_id=records[-1].id
+    )
+
+
+def export_attempts(
+    after_id: int = 0, limit: Optional[int] = None, user_id: Optional[int] = None
+) -> Iterator[bytes]:
+    # Rows stream as NDJSON in id order; clients resume from the last id seen.
+    records = itertools.islice(ATTEMPTS.iter_attempts(after_id, user_id), limit)
+    while True:
+        chunk = [
+            json.dumps(record.__dict__, separators=(",", ":"))
+            for record in itertools.islice(records, EXPORT_CHUNK_ROWS)
+        ]
+        if not chunk:
+            return
+        yield ("\n".join(chunk) + "\n").encode("utf-8")
+
+
 def build_progress(user_id: int) -> ProgressOut:
-    user_attempts = [attempt for attempt in ATTEMPTS if attempt.user_id == user_id]
-    total = len(user_attempts)
-    solved = sum(1 for attempt in user_attempts if attempt.solved)
+    stats = ATTEMPTS.user_stats(user_id)
+    total = stats.total_attempts
+    solved = stats.solved_attempts
     rate = round((solved / total), 3) if total else 0.0
     return ProgressOut(
         user_id=user_id,
@@ -85,21 +440,12 @@ def build_progress(user_id: int) -> ProgressOut:
 
 
 def recommend_topics(user_id: int, top_k: int = 3) -> RecommendationOut:
-    user_attempts = [attempt for attempt in ATTEMPTS if attempt.user_id == user_id]
-    if not user_attempts:
-        return RecommendationOut(user_id=user_id, recommended_topics=[])
-
-    topic_stats: dict[str, list[bool]] = defaultdict(list)
-    for attempt in user_attempts:
-        topic_stats[attempt.topic].append(attempt.solved)
-
-    ranking = []
-    for topic, outcomes in topic_stats.items():
-        solved_ratio = sum(1 for outcome in outcomes if outcome) / len(outcomes)
-        ranking.append((solved_ratio, -len(outcomes), topic))
-
-    ranking.sort()
-    topics = [topic for _, _, topic in ranking[:top_k]]
+    stats = ATTEMPTS.user_stats(user_id)
+    ranking = [
+        (tally.solved / tally.attempts, -tally.attempts, topic)
+        for topic, tally in stats.topics.items()
+    ]
+    topics = [topic for _, _, topic in heapq.nsmallest(top_k, ranking)]
     return RecommendationOut(user_id=user_id, recommended_topics=topics)
 
 
@@ -119,6 +465,31 @@ def api_create_attempt(payload: AttemptIn) -> AttemptOut:
     return create_attempt(payload)
 
 
+@app.post("/attempts/batch", response_model=AttemptBatchOut)
+async def api_create_attempts(request: Request) -> AttemptBatchOut:
+    payloads = parse_attempt_batch(
+        await request.body(), request.headers.get("content-type", "")
+    )
+    if not payloads:
+        raise HTTPException(status_code=400, detail="batch cannot be empty")
+    if len(payloads) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413, detail=f"batch exceeds {MAX_BATCH_SIZE} attempts"
+        )
+    return await run_in_threadpool(create_attempts, payloads)
+
+
+@app.get("/attempts/export")
+def api_export_attempts(
+    after: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, gt=0),
+    user_id: Optional[int] = None,
+) -> StreamingResponse:
+    return StreamingResponse(
+        export_attempts(after, limit, user_id), media_type="application/x-ndjson"
+    )
+
+
 @app.get("/progress/{user_id}", response_model=ProgressOut)
 def api_get_progress(user_id: int) -> ProgressOut:
     return build_progress(user_id)
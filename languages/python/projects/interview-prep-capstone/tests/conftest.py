@@ -5,3 +5,5 @@ from pathlib import Path
 
 # Add parent directory to path so 'final' module is importable
 sys.path.insert(0, str(Path(__file__).parent.parent))
+# And the projects directory, for the shared load test harness in loadtest.py
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
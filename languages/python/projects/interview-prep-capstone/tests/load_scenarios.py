@@ -0,0 +1,84 @@
+"""Load-test scenarios for the capstone API, used by ``../loadtest.py``."""
+
+from __future__ import annotations
+
+import json
+import random
+
+import final.app as api
+from loadtest import Request, RouteSpec
+
+app = api.app
+
+USERS = 1_000
+TOPICS = ["arrays", "strings", "hashing", "trees", "graphs", "dp", "heaps", "greedy"]
+DIFFICULTIES = ["easy", "medium", "hard"]
+SEED_CHUNK = 10_000
+
+
+def _attempt(rng: random.Random) -> dict:
+    return {
+        "user_id": rng.randrange(USERS),
+        "problem_id": f"{rng.randrange(1, 36):02d}-problem",
+        "topic": rng.choice(TOPICS),
+        "difficulty": rng.choice(DIFFICULTIES),
+        "solved": rng.random() < 0.6,
+        "minutes_spent": rng.randint(5, 90),
+    }
+
+
+def _batch(rng: random.Random, _: int) -> Request:
+    body = "\n".join(json.dumps(_attempt(rng)) for _ in range(100))
+    return Request(
+        "POST",
+        "/attempts/batch",
+        content=body.encode(),
+        headers={"content-type": "application/x-ndjson"},
+    )
+
+
+def _study_plan(rng: random.Random, _: int) -> Request:
+    return Request(
+        "POST",
+        f"/study-plan/{rng.randrange(USERS)}",
+        json={"focus_topics": rng.sample(TOPICS, 2), "sessions_per_week": 3},
+    )
+
+
+ROUTES = [
+    RouteSpec("GET /health", lambda rng, size: Request("GET", "/health"), 0.5),
+    RouteSpec(
+        "POST /attempts",
+        lambda rng, size: Request("POST", "/attempts", json=_attempt(rng)),
+        4,
+    ),
+    RouteSpec("POST /attempts/batch", _batch, 0.2),
+    RouteSpec(
+        "GET /attempts/export",
+        lambda rng, size: Request(
+            "GET", f"/attempts/export?after={rng.randrange(size + 1)}&limit=100"
+        ),
+        0.5,
+    ),
+    RouteSpec(
+        "GET /progress/{user_id}",
+        lambda rng, size: Request("GET", f"/progress/{rng.randrange(USERS)}"),
+        4,
+    ),
+    RouteSpec(
+        "GET /recommendations/{user_id}",
+        lambda rng, size: Request("GET", f"/recommendations/{rng.randrange(USERS)}"),
+        3,
+    ),
+    RouteSpec("POST /study-plan/{user_id}", _study_plan, 1),
+]
+
+
+def seed(size: int) -> None:
+    api.ATTEMPTS.clear()
+    api.STUDY_PLANS.clear()
+
+    rng = random.Random(size)
+    for start in range(0, size, SEED_CHUNK):
+        count = min(SEED_CHUNK, size - start)
+        api.ATTEMPTS.add_many([api.AttemptIn(**_attempt(rng)) for _ in range(count)])
@@ -0,0 +1,142 @@
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+import final.app as api
+
+client = TestClient(api.app)
+
+EVENTS = [
+    ("arrays", True),
+    ("arrays", True),
+    ("graphs", False),
+    ("graphs", True),
+    ("dp", False),
+    ("trees", True),
+]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repository(request, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    if request.param == "sqlite":
+        repo = api.SQLiteAttemptRepository(str(tmp_path / "capstone.db"))
+    else:
+        repo = api.InMemoryAttemptRepository()
+    monkeypatch.setattr(api, "ATTEMPTS", repo)
+    yield repo
+    if request.param == "sqlite":
+        repo.close()
+
+
+def test_aggregates_match_across_backends(repository) -> None:
+    for index, (topic, solved) in enumerate(EVENTS):
+        response = client.post(
+            "/attempts",
+            json={
+                "user_id": 1,
+                "problem_id": f"problem-{index}",
+                "topic": topic,
+                "difficulty": "medium",
+                "solved": solved,
+                "minutes_spent": 10,
+            },
+        )
+        assert response.json()["id"] == index + 1
+
+    assert client.get("/progress/1").json() == {
+        "user_id": 1,
+        "total_attempts": 6,
+        "solved_attempts": 4,
+        "solve_rate": 0.667,
+    }
+    assert client.get("/recommendations/1").json() == {
+        "user_id": 1,
+        "recommended_topics": ["dp", "graphs", "arrays"],
+    }
+    assert client.get("/progress/2").json()["total_attempts"] == 0
+
+
+def test_sqlite_aggregates_persist(tmp_path: Path) -> None:
+    path = str(tmp_path / "capstone.db")
+    payload = api.AttemptIn(
+        user_id=7,
+        problem_id="01-two-sum",
+        topic="arrays",
+        difficulty="easy",
+        solved=False,
+        minutes_spent=5,
+    )
+
+    repo = api.SQLiteAttemptRepository(path)
+    repo.add(payload)
+    repo.close()
+
+    reopened = api.SQLiteAttemptRepository(path)
+    stats = reopened.user_stats(7)
+    assert (stats.total_attempts, stats.solved_attempts) == (1, 0)
+    assert stats.topics == {"arrays": api.TopicTally(attempts=1, solved=0)}
+
+    reopened.clear()
+    assert reopened.user_stats(7) == api.UserStats()
+    reopened.close()
+
+
+def _attempt(user_id: int, index: int, solved: bool = True) -> dict:
+    return {
+        "user_id": user_id,
+        "problem_id": f"problem-{index}",
+        "topic": "arrays",
+        "difficulty": "easy",
+        "solved": solved,
+        "minutes_spent": 5,
+    }
+
+
+def test_batch_insert_and_export(repository) -> None:
+    response = client.post(
+        "/attempts/batch", json=[_attempt(1, i, i % 2 == 0) for i in range(10)]
+    )
+    assert response.json() == {"inserted": 10, "first_id": 1, "last_id": 10}
+
+    ndjson = "\n".join(json.dumps(_attempt(2, i)) for i in range(5)) + "\n"
+    response = client.post(
+        "/attempts/batch",
+        content=ndjson,
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert response.json() == {"inserted": 5, "first_id": 11, "last_id": 15}
+    assert client.get("/progress/1").json()["solved_attempts"] == 5
+
+    response = client.get("/attempts/export", params={"after": 8, "limit": 4})
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [9, 10, 11, 12]
+
+    response = client.get("/attempts/export", params={"user_id": 2, "after": 12})
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [
+        13,
+        14,
+        15,
+    ]
+
+
+def test_batch_is_all_or_nothing(repository) -> None:
+    ndjson = "\n".join(
+        [json.dumps(_attempt(1, 0)), json.dumps({**_attempt(1, 1), "minutes_spent": 0})]
+    )
+    response = client.post(
+        "/attempts/batch",
+        content=ndjson,
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", 2, "minutes_spent"]
+
+    response = client.post("/attempts/batch", json=[_attempt(1, 0), {"user_id": 1}])
+    assert response.status_code == 422
+    assert client.post("/attempts/batch", json=[]).status_code == 400
+
+    assert client.get("/progress/1").json()["total_attempts"] == 0
+    assert client.get("/attempts/export").text == ""
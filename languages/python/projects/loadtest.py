@@ -0,0 +1,340 @@
+"""In-process load generator for the FastAPI projects.
+
+Drives a project's ASGI app directly through ``httpx.ASGITransport`` (no sockets,
+no server), with a weighted mix of requests over every route and a configurable
+number of concurrent clients. Each run is repeated at several data sizes so you
+can see how latency scales with the amount of stored data, and the JSON report
+can be compared against a saved baseline to fail CI on regressions.
+
+Every project with a ``tests/load_scenarios.py`` can be load tested. That module
+provides ``app``, ``ROUTES`` (a list of ``RouteSpec``) and ``seed(size)``, which
+resets the app's stores and fills them with ``size`` records.
+
+Usage:
+    python loadtest.py interview-patterns-api
+    python loadtest.py interview-prep-capstone --seed-sizes 0,10000,100000 \\
+        --concurrency 32 --requests 5000 --output capstone_load.json
+    python loadtest.py interview-prep-capstone --mix "GET /progress/{user_id}=5" \\
+        --baseline capstone_load.json --tolerance 0.5
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import json
+import math
+import platform
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Iterable, Sequence
+
+import httpx
+
+PROJECTS_DIR = Path(__file__).resolve().parent
+DEFAULT_SEED_SIZES = (0, 1_000, 10_000)
+# Latency increases smaller than this are treated as noise by the regression gate.
+MIN_REGRESSION_MS = 0.5
+
+
+@dataclass
+class Request:
+    method: str
+    url: str
+    json: Any = None
+    content: bytes | None = None
+    headers: dict[str, str] | None = None
+    expected: tuple[int, ...] = (200,)
+
+
+@dataclass
+class RouteSpec:
+    name: str  # "<METHOD> <path template>", e.g. "GET /progress/{user_id}"
+    build: Callable[[random.Random, int], Request]
+    weight: float = 1.0
+
+
+@dataclass
+class RouteStats:
+    count: int
+    errors: int
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+@dataclass
+class LoadResult:
+    seed_size: int
+    requests: int
+    concurrency: int
+    duration: float
+    throughput: float
+    routes: dict[str, RouteStats] = field(default_factory=dict)
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    # Nearest-rank percentile.
+    rank = max(1, math.ceil(q * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    mix = {}
+    for part in text.split(","):
+        if part.strip():
+            name, _, weight = part.rpartition("=")
+            mix[name.strip()] = float(weight)
+    return mix
+
+
+def apply_mix(routes: Sequence[RouteSpec], mix: dict[str, float]) -> list[RouteSpec]:
+    unknown = set(mix) - {route.name for route in routes}
+    if unknown:
+        raise ValueError(f"Unknown routes in mix: {', '.join(sorted(unknown))}")
+    return [
+        RouteSpec(route.name, route.build, mix.get(route.name, route.weight))
+        for route in routes
+    ]
+
+
+def missing_routes(app: Any, routes: Iterable[RouteSpec]) -> list[str]:
+    covered = {route.name for route in routes}
+    found = []
+    for route in app.routes:
+        if not getattr(route, "include_in_schema", False):
+            continue
+        for method in sorted(getattr(route, "methods", ())):
+            name = f"{method} {route.path}"
+            if name not in covered:
+                found.append(name)
+    return found
+
+
+async def _run(
+    app: Any,
+    routes: Sequence[RouteSpec],
+    seed_size: int,
+    requests: int,
+    concurrency: int,
+    rng: random.Random,
+) -> LoadResult:
+    active = [route for route in routes if route.weight > 0]
+    # Every active route runs at least once; the rest follows the weights.
+    schedule = active + rng.choices(
+        active,
+        weights=[route.weight for route in active],
+        k=max(0, requests - len(active)),
+    )
+    rng.shuffle(schedule)
+    # Build every request up front so payload generation is not timed.
+    plan = iter([(route.name, route.build(rng, seed_size)) for route in schedule])
+
+    samples: dict[str, list[float]] = {route.name: [] for route in active}
+    errors: Counter[str] = Counter()
+    transport = httpx.ASGITransport(app=app)
+
+    async with app.router.lifespan_context(app), httpx.AsyncClient(
+        transport=transport, base_url="http://loadtest"
+    ) as client:
+
+        async def worker() -> None:
+            for name, request in plan:
+                start = time.perf_counter()
+                response = await client.request(
+                    request.method,
+                    request.url,
+                    json=request.json,
+                    content=request.content,
+                    headers=request.headers,
+                )
+                await response.aread()
+                samples[name].append(time.perf_counter() - start)
+                if response.status_code not in request.expected:
+                    errors[name] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        duration = time.perf_counter() - started
+
+    result = LoadResult(
+        seed_size=seed_size,
+        requests=len(schedule),
+        concurrency=concurrency,
+        duration=round(duration, 4),
+        throughput=round(len(schedule) / duration, 1) if duration else 0.0,
+    )
+    for name, timings in samples.items():
+        timings.sort()
+        result.routes[name] = RouteStats(
+            count=len(timings),
+            errors=errors[name],
+            mean_ms=round(sum(timings) / len(timings) * 1000, 3),
+            p50_ms=round(percentile(timings, 0.50) * 1000, 3),
+            p95_ms=round(percentile(timings, 0.95) * 1000, 3),
+            p99_ms=round(percentile(timings, 0.99) * 1000, 3),
+        )
+    return result
+
+
+def run_load(
+    app: Any,
+    routes: Sequence[RouteSpec],
+    seed: Callable[[int], None],
+    seed_sizes: Iterable[int] = DEFAULT_SEED_SIZES,
+    requests: int = 2_000,
+    concurrency: int = 16,
+    mix: dict[str, float] | None = None,
+    rng_seed: int = 0,
+) -> list[LoadResult]:
+    if mix:
+        routes = apply_mix(routes, mix)
+
+    results = []
+    for seed_size in seed_sizes:
+        seed(seed_size)
+        rng = random.Random(f"{rng_seed}:{seed_size}")
+        results.append(
+            asyncio.run(_run(app, routes, seed_size, requests, concurrency, rng))
+        )
+    return results
+
+
+def write_report(
+    results: Sequence[LoadResult], output: Path, project: str = ""
+) -> dict[str, Any]:
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "project": project,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": [asdict(result) for result in results],
+    }
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    return report
+
+
+def compare_to_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.5,
+    metric: str = "p95_ms",
+) -> list[str]:
+    regressions = []
+    baseline_runs = {run["seed_size"]: run for run in baseline["runs"]}
+
+    for run in report["runs"]:
+        before = baseline_runs.get(run["seed_size"])
+        if before is None:
+            continue
+
+        size = run["seed_size"]
+        if run["throughput"] * (1 + tolerance) < before["throughput"]:
+            regressions.append(
+                f"seed {size}: throughput {run['throughput']} req/s"
+                f" < baseline {before['throughput']} req/s"
+            )
+        for name, stats in run["routes"].items():
+            previous = before["routes"].get(name)
+            if previous is None:
+                continue
+            now, then = stats[metric], previous[metric]
+            if now > then * (1 + tolerance) and now - then > MIN_REGRESSION_MS:
+                regressions.append(
+                    f"seed {size}: {name} {metric} {now}ms > baseline {then}ms"
+                )
+            if stats["errors"] > previous["errors"]:
+                regressions.append(
+                    f"seed {size}: {name} errors {stats['errors']}"
+                    f" > baseline {previous['errors']}"
+                )
+    return regressions
+
+
+def load_scenarios(project: str) -> ModuleType:
+    project_dir = Path(project)
+    if not project_dir.is_dir():
+        project_dir = PROJECTS_DIR / project
+    sys.path.insert(0, str(project_dir.resolve()))
+    return importlib.import_module("tests.load_scenarios")
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Load test a FastAPI project in-process"
+    )
+    parser.add_argument("project", help="Project name or directory")
+    parser.add_argument("--requests", "-n", type=int, default=2_000)
+    parser.add_argument("--concurrency", "-c", type=int, default=16)
+    parser.add_argument(
+        "--seed-sizes",
+        default=",".join(str(size) for size in DEFAULT_SEED_SIZES),
+        help="Comma-separated numbers of records to preload before each run",
+    )
+    parser.add_argument(
+        "--mix", default="", help='Route weights, e.g. "GET /health=0,POST /attempts=5"'
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", "-o", type=Path, default=Path("load_report.json"))
+    parser.add_argument("--baseline", type=Path, help="Earlier report to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed relative slowdown before a route counts as regressed",
+    )
+    args = parser.parse_args()
+
+    scenarios = load_scenarios(args.project)
+    uncovered = missing_routes(scenarios.app, scenarios.ROUTES)
+    if uncovered:
+        print(f"warning: no load scenario for {', '.join(uncovered)}")
+
+    results = run_load(
+        scenarios.app,
+        scenarios.ROUTES,
+        scenarios.seed,
+        seed_sizes=[int(size) for size in args.seed_sizes.split(",") if size],
+        requests=args.requests,
+        concurrency=args.concurrency,
+        mix=parse_mix(args.mix),
+        rng_seed=args.seed,
+    )
+    report = write_report(results, args.output, project=Path(args.project).name)
+
+    for result in results:
+        print(
+            f"\nseed {result.seed_size}: {result.requests} requests in"
+            f" {result.duration:.2f}s ({result.throughput} req/s)"
+        )
+        for name, stats in sorted(result.routes.items()):
+            print(
+                f"  {name:<45} n={stats.count:<5} err={stats.errors:<3}"
+                f" p50 {stats.p50_ms:>8.3f}  p95 {stats.p95_ms:>8.3f}"
+                f"  p99 {stats.p99_ms:>8.3f} ms"
+            )
+    print(f"\nReport written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+"""Append-only record log shared by the small CLI projects.
+
+Stores records keyed by integer ids as JSON lines. Every change appends one
+line (a new version of a record, or a tombstone for a removal) instead of
+rewriting the whole file, so adding, updating or removing a single record
+costs the same no matter how many records the log holds.
+
+On disk a log ``sessions.log`` is three files:
+
+- ``sessions.log``: a fixed-width JSON header with the generation and the
+  next id to hand out (rewritten in place), then one JSON line per change.
+- ``sessions.log.idx``: the byte offset of each record's latest line, in
+  8-byte slots addressed by id. It is a cache: if it is missing, or older
+  than the log after a crash, it is rebuilt or caught up from the log.
+- ``sessions.log.lock``: held exclusively for the duration of every operation,
+  or of a whole ``with log.locked():`` block.
+
+Once superseded lines and tombstones outnumber live records the log is
+compacted on a background thread: live records are copied into a new
+generation that atomically replaces the old files.
+
+Usage:
+    log = RecordLog(Path("sessions.log"), legacy_path=Path("sessions.json"))
+    record_id = log.add({"topic": "arrays", "minutes": 45})
+    log.update(record_id, {"topic": "arrays", "minutes": 50})
+    log.delete(record_id)
+    for record_id, data in log.items():
+        ...
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+HEADER_SIZE = 64
+INDEX_HEADER = struct.Struct("<4Q")  # generation, log bytes indexed, live, dead
+SLOT = struct.Struct("<Q")
+# Compact once dead lines outnumber live records and there are at least this many.
+COMPACT_MIN_DEAD = 1_000
+
+
+def _encode(entry: dict[str, Any]) -> bytes:
+    return json.dumps(entry, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def _encode_header(generation: int, next_id: int) -> bytes:
+    header = json.dumps({"generation": generation, "next_id": next_id})
+    return header.ljust(HEADER_SIZE - 1).encode("utf-8") + b"\n"
+
+
+@dataclass
+class _State:
+    generation: int = 0
+    indexed: int = HEADER_SIZE
+    live: int = 0
+    dead: int = 0
+    next_id: int = 1
+
+
+class RecordLog:
+    """Integer-keyed records persisted as an append-only JSON lines log."""
+
+    def __init__(
+        self,
+        path: Path,
+        legacy_path: Path | None = None,
+        compact_min_dead: int = COMPACT_MIN_DEAD,
+    ):
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.compact_min_dead = compact_min_dead
+        self._compaction: threading.Thread | None = None
+        # Serializes threads of this process; the lock file serializes processes.
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+
+        with self.locked():
+            if not self.path.exists():
+                records = {}
+                if legacy_path is not None and Path(legacy_path).exists():
+                    # Import a JSON array of ``{"id": ..., ...}`` rows.
+                    rows = json.loads(Path(legacy_path).read_text(encoding="utf-8"))
+                    records = {row.pop("id"): row for row in rows}
+                next_id = max(records, default=0) + 1
+                self._write_generation(records.items(), 0, next_id)
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the log's exclusive lock for the duration of the block.
+
+        Reentrant for the calling thread, so callers can wrap several
+        operations (and their own files derived from the log) in one block.
+        """
+        with self._thread_lock:
+            self._lock_depth += 1
+            try:
+                if self._lock_depth > 1:
+                    yield
+                else:
+                    with self._file_locked():
+                        yield
+            finally:
+                self._lock_depth -= 1
+
+    @contextmanager
+    def _file_locked(self) -> Iterator[None]:
+        """Hold an exclusive inter-process lock for the duration of the block."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a+b") as handle:
+            if sys.platform == "win32":
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if sys.platform == "win32":
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    @contextmanager
+    def _open(self) -> Iterator[tuple[BinaryIO, BinaryIO, _State]]:
+        """Lock, open the log and index, and bring the index up to date."""
+        with self.locked():
+            self.index_path.touch()
+            with open(self.path, "r+b") as log, open(self.index_path, "r+b") as index:
+                header = json.loads(log.read(HEADER_SIZE))
+                state = _State(header["generation"], next_id=header["next_id"])
+
+                raw = index.read(INDEX_HEADER.size)
+                if len(raw) == INDEX_HEADER.size:
+                    generation, indexed, live, dead = INDEX_HEADER.unpack(raw)
+                    if generation == state.generation:
+                        state.indexed, state.live, state.dead = indexed, live, dead
+                if state.indexed == HEADER_SIZE:
+                    # Missing or from another generation: rebuild from the log.
+                    index.truncate(0)
+
+                self._catch_up(log, index, state)
+                yield log, index, state
+
+    def _catch_up(self, log: BinaryIO, index: BinaryIO, state: _State) -> None:
+        """Index any log lines written after the index was last saved."""
+        log.seek(0, os.SEEK_END)
+        log_size = log.tell()
+        if state.indexed > log_size:
+            # The index is ahead of a log that was replaced; start over.
+            index.truncate(0)
+            state.indexed, state.live, state.dead = HEADER_SIZE, 0, 0
+        if state.indexed == log_size:
+            return
+
+        next_id = state.next_id
+        log.seek(state.indexed)
+        offset = state.indexed
+        for line in log:
+            if not line.endswith(b"\n"):
+                break  # torn tail from an interrupted write
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            self._index_entry(index, state, entry, offset)
+            next_id = max(next_id, entry["id"] + 1)
+            offset += len(line)
+
+        if offset != log_size:
+            log.truncate(offset)
+        if next_id != state.next_id:
+            state.next_id = next_id
+            log.seek(0)
+            log.write(_encode_header(state.generation, next_id))
+        state.indexed = offset
+        self._save_index_header(index, state)
+
+    @staticmethod
+    def _read_slot(index: BinaryIO, record_id: int) -> int:
+        index.seek(INDEX_HEADER.size + record_id * SLOT.size)
+        raw = index.read(SLOT.size)
+        return SLOT.unpack(raw)[0] if len(raw) == SLOT.size else 0
+
+    @staticmethod
+    def _write_slot(index: BinaryIO, record_id: int, offset: int) -> None:
+        index.seek(INDEX_HEADER.size + record_id * SLOT.size)
+        index.write(SLOT.pack(offset))
+
+    @staticmethod
+    def _save_index_header(index: BinaryIO, state: _State) -> None:
+        index.seek(0)
+        index.write(
+            INDEX_HEADER.pack(state.generation, state.indexed, state.live, state.dead)
+        )
+
+    def _index_entry(
+        self, index: BinaryIO, state: _State, entry: dict[str, Any], offset: int
+    ) -> None:
+        """Point the index at a log line and update the live/dead counts."""
+        record_id = entry["id"]
+        existed = int(self._read_slot(index, record_id) != 0)
+        if entry.get("deleted"):
+            # The tombstone and the version it hides are both dead weight.
+            self._write_slot(index, record_id, 0)
+            state.live -= existed
+            state.dead += 1 + existed
+        else:
+            self._write_slot(index, record_id, offset)
+            state.live += 1 - existed
+            state.dead += existed
+
+    def _append(
+        self, log: BinaryIO, index: BinaryIO, state: _State, entry: dict[str, Any]
+    ) -> None:
+        """Durably append one entry and index it."""
+        log.seek(0, os.SEEK_END)
+        offset = log.tell()
+        line = _encode(entry)
+        log.write(line)
+        log.flush()
+        os.fsync(log.fileno())
+
+        self._index_entry(index, state, entry, offset)
+        state.indexed = offset + len(line)
+        self._save_index_header(index, state)
+
+    def _read_entry(self, log: BinaryIO, offset: int) -> dict[str, Any]:
+        log.seek(offset)
+        return json.loads(log.readline())
+
+    @property
+    def next_id(self) -> int:
+        """Return the id the next added record will get."""
+        with self._open() as (_, _, state):
+            return state.next_id
+
+    def __len__(self) -> int:
+        with self._open() as (_, _, state):
+            return state.live
+
+    def add(self, data: dict[str, Any]) -> int:
+        """Store a new record and return its id."""
+        with self._open() as (log, index, state):
+            record_id = state.next_id
+            self._append(log, index, state, {"id": record_id, "data": data})
+            state.next_id += 1
+            log.seek(0)
+            log.write(_encode_header(state.generation, state.next_id))
+        return record_id
+
+    def get(self, record_id: int) -> dict[str, Any] | None:
+        """Return the data stored under ``record_id``, if any."""
+        if record_id < 1:
+            return None
+        with self._open() as (log, index, _):
+            offset = self._read_slot(index, record_id)
+            return self._read_entry(log, offset)["data"] if offset else None
+
+    def update(self, record_id: int, data: dict[str, Any]) -> bool:
+        """Replace an existing record; return False if there is none."""
+        if record_id < 1:
+            return False
+        with self._open() as (log, index, state):
+            if not self._read_slot(index, record_id):
+                return False
+            self._append(log, index, state, {"id": record_id, "data": data})
+        self._maybe_compact(state)
+        return True
+
+    def delete(self, record_id: int) -> bool:
+        """Write a tombstone for a record; return False if there is none."""
+        if record_id < 1:
+            return False
+        with self._open() as (log, index, state):
+            if not self._read_slot(index, record_id):
+                return False
+            self._append(log, index, state, {"id": record_id, "deleted": True})
+        self._maybe_compact(state)
+        return True
+
+    def items(self) -> list[tuple[int, dict[str, Any]]]:
+        """Return all live records as ``(id, data)`` pairs in id order."""
+        with self._open() as (log, _, _):
+            return sorted(self._scan(log).items())
+
+    @staticmethod
+    def _scan(log: BinaryIO) -> dict[int, dict[str, Any]]:
+        """Replay the log into the latest version of every live record."""
+        records: dict[int, dict[str, Any]] = {}
+        log.seek(HEADER_SIZE)
+        for line in log:
+            entry = json.loads(line)
+            if entry.get("deleted"):
+                records.pop(entry["id"], None)
+            else:
+                records[entry["id"]] = entry["data"]
+        return records
+
+    def replace_all(
+        self, records: Iterable[tuple[int, dict[str, Any]]], next_id: int | None = None
+    ) -> None:
+        """Replace the whole log with ``records`` in a new generation."""
+        records = sorted(records)
+        if next_id is None:
+            next_id = max((record_id for record_id, _ in records), default=0) + 1
+        with self._open() as (_, _, state):
+            self._write_generation(records, state.generation + 1, next_id)
+
+    def clear(self) -> int:
+        """Remove every record, restart ids at 1 and return how many were removed."""
+        with self._open() as (_, _, state):
+            self._write_generation([], state.generation + 1, 1)
+            return state.live
+
+    def compact(self) -> None:
+        """Rewrite the log with only the live records."""
+        with self._open() as (log, _, state):
+            if state.dead:
+                records = sorted(self._scan(log).items())
+                self._write_generation(records, state.generation + 1, state.next_id)
+
+    def _maybe_compact(self, state: _State) -> None:
+        """Start a background compaction when dead lines dominate the log."""
+        if state.dead < max(self.compact_min_dead, state.live):
+            return
+        if self._compaction is not None and self._compaction.is_alive():
+            return
+        # Not a daemon thread: a CLI that exits right away still finishes it.
+        self._compaction = threading.Thread(target=self.compact, name="record-log")
+        self._compaction.start()
+
+    def wait_for_compaction(self) -> None:
+        """Block until a running background compaction has finished."""
+        if self._compaction is not None:
+            self._compaction.join()
+
+    def _write_generation(
+        self,
+        records: Iterable[tuple[int, dict[str, Any]]],
+        generation: int,
+        next_id: int,
+    ) -> None:
+        """Atomically replace the log and index with a fresh generation."""
+        state = _State(generation=generation, next_id=next_id)
+        log_tmp = self.path.with_name(self.path.name + ".tmp")
+        index_tmp = self.index_path.with_name(self.index_path.name + ".tmp")
+
+        with open(log_tmp, "wb") as log, open(index_tmp, "w+b") as index:
+            log.write(_encode_header(generation, next_id))
+            offset = HEADER_SIZE
+            for record_id, data in records:
+                line = _encode({"id": record_id, "data": data})
+                log.write(line)
+                self._write_slot(index, record_id, offset)
+                offset += len(line)
+                state.live += 1
+            state.indexed = offset
+            self._save_index_header(index, state)
+            log.flush()
+            os.fsync(log.fileno())
+
+        # The index only matches the new log once both are in place; a crash
+        # in between leaves a generation mismatch that forces a rebuild.
+        os.replace(index_tmp, self.index_path)
+        os.replace(log_tmp, self.path)
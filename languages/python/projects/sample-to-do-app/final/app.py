@@ -11,12 +11,19 @@ Usage examples:
 from __future__ import annotations
 
 import argparse
-import json
+import sys
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import List
 
-DB_PATH = Path(__file__).parent / "todos.json"
+# record_log.py is shared by the projects in the parent folder.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from record_log import RecordLog  # noqa: E402
+
+DB_PATH = Path(__file__).parent / "todos.log"
+# Items saved by earlier versions are imported when the log is first created.
+LEGACY_PATH = Path(__file__).parent / "todos.json"
 
 
 @dataclass
@@ -26,31 +33,26 @@ class TodoItem:
     done: bool = False
 
 
-def load_todos(path: Path = DB_PATH) -> List[TodoItem]:
-    if not path.exists():
-        return []
-
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return [TodoItem(**row) for row in data]
+def open_log(path: Path = DB_PATH) -> RecordLog:
+    legacy_path = LEGACY_PATH if path == DB_PATH else path.with_suffix(".json")
+    return RecordLog(path, legacy_path=legacy_path)
 
 
-def save_todos(todos: List[TodoItem], path: Path = DB_PATH) -> None:
-    data = [asdict(item) for item in todos]
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+def load_todos(path: Path = DB_PATH) -> List[TodoItem]:
+    return [TodoItem(id=item_id, **data) for item_id, data in open_log(path).items()]
 
 
-def next_id(todos: List[TodoItem]) -> int:
-    if not todos:
-        return 1
-    return max(item.id for item in todos) + 1
+def save_todos(todos: List[TodoItem], path: Path = DB_PATH) -> None:
+    records = []
+    for item in todos:
+        data = asdict(item)
+        records.append((data.pop("id"), data))
+    open_log(path).replace_all(records)
 
 
 def add_todo(text: str, path: Path = DB_PATH) -> TodoItem:
-    todos = load_todos(path)
-    item = TodoItem(id=next_id(todos), text=text, done=False)
-    todos.append(item)
-    save_todos(todos, path)
-    return item
+    item_id = open_log(path).add({"text": text, "done": False})
+    return TodoItem(id=item_id, text=text, done=False)
 
 
 def list_todos(path: Path = DB_PATH) -> List[TodoItem]:
@@ -58,30 +60,27 @@ def list_todos(path: Path = DB_PATH) -> List[TodoItem]:
 
 
 def mark_done(item_id: int, path: Path = DB_PATH) -> TodoItem | None:
-    todos = load_todos(path)
-    for item in todos:
-        if item.id == item_id:
+    log = open_log(path)
+    # Read and rewrite under one lock, so a concurrent remove or edit can't
+    # land between them.
+    with log.locked():
+        data = log.get(item_id)
+        if data is None:
+            return None
+
+        item = TodoItem(id=item_id, **data)
+        if not item.done:
             item.done = True
-            save_todos(todos, path)
-            return item
-    return None
+            log.update(item_id, {"text": item.text, "done": True})
+    return item
 
 
 def remove_todo(item_id: int, path: Path = DB_PATH) -> bool:
-    todos = load_todos(path)
-    filtered = [item for item in todos if item.id != item_id]
-
-    if len(filtered) == len(todos):
-        return False
-
-    save_todos(filtered, path)
-    return True
+    return open_log(path).delete(item_id)
 
 
 def clear_all(path: Path = DB_PATH) -> int:
-    todos = load_todos(path)
-    save_todos([], path)
-    return len(todos)
+    return open_log(path).clear()
 
 
 def build_parser() -> argparse.ArgumentParser:
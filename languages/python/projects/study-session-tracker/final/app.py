@@ -5,7 +5,10 @@ Track interview study sessions by topic and minutes.
 Usage examples:
   python app.py list
   python app.py add "arrays" 45
+  python app.py add "dp" 30 --date 2024-05-01
   python app.py summary
+  python app.py summary --since 2024-05-01 --until 2024-05-31 --by week
+  python app.py streak
   python app.py remove 1
   python app.py clear
 """
@@ -14,11 +17,23 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import stat
+import sys
+import tempfile
 from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List
+from typing import Any, List, Optional
 
-DB_PATH = Path(__file__).parent / "sessions.json"
+# record_log.py is shared by the projects in the parent folder.
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from record_log import RecordLog  # noqa: E402
+
+DB_PATH = Path(__file__).parent / "sessions.log"
+# Sessions saved by earlier versions are imported when the log is first created.
+LEGACY_PATH = Path(__file__).parent / "sessions.json"
 
 
 @dataclass
@@ -26,32 +41,50 @@ class StudySession:
     id: int
     topic: str
     minutes: int
+    # ISO timestamp; sessions imported from sessions.json have none.
+    started_at: Optional[str] = None
 
 
-def load_sessions(path: Path = DB_PATH) -> List[StudySession]:
-    if not path.exists():
-        return []
-
-    data = json.loads(path.read_text(encoding="utf-8"))
-    return [StudySession(**row) for row in data]
-
-
-def save_sessions(sessions: List[StudySession], path: Path = DB_PATH) -> None:
-    data = [asdict(session) for session in sessions]
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+def open_log(path: Path = DB_PATH) -> RecordLog:
+    legacy_path = LEGACY_PATH if path == DB_PATH else path.with_suffix(".json")
+    return RecordLog(path, legacy_path=legacy_path)
 
 
-def next_id(sessions: List[StudySession]) -> int:
-    if not sessions:
-        return 1
-    return max(session.id for session in sessions) + 1
+def load_sessions(path: Path = DB_PATH) -> List[StudySession]:
+    return [
+        StudySession(id=session_id, **data)
+        for session_id, data in open_log(path).items()
+    ]
 
 
-def add_session(topic: str, minutes: int, path: Path = DB_PATH) -> StudySession:
-    sessions = load_sessions(path)
-    session = StudySession(id=next_id(sessions), topic=topic, minutes=minutes)
-    sessions.append(session)
-    save_sessions(sessions, path)
+def save_sessions(sessions: List[StudySession], path: Path = DB_PATH) -> None:
+    records = []
+    for session in sessions:
+        data = asdict(session)
+        records.append((data.pop("id"), data))
+    log = open_log(path)
+    with log.locked():
+        log.replace_all(records)
+        _rebuild_rollup(log, path)
+
+
+def add_session(
+    topic: str,
+    minutes: int,
+    path: Path = DB_PATH,
+    started_at: Optional[datetime] = None,
+) -> StudySession:
+    started_at = started_at or datetime.now()
+    data: dict[str, Any] = {
+        "topic": topic,
+        "minutes": minutes,
+        "started_at": started_at.isoformat(timespec="seconds"),
+    }
+    log = open_log(path)
+    with log.locked():
+        before = log_version(path)
+        session = StudySession(id=log.add(data), **data)
+        append_rollup_delta(path, before, session, 1)
     return session
 
 
@@ -60,32 +93,247 @@ def list_sessions(path: Path = DB_PATH) -> List[StudySession]:
 
 
 def remove_session(session_id: int, path: Path = DB_PATH) -> bool:
-    sessions = load_sessions(path)
-    filtered = [session for session in sessions if session.id != session_id]
-
-    if len(filtered) == len(sessions):
-        return False
-
-    save_sessions(filtered, path)
+    log = open_log(path)
+    with log.locked():
+        data = log.get(session_id)
+        if data is None:
+            return False
+
+        before = log_version(path)
+        log.delete(session_id)
+        append_rollup_delta(path, before, StudySession(id=session_id, **data), -1)
     return True
 
 
 def clear_sessions(path: Path = DB_PATH) -> int:
-    sessions = load_sessions(path)
-    save_sessions([], path)
-    return len(sessions)
+    log = open_log(path)
+    with log.locked():
+        count = log.clear()
+        save_rollup(empty_rollup(), path)
+    return count
 
 
-def summarize_minutes(path: Path = DB_PATH) -> dict[str, int]:
-    sessions = load_sessions(path)
-    summary: dict[str, int] = {}
+# Rollups: minutes per topic in total, per day and per ISO week, so reports
+# never rescan sessions. They live in two files next to the log:
+#
+# - sessions.rollup.json: a snapshot, tagged with the log version it summarizes.
+# - sessions.rollup.log: one JSON line per add/remove since the snapshot, each
+#   tagged with the log versions before and after that change.
+#
+# Adding or removing a session appends one delta line while the log's lock is
+# held, so the cost does not grow with the history. Loading replays the deltas
+# onto the snapshot and, once they pile up, folds them into a new snapshot. If
+# the chain of versions is broken (a crash between the log write and the delta,
+# or a compaction of the log) the rollup is rebuilt from the log instead.
 
-    for session in sessions:
-        summary[session.topic] = summary.get(session.topic, 0) + session.minutes
+# Fold the deltas into the snapshot once the delta file is this large.
+ROLLUP_FOLD_BYTES = 64 * 1024
 
+
+def rollup_path(path: Path = DB_PATH) -> Path:
+    return path.with_name(path.stem + ".rollup.json")
+
+
+def rollup_log_path(path: Path = DB_PATH) -> Path:
+    return path.with_name(path.stem + ".rollup.log")
+
+
+def log_version(path: Path = DB_PATH) -> list[int]:
+    # A new generation of the log is a new file, so the inode changes too.
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return [0, 0]
+    return [stat.st_ino, stat.st_size]
+
+
+def empty_rollup() -> dict[str, Any]:
+    return {"log_version": None, "totals": {}, "days": {}, "weeks": {}}
+
+
+def week_key(day: date) -> str:
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _add_minutes(
+    buckets: dict[str, dict[str, int]], key: str, topic: str, minutes: int
+) -> None:
+    bucket = buckets.setdefault(key, {})
+    bucket[topic] = bucket.get(topic, 0) + minutes
+    if bucket[topic] == 0:
+        del bucket[topic]
+        if not bucket:
+            del buckets[key]
+
+
+def _apply_minutes(
+    rollup: dict[str, Any], topic: str, minutes: int, day: Optional[str]
+) -> None:
+    totals = rollup["totals"]
+    totals[topic] = totals.get(topic, 0) + minutes
+    if totals[topic] == 0:
+        del totals[topic]
+
+    if day:
+        _add_minutes(rollup["days"], day, topic, minutes)
+        _add_minutes(rollup["weeks"], week_key(date.fromisoformat(day)), topic, minutes)
+
+
+def _session_day(session: StudySession) -> Optional[str]:
+    if not session.started_at:
+        return None
+    return datetime.fromisoformat(session.started_at).date().isoformat()
+
+
+def apply_to_rollup(rollup: dict[str, Any], session: StudySession, sign: int) -> None:
+    _apply_minutes(rollup, session.topic, sign * session.minutes, _session_day(session))
+
+
+def append_rollup_delta(
+    path: Path, before: list[int], session: StudySession, sign: int
+) -> None:
+    """Record one add (sign 1) or remove (sign -1). Call with the log locked."""
+    delta = {
+        "from": before,
+        "to": log_version(path),
+        "topic": session.topic,
+        "minutes": sign * session.minutes,
+        "day": _session_day(session),
+    }
+    with open(rollup_log_path(path), "a", encoding="utf-8") as handle:
+        handle.write(json.dumps(delta) + "\n")
+
+
+def _rebuild_rollup(log: RecordLog, path: Path) -> dict[str, Any]:
+    rollup = empty_rollup()
+    for session_id, data in log.items():
+        apply_to_rollup(rollup, StudySession(id=session_id, **data), 1)
+    save_rollup(rollup, path)
+    return rollup
+
+
+def rebuild_rollup(path: Path = DB_PATH) -> dict[str, Any]:
+    log = open_log(path)
+    with log.locked():
+        return _rebuild_rollup(log, path)
+
+
+def save_rollup(rollup: dict[str, Any], path: Path = DB_PATH) -> None:
+    """Write a snapshot and drop the deltas it absorbed. Call with the log locked."""
+    rollup["log_version"] = log_version(path)
+    target = rollup_path(path)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=target.parent, prefix=target.name + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(rollup, handle)
+        # mkstemp creates the file as 0600; keep the mode the rollup has, or
+        # the first time, the mode of the session log.
+        for source in (target, path):
+            try:
+                mode = stat.S_IMODE(os.stat(source).st_mode)
+            except FileNotFoundError:
+                continue
+            os.chmod(tmp_name, mode)
+            break
+        os.replace(tmp_name, target)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    # A crash before this truncation leaves deltas that no longer chain onto
+    # the snapshot's version, which load_rollup treats as stale.
+    open(rollup_log_path(path), "wb").close()
+
+
+def _replay_rollup(path: Path) -> Optional[dict[str, Any]]:
+    """Snapshot plus deltas, or None if they don't add up to the current log."""
+    try:
+        rollup = json.loads(rollup_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    version = rollup.get("log_version")
+    try:
+        with open(rollup_log_path(path), "rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break  # torn tail from an interrupted write
+                delta = json.loads(line)
+                if delta["from"] != version:
+                    return None
+                _apply_minutes(rollup, delta["topic"], delta["minutes"], delta["day"])
+                version = delta["to"]
+    except FileNotFoundError:
+        pass
+    except (ValueError, KeyError):
+        return None
+
+    if version != log_version(path):
+        # Written by an older version, interrupted, or the log was compacted.
+        return None
+    rollup["log_version"] = version
+    return rollup
+
+
+def load_rollup(path: Path = DB_PATH) -> dict[str, Any]:
+    log = open_log(path)
+    with log.locked():
+        rollup = _replay_rollup(path)
+        if rollup is None:
+            return _rebuild_rollup(log, path)
+        deltas = rollup_log_path(path)
+        if deltas.exists() and deltas.stat().st_size >= ROLLUP_FOLD_BYTES:
+            save_rollup(rollup, path)
+        return rollup
+
+
+def summarize_minutes(
+    path: Path = DB_PATH,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    by: str = "topic",
+) -> dict[str, int]:
+    rollup = load_rollup(path)
+    if since is None and until is None:
+        if by == "topic":
+            return dict(rollup["totals"])
+        buckets = rollup["weeks"] if by == "week" else rollup["days"]
+        return {key: sum(topics.values()) for key, topics in buckets.items()}
+
+    # ISO dates compare correctly as strings.
+    first = since.isoformat() if since else ""
+    last = until.isoformat() if until else "9999-12-31"
+    summary: dict[str, int] = {}
+    for day, topics in rollup["days"].items():
+        if not first <= day <= last:
+            continue
+        if by == "topic":
+            for topic, minutes in topics.items():
+                summary[topic] = summary.get(topic, 0) + minutes
+        else:
+            key = week_key(date.fromisoformat(day)) if by == "week" else day
+            summary[key] = summary.get(key, 0) + sum(topics.values())
     return summary
 
 
+def study_streak(path: Path = DB_PATH, today: Optional[date] = None) -> tuple[int, int]:
+    today = today or date.today()
+    days = sorted(date.fromisoformat(day) for day in load_rollup(path)["days"])
+
+    longest = run = 0
+    previous = None
+    for day in days:
+        run = run + 1 if previous == day - timedelta(days=1) else 1
+        longest = max(longest, run)
+        previous = day
+
+    # A streak is still alive if the last study day was today or yesterday.
+    current = run if previous and today - previous <= timedelta(days=1) else 0
+    return current, longest
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Study session tracker")
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -95,11 +343,30 @@ def build_parser() -> argparse.ArgumentParser:
     add_parser = subparsers.add_parser("add", help="Add a study session")
     add_parser.add_argument("topic", help="Topic studied")
     add_parser.add_argument("minutes", type=int, help="Minutes spent")
+    add_parser.add_argument(
+        "--date",
+        type=date.fromisoformat,
+        help="Day studied (YYYY-MM-DD, default today)",
+    )
 
     remove_parser = subparsers.add_parser("remove", help="Remove a session by id")
     remove_parser.add_argument("id", type=int, help="Session id")
 
-    subparsers.add_parser("summary", help="Show total minutes per topic")
+    summary_parser = subparsers.add_parser("summary", help="Show total minutes")
+    summary_parser.add_argument(
+        "--since", type=date.fromisoformat, help="First day to include (YYYY-MM-DD)"
+    )
+    summary_parser.add_argument(
+        "--until", type=date.fromisoformat, help="Last day to include (YYYY-MM-DD)"
+    )
+    summary_parser.add_argument(
+        "--by",
+        choices=["topic", "day", "week"],
+        default="topic",
+        help="Group minutes by topic (default), day or ISO week",
+    )
+
+    subparsers.add_parser("streak", help="Show current and longest study streaks")
     subparsers.add_parser("clear", help="Clear all sessions")
 
     return parser
@@ -111,7 +378,10 @@ def print_sessions(sessions: List[StudySession]) -> None:
         return
 
     for session in sessions:
-        print(f"#{session.id} | {session.topic} | {session.minutes} min")
+        line = f"#{session.id} | {session.topic} | {session.minutes} min"
+        if session.started_at:
+            line += f" | {session.started_at[:10]}"
+        print(line)
 
 
 def print_summary(summary: dict[str, int]) -> None:
@@ -119,8 +389,13 @@ def print_summary(summary: dict[str, int]) -> None:
         print("No study data to summarize.")
         return
 
-    for topic in sorted(summary):
-        print(f"{topic}: {summary[topic]} min")
+    for key in sorted(summary):
+        print(f"{key}: {summary[key]} min")
+
+
+def print_streak(current: int, longest: int) -> None:
+    print(f"Current streak: {current} day(s)")
+    print(f"Longest streak: {longest} day(s)")
 
 
 def main() -> None:
@@ -133,7 +408,10 @@ def main() -> None:
         if args.minutes <= 0:
             print("Minutes must be a positive integer.")
             return
-        session = add_session(args.topic, args.minutes)
+        started_at = (
+            datetime.combine(args.date, datetime.now().time()) if args.date else None
+        )
+        session = add_session(args.topic, args.minutes, started_at=started_at)
         print(f"Added session #{session.id}: {session.topic} ({session.minutes} min)")
     elif args.command == "remove":
         removed = remove_session(args.id)
@@ -142,7 +420,9 @@ def main() -> None:
         else:
             print(f"No session with id={args.id}")
     elif args.command == "summary":
-        print_summary(summarize_minutes())
+        print_summary(summarize_minutes(since=args.since, until=args.until, by=args.by))
+    elif args.command == "streak":
+        print_streak(*study_streak())
     elif args.command == "clear":
         count = clear_sessions()
         print(f"Cleared {count} session(s)")
@@ -0,0 +1,937 @@
+#!/usr/bin/env python3
+"""SQL Problem Runner for Interview Prep.
+
+Runs the solutions embedded in ``problems/*.md`` against an embedded database.
+For every problem it:
+
+1. extracts the schema, sample data, expected output and solution blocks,
+2. checks each solution against the expected output on the sample data,
+3. loads generated fixture data at the requested scale and checks that the
+   solutions agree with each other (or with a Python reference),
+4. times each solution before and after creating the suggested indexes.
+
+Solutions are written for PostgreSQL. SQLite (always available) runs them
+through a small translator for the constructs the problem set uses
+(``DATE_TRUNC``, ``TO_CHAR``, ``INTERVAL``, ``AGE`` month arithmetic and
+``::`` casts). DuckDB, when installed, runs them unchanged.
+
+Usage:
+    python languages/sql/runner.py
+    python languages/sql/runner.py --problem 04 --scale 1000000
+    python languages/sql/runner.py --engine duckdb --json sql_report.json
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import sqlite3
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+PROBLEMS_DIR = Path(__file__).parent / "problems"
+DEFAULT_SCALE = 10_000
+
+# Color codes
+COLORS = {
+    "green": "\033[92m",
+    "yellow": "\033[93m",
+    "red": "\033[91m",
+    "cyan": "\033[96m",
+    "bold": "\033[1m",
+    "reset": "\033[0m",
+}
+
+
+def colorize(text: str, color: str) -> str:
+    """Apply color to text."""
+    return f"{COLORS.get(color, '')}{text}{COLORS['reset']}"
+
+
+# ---------------------------------------------------------------------------
+# Markdown extraction
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Solution:
+    """One SQL solution block and the heading it appeared under."""
+
+    label: str
+    sql: str
+    portable: bool = True
+
+
+@dataclass
+class Problem:
+    """Everything the runner needs from one problem file."""
+
+    number: str
+    title: str
+    schema: str
+    tables: dict[str, list[str]]
+    solutions: list[Solution]
+    sample_sql: str = ""
+    sample_rows: dict[str, list[list[str]]] = field(default_factory=dict)
+    expected: list[list[str]] | None = None
+
+
+def _parse_table(lines: Sequence[str]) -> list[list[str]]:
+    """Parse a markdown table into rows of cells, skipping the header rule."""
+    rows = []
+    for line in lines:
+        cells = [cell.strip() for cell in line.strip().strip("|").split("|")]
+        if all(set(cell) <= set("-: ") for cell in cells):
+            continue
+        rows.append(cells)
+    return rows
+
+
+def _table_columns(schema: str) -> dict[str, list[str]]:
+    """Return the column names of every ``CREATE TABLE`` in ``schema``."""
+    tables = {}
+    for match in re.finditer(
+        r"CREATE TABLE\s+(\w+)\s*\((.*?)\n\);", schema, re.IGNORECASE | re.DOTALL
+    ):
+        columns = []
+        for line in match.group(2).splitlines():
+            line = line.split("--")[0].strip()
+            if line and not line.upper().startswith(("PRIMARY", "FOREIGN", "UNIQUE")):
+                columns.append(line.split()[0])
+        tables[match.group(1)] = columns
+    return tables
+
+
+def parse_problem(path: Path) -> Problem:
+    """Extract schema, sample data, expected output and solutions from markdown."""
+    lines = path.read_text(encoding="utf-8").splitlines()
+    title = lines[0].lstrip("# ").strip()
+    number = path.name[:2]
+
+    heading = ""
+    label = ""
+    schema = ""
+    sample_sql = ""
+    sample_rows: dict[str, list[list[str]]] = {}
+    expected = None
+    solutions = []
+
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        if line.startswith("## "):
+            heading = label = line[3:].strip()
+        elif line.startswith("**") and line.rstrip().endswith(":**"):
+            label = line.strip("*: ")
+
+        if line.strip().startswith("```sql"):
+            end = lines.index("```", i + 1)
+            block = "\n".join(lines[i + 1 : end]).strip()
+            i = end
+            if heading.lower() == "schema":
+                schema += block + "\n"
+            elif heading.lower() == "sample data":
+                sample_sql += block + "\n"
+            elif re.search(r"^\s*(SELECT|WITH)\b", block, re.IGNORECASE | re.MULTILINE):
+                portable = "$$" not in block and "CREATE" not in block.upper()
+                solutions.append(Solution(heading, block, portable))
+        elif line.startswith("|"):
+            end = i
+            while end < len(lines) and lines[end].startswith("|"):
+                end += 1
+            rows = _parse_table(lines[i:end])
+            input_match = re.match(r"Input\W+(\w+)", label)
+            if "expected output" in label.lower():
+                expected = rows[1:]
+                label = ""
+            elif input_match:
+                sample_rows[input_match.group(1)] = rows
+                label = ""
+            i = end - 1
+        i += 1
+
+    return Problem(
+        number=number,
+        title=title,
+        schema=schema,
+        tables=_table_columns(schema),
+        solutions=solutions,
+        sample_sql=sample_sql,
+        sample_rows=sample_rows,
+        expected=expected,
+    )
+
+
+def discover_problems(problems_dir: Path = PROBLEMS_DIR) -> list[Problem]:
+    """Parse every problem file in order."""
+    return [parse_problem(path) for path in sorted(problems_dir.glob("[0-9]*.md"))]
+
+
+# ---------------------------------------------------------------------------
+# PostgreSQL -> SQLite translation
+# ---------------------------------------------------------------------------
+
+
+def _split_args(text: str) -> list[str]:
+    """Split a function argument list on top-level commas."""
+    args, depth, start = [], 0, 0
+    for index, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            args.append(text[start:index].strip())
+            start = index + 1
+    args.append(text[start:].strip())
+    return args
+
+
+def _replace_calls(sql: str, name: str, render: Callable[[list[str]], str]) -> str:
+    """Replace each ``name(...)`` call in ``sql`` with ``render(args)``."""
+    pattern = re.compile(rf"\b{name}\s*\(", re.IGNORECASE)
+    parts = []
+    position = 0
+    while match := pattern.search(sql, position):
+        depth, index = 1, match.end()
+        while depth:
+            depth += {"(": 1, ")": -1}.get(sql[index], 0)
+            index += 1
+        parts.append(sql[position : match.start()])
+        parts.append(render(_split_args(sql[match.end() : index - 1])))
+        position = index
+    parts.append(sql[position:])
+    return "".join(parts)
+
+
+def _date_part(args: list[str]) -> str:
+    """Translate ``DATE_PART(field, AGE(a, b))`` to a calendar difference.
+
+    ``years * 12 + months`` of these differences equals PostgreSQL's month
+    count for month-aligned dates, which is how the problems use ``AGE``.
+    """
+    unit = args[0].strip("'").lower()
+    age = re.fullmatch(r"AGE\s*\((.*)\)", args[1], re.IGNORECASE | re.DOTALL)
+    if age is None or unit not in ("year", "month"):
+        raise ValueError(f"Unsupported DATE_PART({', '.join(args)})")
+    end, start = _split_args(age.group(1))
+    code = "%Y" if unit == "year" else "%m"
+    return (
+        f"(CAST(strftime('{code}', {end}) AS INTEGER)"
+        f" - CAST(strftime('{code}', {start}) AS INTEGER))"
+    )
+
+
+def _date_trunc(args: list[str]) -> str:
+    unit = args[0].strip("'").lower()
+    if unit == "day":
+        return f"date({args[1]})"
+    return f"date({args[1]}, 'start of {unit}')"
+
+
+def _to_char(args: list[str]) -> str:
+    fmt = args[1].replace("YYYY", "%Y").replace("MM", "%m").replace("DD", "%d")
+    return f"strftime({fmt}, {args[0]})"
+
+
+def to_sqlite(sql: str) -> str:
+    """Rewrite the PostgreSQL constructs used by the problem set for SQLite."""
+    sql = _replace_calls(sql, "DATE_TRUNC", _date_trunc)
+    sql = _replace_calls(sql, "DATE_PART", _date_part)
+    sql = _replace_calls(sql, "TO_CHAR", _to_char)
+    sql = re.sub(
+        r"([\w.]+)\s*([+-])\s*INTERVAL\s*'(\d+)\s*(day|month|year)s?'",
+        r"date(\1, '\2\3 \4')",
+        sql,
+        flags=re.IGNORECASE,
+    )
+    # NUMERIC affinity would store 200.00 as an integer and truncate division.
+    sql = re.sub(
+        r"\b(DECIMAL|NUMERIC)\s*\(\s*\d+\s*,\s*\d+\s*\)", "REAL", sql, flags=re.I
+    )
+    sql = re.sub(r"::DATE\b", "", sql, flags=re.IGNORECASE)
+    sql = re.sub(r"([\w.]+)::INT\b", r"CAST(\1 AS INTEGER)", sql, flags=re.IGNORECASE)
+    return sql
+
+
+# ---------------------------------------------------------------------------
+# Engines
+# ---------------------------------------------------------------------------
+
+
+class QueryTimeout(Exception):
+    """Raised when a query runs past the time budget."""
+
+
+class SQLiteEngine:
+    """In-memory SQLite database."""
+
+    name = "sqlite"
+
+    def __init__(self) -> None:
+        self.connection = sqlite3.connect(":memory:")
+        self._deadline = 0.0
+        self.connection.set_progress_handler(self._check_deadline, 10_000)
+
+    def _check_deadline(self) -> int:
+        """Abort the running statement once the deadline has passed."""
+        return int(bool(self._deadline) and time.perf_counter() > self._deadline)
+
+    def translate(self, sql: str) -> str:
+        return to_sqlite(sql)
+
+    def executescript(self, sql: str) -> None:
+        self.connection.executescript(self.translate(sql))
+
+    def insert(self, table: str, columns: list[str], rows: Iterator[tuple]) -> None:
+        placeholders = ", ".join("?" for _ in columns)
+        self.connection.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+            rows,
+        )
+        self.connection.commit()
+
+    def query(self, sql: str, timeout: float = 0) -> list[tuple]:
+        self._deadline = time.perf_counter() + timeout if timeout else 0.0
+        try:
+            return self.connection.execute(self.translate(sql)).fetchall()
+        except sqlite3.OperationalError as error:
+            if "interrupted" in str(error):
+                raise QueryTimeout from error
+            raise
+        finally:
+            self._deadline = 0.0
+
+    def analyze(self) -> None:
+        self.connection.execute("ANALYZE")
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class DuckDBEngine(SQLiteEngine):
+    """In-memory DuckDB database; runs PostgreSQL syntax as written."""
+
+    name = "duckdb"
+
+    def __init__(self) -> None:
+        import duckdb  # type: ignore[import-not-found]
+
+        self.connection = duckdb.connect(":memory:")
+
+    def translate(self, sql: str) -> str:
+        return sql
+
+    def executescript(self, sql: str) -> None:
+        self.connection.execute(sql)
+
+    def insert(self, table: str, columns: list[str], rows: Iterator[tuple]) -> None:
+        placeholders = ", ".join("?" for _ in columns)
+        self.connection.executemany(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+            list(rows),
+        )
+
+    def query(self, sql: str, timeout: float = 0) -> list[tuple]:
+        # DuckDB has no progress callback; the timeout is not enforced.
+        return self.connection.execute(sql).fetchall()
+
+
+ENGINES: dict[str, type[SQLiteEngine]] = {
+    "sqlite": SQLiteEngine,
+    "duckdb": DuckDBEngine,
+}
+
+
+# ---------------------------------------------------------------------------
+# Fixtures, indexes and reference answers
+# ---------------------------------------------------------------------------
+
+Rows = dict[str, list[tuple]]
+START = date(2020, 1, 1)
+DEPARTMENTS = ["Engineering", "Marketing", "Sales", "Finance", "Support", "Legal"]
+
+
+def _day(offset: int) -> str:
+    return (START + timedelta(days=offset)).isoformat()
+
+
+def _salaried(rng: random.Random, n: int) -> list[tuple]:
+    return [(i, f"emp{i}", rng.randrange(30, 200) * 1_000) for i in range(1, n + 1)]
+
+
+def _fixture_01(rng: random.Random, n: int) -> Rows:
+    return {
+        "employees": [
+            (
+                i,
+                f"emp{i}",
+                rng.choice(DEPARTMENTS),
+                rng.randrange(30_000, 200_000),
+                _day(rng.randrange(2_000)),
+            )
+            for i in range(1, n + 1)
+        ]
+    }
+
+
+def _fixture_02(rng: random.Random, n: int) -> Rows:
+    pool = max(1, n * 4 // 5)
+    return {
+        "users": [
+            (i, f"user{rng.randrange(pool)}@example.com", f"user{i}")
+            for i in range(1, n + 1)
+        ]
+    }
+
+
+def _fixture_03(rng: random.Random, n: int) -> Rows:
+    departments = max(1, n // 1_000)
+    return {
+        "departments": [(d, f"dept{d}") for d in range(1, departments + 1)],
+        "employees": [
+            (i, f"emp{i}", rng.randrange(30, 200) * 1_000, rng.randint(1, departments))
+            for i in range(1, n + 1)
+        ],
+    }
+
+
+def _fixture_04(rng: random.Random, n: int) -> Rows:
+    rows, num = [], 1
+    for i in range(1, n + 1):
+        if rng.random() < 0.4:
+            num = rng.randint(1, 50)
+        rows.append((i, num))
+    return {"logs": rows}
+
+
+def _fixture_05(rng: random.Random, n: int) -> Rows:
+    return {"scores": [(i, rng.randrange(0, 501) / 100) for i in range(1, n + 1)]}
+
+
+def _fixture_06(rng: random.Random, n: int) -> Rows:
+    # Shuffled ids so the id order does not match the date order.
+    ids = list(range(1, n + 1))
+    rng.shuffle(ids)
+    return {
+        "weather": [(ids[day], _day(day), rng.randint(-20, 40)) for day in range(n)]
+    }
+
+
+def _fixture_07(rng: random.Random, n: int) -> Rows:
+    return {"employees": _salaried(rng, n)}
+
+
+def _fixture_08(rng: random.Random, n: int) -> Rows:
+    buyers = max(1, n * 7 // 10)
+    return {
+        "customers": [(i, f"customer{i}") for i in range(1, n + 1)],
+        "orders": [
+            (
+                i,
+                rng.randint(1, buyers),
+                rng.randrange(100, 50_000) / 100,
+                _day(rng.randrange(1_000)),
+            )
+            for i in range(1, n + 1)
+        ],
+    }
+
+
+def _fixture_09(rng: random.Random, n: int) -> Rows:
+    return {"employees": _salaried(rng, n)}
+
+
+def _fixture_10(rng: random.Random, n: int) -> Rows:
+    rows: list[tuple] = [(1, "emp1", rng.choice(DEPARTMENTS), None)]
+    for i in range(2, n + 1):
+        # Managers come from the first tenth, so many have 5+ reports.
+        manager = rng.randint(1, max(1, min(i - 1, n // 10)))
+        rows.append((i, f"emp{i}", rng.choice(DEPARTMENTS), manager))
+    return {"employees": rows}
+
+
+def _fixture_11(rng: random.Random, n: int) -> Rows:
+    return {
+        "orders": [
+            (i, _day(rng.randrange(1_095)), rng.randrange(100, 100_000) / 100)
+            for i in range(1, n + 1)
+        ]
+    }
+
+
+def _fixture_12(rng: random.Random, n: int) -> Rows:
+    rows: list[tuple] = []
+    customer = 0
+    while len(rows) < n:
+        customer += 1
+        first = rng.randrange(365)
+        # Each customer returns in later months with decaying probability.
+        for months in range(8):
+            if months and rng.random() > 0.6 ** (months / 2):
+                continue
+            rows.append(
+                (
+                    len(rows) + 1,
+                    customer,
+                    _day(first + months * 30 + rng.randrange(10)),
+                    rng.randrange(500, 50_000) / 100,
+                )
+            )
+    return {"orders": rows[:n]}
+
+
+def _fixture_13(rng: random.Random, n: int) -> Rows:
+    customers = max(1, n // 20)
+    next_day = [rng.randrange(30) for _ in range(customers + 1)]
+    rows = []
+    for i in range(1, n + 1):
+        customer = rng.randint(1, customers)
+        # Distinct dates per customer and distinct amounts keep the running
+        # totals and quartiles free of ties, so any correct query agrees.
+        next_day[customer] += rng.randint(1, 5)
+        amount = (i * 7_919 % 1_000_003) / 100
+        status = "completed" if rng.random() < 0.8 else "cancelled"
+        rows.append((i, customer, _day(next_day[customer]), amount, status))
+    return {"orders": rows}
+
+
+def _fixture_14(rng: random.Random, n: int) -> Rows:
+    stages = ["page_view", "add_to_cart", "begin_checkout", "purchase"]
+    rows: list[tuple] = []
+    user = 0
+    while len(rows) < n:
+        user += 1
+        day = _day(rng.randrange(365))
+        for stage in stages:
+            rows.append((len(rows) + 1, user, stage, day))
+            if rng.random() < 0.5:
+                break
+    return {"user_events": rows[:n]}
+
+
+FIXTURES: dict[str, Callable[[random.Random, int], Rows]] = {
+    "01": _fixture_01,
+    "02": _fixture_02,
+    "03": _fixture_03,
+    "04": _fixture_04,
+    "05": _fixture_05,
+    "06": _fixture_06,
+    "07": _fixture_07,
+    "08": _fixture_08,
+    "09": _fixture_09,
+    "10": _fixture_10,
+    "11": _fixture_11,
+    "12": _fixture_12,
+    "13": _fixture_13,
+    "14": _fixture_14,
+}
+
+SUGGESTED_INDEXES: dict[str, list[str]] = {
+    "01": ["CREATE INDEX idx_employees_salary ON employees (salary)"],
+    "02": ["CREATE INDEX idx_users_email ON users (email)"],
+    "03": [
+        "CREATE INDEX idx_employees_department_salary"
+        " ON employees (department_id, salary)"
+    ],
+    "04": [],
+    "05": ["CREATE INDEX idx_scores_score ON scores (score)"],
+    "06": ["CREATE INDEX idx_weather_record_date ON weather (record_date)"],
+    "07": ["CREATE INDEX idx_employees_salary ON employees (salary)"],
+    "08": ["CREATE INDEX idx_orders_customer_id ON orders (customer_id)"],
+    "09": ["CREATE INDEX idx_employees_salary ON employees (salary)"],
+    "10": ["CREATE INDEX idx_employees_manager_id ON employees (manager_id)"],
+    "11": ["CREATE INDEX idx_orders_order_date ON orders (order_date)"],
+    "12": ["CREATE INDEX idx_orders_customer_date ON orders (customer_id, order_date)"],
+    "13": [
+        "CREATE INDEX idx_orders_status_customer_date"
+        " ON orders (status, customer_id, order_date)"
+    ],
+    "14": [
+        "CREATE INDEX idx_user_events_type_user ON user_events (event_type, user_id)"
+    ],
+}
+
+
+def _reference_01(rows: Rows) -> list[tuple]:
+    return [(r[1], r[2], r[3]) for r in rows["employees"] if r[3] > 50_000]
+
+
+def _reference_02(rows: Rows) -> list[tuple]:
+    counts = Counter(r[1] for r in rows["users"])
+    return [(email, count) for email, count in counts.items() if count > 1]
+
+
+def _reference_12(rows: Rows) -> list[tuple]:
+    def month(day: str) -> int:
+        return int(day[:4]) * 12 + int(day[5:7]) - 1
+
+    cohort: dict[int, int] = {}
+    for _, customer, day, _ in rows["orders"]:
+        cohort[customer] = min(cohort.get(customer, month(day)), month(day))
+    sizes = Counter(cohort.values())
+    active = {
+        (cohort[customer], month(day) - cohort[customer], customer)
+        for _, customer, day, _ in rows["orders"]
+        if month(day) - cohort[customer] <= 4
+    }
+    per_period = Counter((first, period) for first, period, _ in active)
+    return [
+        (
+            f"{first // 12:04d}-{first % 12 + 1:02d}-01",
+            period,
+            sizes[first],
+            users,
+            round(users * 100 / sizes[first], 1),
+        )
+        for (first, period), users in per_period.items()
+    ]
+
+
+def _reference_13(rows: Rows) -> list[tuple]:
+    completed = [r for r in rows["orders"] if r[4] == "completed"]
+    by_amount = sorted(completed, key=lambda r: r[3])
+    quartile = {}
+    size, extra = divmod(len(by_amount), 4)
+    position = 0
+    for bucket in range(1, 5):
+        count = size + (bucket <= extra)
+        for r in by_amount[position : position + count]:
+            quartile[r[0]] = f"Q{bucket}"
+        position += count
+
+    totals: Counter[int] = Counter()
+    for r in completed:
+        totals[r[1]] += r[3]
+    running: Counter[int] = Counter()
+    result = []
+    for r in sorted(completed, key=lambda r: (r[1], r[2])):
+        running[r[1]] += r[3]
+        result.append(
+            (
+                r[0],
+                r[1],
+                r[2],
+                round(r[3], 2),
+                round(running[r[1]], 2),
+                round(r[3] * 100 / totals[r[1]], 2),
+                quartile[r[0]],
+            )
+        )
+    return result
+
+
+def _reference_14(rows: Rows) -> list[tuple]:
+    users: dict[str, set[int]] = {}
+    for _, user, event_type, _ in rows["user_events"]:
+        users.setdefault(event_type, set()).add(user)
+    counts = [
+        len(users.get(stage, ()))
+        for stage in ("page_view", "add_to_cart", "begin_checkout", "purchase")
+    ]
+
+    def rate(numerator: int, denominator: int) -> float | None:
+        return round(numerator * 100 / denominator, 1) if denominator else None
+
+    return [
+        ("page_view", counts[0], None, None),
+        (
+            "add_to_cart",
+            counts[1],
+            rate(counts[1], counts[0]),
+            rate(counts[1], counts[0]),
+        ),
+        (
+            "begin_checkout",
+            counts[2],
+            rate(counts[2], counts[1]),
+            rate(counts[2], counts[0]),
+        ),
+        ("purchase", counts[3], rate(counts[3], counts[2]), rate(counts[3], counts[0])),
+    ]
+
+
+# Python answers for problems that have a single solution to cross-check.
+REFERENCES: dict[str, Callable[[Rows], list[tuple]]] = {
+    "01": _reference_01,
+    "02": _reference_02,
+    "12": _reference_12,
+    "13": _reference_13,
+    "14": _reference_14,
+}
+
+
+# ---------------------------------------------------------------------------
+# Running
+# ---------------------------------------------------------------------------
+
+
+def _normalize_value(value: Any) -> Any:
+    """Normalize a cell so text, integers and decimals compare by value."""
+    if value is None or value == "NULL" or value == "":
+        return None
+    if isinstance(value, bool):
+        return int(value)
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return str(value)
+    return round(number, 4)
+
+
+def normalize(rows: Sequence[Sequence[Any]]) -> list[tuple]:
+    """Return rows as a sorted list of normalized tuples."""
+    return sorted(
+        (tuple(_normalize_value(value) for value in row) for row in rows),
+        key=repr,
+    )
+
+
+@dataclass
+class SolutionResult:
+    """Outcome of one solution for one problem."""
+
+    label: str
+    sample: str = "-"  # ok, FAIL, error or - (no expected output)
+    scaled: str = "-"  # ok, FAIL (disagrees), timeout, error or skipped
+    rows: int = 0
+    plain_ms: float | None = None
+    indexed_ms: float | None = None
+    error: str = ""
+
+
+@dataclass
+class ProblemResult:
+    """Outcomes for every solution of one problem."""
+
+    number: str
+    title: str
+    scale: int
+    solutions: list[SolutionResult] = field(default_factory=list)
+
+
+def _load_rows(engine: SQLiteEngine, problem: Problem, rows: Rows) -> None:
+    for table, table_rows in rows.items():
+        engine.insert(table, problem.tables[table], iter(table_rows))
+
+
+def check_sample(
+    problem: Problem, solution: Solution, engine_type: type[SQLiteEngine]
+) -> str:
+    """Run ``solution`` on the sample data and compare with the expected output."""
+    if problem.expected is None or not (problem.sample_sql or problem.sample_rows):
+        return "-"
+
+    engine = engine_type()
+    try:
+        engine.executescript(problem.schema)
+        if problem.sample_sql:
+            engine.executescript(problem.sample_sql)
+        for table, table_rows in problem.sample_rows.items():
+            header, *data = table_rows
+            engine.insert(
+                table,
+                header,
+                iter([tuple(_normalize_value(v) for v in row) for row in data]),
+            )
+        actual = engine.query(solution.sql)
+    except Exception:
+        return "error"
+    finally:
+        engine.close()
+
+    return "ok" if normalize(actual) == normalize(problem.expected) else "FAIL"
+
+
+def _timed(engine: SQLiteEngine, sql: str, repeat: int, timeout: float) -> tuple:
+    """Return the rows and best-of-``repeat`` wall time in milliseconds."""
+    best = float("inf")
+    rows: list[tuple] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rows = engine.query(sql, timeout)
+        best = min(best, time.perf_counter() - start)
+    return rows, round(best * 1000, 3)
+
+
+def run_problem(
+    problem: Problem,
+    scale: int = DEFAULT_SCALE,
+    engine_type: type[SQLiteEngine] = SQLiteEngine,
+    repeat: int = 3,
+    timeout: float = 30.0,
+    seed: int = 0,
+) -> ProblemResult:
+    """Verify and time every solution of ``problem`` at ``scale`` rows."""
+    result = ProblemResult(problem.number, problem.title, scale)
+    runnable = [solution for solution in problem.solutions if solution.portable]
+    for solution in problem.solutions:
+        outcome = SolutionResult(solution.label)
+        if solution.portable:
+            outcome.sample = check_sample(problem, solution, engine_type)
+        else:
+            outcome.scaled = "skipped"
+            outcome.error = "PostgreSQL-only (function definition)"
+        result.solutions.append(outcome)
+
+    fixture = FIXTURES.get(problem.number)
+    if fixture is None or not runnable:
+        return result
+
+    rows = fixture(random.Random(seed), scale)
+    engine = engine_type()
+    try:
+        engine.executescript(problem.schema)
+        _load_rows(engine, problem, rows)
+
+        answers: dict[str, list[tuple]] = {}
+        outcomes = {outcome.label: outcome for outcome in result.solutions}
+
+        def measure(solution: Solution) -> float | None:
+            """Time one solution, keeping its first answer for the cross-check."""
+            outcome = outcomes[solution.label]
+            try:
+                found, elapsed = _timed(engine, solution.sql, repeat, timeout)
+            except QueryTimeout:
+                outcome.scaled = "timeout"
+                return None
+            except Exception as error:
+                outcome.scaled, outcome.error = "error", str(error)
+                return None
+            outcome.rows = len(found)
+            answers.setdefault(solution.label, normalize(found))
+            return elapsed
+
+        for solution in runnable:
+            outcomes[solution.label].plain_ms = measure(solution)
+
+        indexes = SUGGESTED_INDEXES.get(problem.number, [])
+        if indexes:
+            engine.executescript(";\n".join(indexes) + ";")
+            engine.analyze()
+            # Queries that timed out without indexes get a second chance here.
+            for solution in runnable:
+                if outcomes[solution.label].scaled != "error":
+                    outcomes[solution.label].indexed_ms = measure(solution)
+    finally:
+        engine.close()
+
+    reference_fn = REFERENCES.get(problem.number)
+    if reference_fn is not None:
+        reference = repr(normalize(reference_fn(rows)))
+    elif len(answers) > 1:
+        # Majority answer across the alternative solutions.
+        reference = Counter(map(repr, answers.values())).most_common(1)[0][0]
+    else:
+        reference = None
+    for label, answer in answers.items():
+        if reference is None:
+            outcomes[label].scaled = "ran"
+        else:
+            outcomes[label].scaled = "ok" if repr(answer) == reference else "FAIL"
+    return result
+
+
+def print_results(results: Sequence[ProblemResult], engine: str) -> None:
+    """Print a table of verification outcomes and timings."""
+    scale = results[0].scale if results else 0
+    print(colorize(f"\n🗄️  SQL PROBLEMS ({engine}, {scale:,} rows)\n", "bold"))
+    header = (
+        f"{'#':<3} {'solution':<40} {'sample':<7} {'scaled':<8} {'rows':>8}"
+        f" {'no index':>11} {'indexed':>11} {'speedup':>8}"
+    )
+    print(header)
+    print("=" * len(header))
+
+    for result in results:
+        print(colorize(f"{result.number} {result.title}", "cyan"))
+        for outcome in result.solutions:
+            plain = f"{outcome.plain_ms:.2f}ms" if outcome.plain_ms is not None else "-"
+            if outcome.plain_ms is None and outcome.indexed_ms is not None:
+                plain = "timeout"
+            indexed = (
+                f"{outcome.indexed_ms:.2f}ms" if outcome.indexed_ms is not None else "-"
+            )
+            speedup = (
+                f"{outcome.plain_ms / outcome.indexed_ms:.1f}x"
+                if outcome.plain_ms and outcome.indexed_ms
+                else "-"
+            )
+            line = (
+                f"{'':<3} {outcome.label[:40]:<40} {outcome.sample:<7}"
+                f" {outcome.scaled:<8} {outcome.rows:>8} {plain:>11} {indexed:>11}"
+                f" {speedup:>8}"
+            )
+            failed = "FAIL" in (outcome.sample, outcome.scaled) or outcome.scaled in (
+                "error",
+                "timeout",
+            )
+            print(colorize(line, "red") if failed else line)
+            if outcome.error:
+                print(f"{'':<4}   {outcome.error}")
+    print()
+
+
+def main() -> None:
+    """Main entry point."""
+    import argparse
+    from dataclasses import asdict
+
+    parser = argparse.ArgumentParser(
+        description="Verify and benchmark the SQL problem solutions"
+    )
+    parser.add_argument("--problem", "-p", help="Problem number, e.g. 04")
+    parser.add_argument(
+        "--scale",
+        "-s",
+        type=int,
+        default=DEFAULT_SCALE,
+        help="Rows of generated data per main table",
+    )
+    parser.add_argument("--engine", "-e", choices=sorted(ENGINES), default="sqlite")
+    parser.add_argument(
+        "--repeat", "-r", type=int, default=3, help="Runs per query (best is kept)"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=30.0, help="Seconds allowed per query"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Fixture random seed")
+    parser.add_argument("--json", type=Path, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    engine_type = ENGINES[args.engine]
+    problems = [
+        problem
+        for problem in discover_problems()
+        if args.problem is None or problem.number == args.problem.zfill(2)
+    ]
+    results = [
+        run_problem(
+            problem,
+            scale=args.scale,
+            engine_type=engine_type,
+            repeat=args.repeat,
+            timeout=args.timeout,
+            seed=args.seed,
+        )
+        for problem in problems
+    ]
+    print_results(results, args.engine)
+
+    if args.json:
+        args.json.write_text(
+            json.dumps([asdict(result) for result in results], indent=2),
+            encoding="utf-8",
+        )
+        print(colorize(f"✅ Results written to {args.json}", "green"))
+
+
+if __name__ == "__main__":
+    main()
@@ -12,9 +12,15 @@ Usage:
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+from journal_store import JournalStore
+from problem_catalog import get_catalog
 
 # Color codes
 COLORS = {
@@ -34,9 +40,36 @@ def colorize(text: str, color: str) -> str:
     return f"{COLORS.get(color, '')}{text}{COLORS['reset']}"
 
 
+class EventType(str, Enum):
+    """Kinds of progress an achievement can react to."""
+
+    PROBLEM_SOLVED = "problem_solved"
+    STREAK_EXTENDED = "streak_extended"
+    TOPIC_COMPLETED = "topic_completed"
+
+
+# Counters each event type moves; achievements are thresholds on one of them.
+EVENT_COUNTERS = {
+    EventType.PROBLEM_SOLVED: ("solved", "solved_today", "solved_this_week"),
+    EventType.STREAK_EXTENDED: ("best_streak",),
+    EventType.TOPIC_COMPLETED: ("topics_completed",),
+}
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Something that happened to the user's progress."""
+
+    type: EventType
+    problem_id: str | None = None
+    topic: str | None = None
+    streak: int = 0
+    timestamp: datetime = field(default_factory=datetime.now)
+
+
 @dataclass
 class Achievement:
-    """Represents an achievement."""
+    """Represents an achievement unlocked when a counter reaches a threshold."""
 
     id: str
     name: str
@@ -44,14 +77,35 @@ class Achievement:
     icon: str
     tier: str  # Bronze, Silver, Gold, Diamond
     category: str
-    condition_fn: Any
+    event: EventType
+    counter: str
+    threshold: int
     points: int = 10
 
 
+def week_key(day: date) -> str:
+    """Return the ISO week a day falls in, e.g. ``2024-W07``."""
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _empty_counters() -> dict[str, Any]:
+    """Return counters for a user with no progress."""
+    counters: dict[str, Any] = {
+        name: 0 for names in EVENT_COUNTERS.values() for name in names
+    }
+    counters.update(day=None, week=None)
+    return counters
+
+
 class AchievementSystem:
     """Track and manage achievements."""
 
-    def __init__(self, workspace_root: Path | None = None):
+    def __init__(
+        self,
+        workspace_root: Path | None = None,
+        progress_data: dict[str, Any] | None = None,
+    ):
         """Initialize achievement system."""
         if workspace_root is None:
             workspace_root = Path(__file__).parent.parent
@@ -60,18 +114,70 @@ class AchievementSystem:
         self.progress_file = self.workspace_root / ".progress_data.json"
         self.achievement_file = self.workspace_root / ".achievements.json"
 
-        self.progress_data = self._load_progress()
-        self.achievement_data = self._load_achievements()
-        self.achievements = self._define_achievements()
+        # Everything below is loaded on first use, so constructing the system
+        # (e.g. for a shell prompt) costs nothing until a command needs it.
+        self._progress_data = progress_data
+        self._achievement_data: dict[str, Any] | None = None
+        self._topic_problems: dict[str, set[str]] | None = None
+        self._achievements: list[Achievement] | None = None
+        self._index: dict[tuple[EventType, str], list[Achievement]] | None = None
+
+    @property
+    def progress_data(self) -> dict[str, Any]:
+        """Return the progress document, loading it on first use."""
+        if self._progress_data is None:
+            self._progress_data = self._load_progress()
+        return self._progress_data
+
+    @property
+    def achievement_data(self) -> dict[str, Any]:
+        """Return the saved achievement state, loading it on first use."""
+        if self._achievement_data is None:
+            self._achievement_data = self._load_achievements()
+        return self._achievement_data
+
+    @property
+    def topic_problems(self) -> dict[str, set[str]]:
+        """Return the problem ids for each topic in the catalog."""
+        if self._topic_problems is None:
+            self._topic_problems = {}
+            for problem_id, entry in get_catalog(self.workspace_root).problems.items():
+                for topic in entry["topics"]:
+                    self._topic_problems.setdefault(topic, set()).add(problem_id)
+        return self._topic_problems
+
+    @property
+    def total_problems(self) -> int:
+        """Return the number of problems in the catalog."""
+        return len(get_catalog(self.workspace_root).problems)
+
+    @property
+    def achievements(self) -> list[Achievement]:
+        """Return every achievement, defined on first use."""
+        if self._achievements is None:
+            self._achievements = self._define_achievements()
+        return self._achievements
+
+    @property
+    def index(self) -> dict[tuple[EventType, str], list[Achievement]]:
+        """Return pending achievements by (event, counter), built on first use."""
+        if self._index is None:
+            self._index = self._build_index()
+        return self._index
 
     def _load_progress(self) -> dict[str, Any]:
         """Load progress data."""
-        if self.progress_file.exists():
-            try:
-                return json.loads(self.progress_file.read_text(encoding="utf-8"))
-            except Exception:
-                pass
-        return {"completed": [], "streak_data": {"current": 0, "best": 0}}
+        store = JournalStore(
+            self.progress_file,
+            # Same shape as ProgressTracker's default so journal replays apply.
+            default=lambda: {
+                "completed": [],
+                "attempts": {},
+                "streak_data": {"current": 0, "best": 0, "last_date": None},
+                "achievements": [],
+            },
+        )
+        return store.data
 
     def _load_achievements(self) -> dict[str, Any]:
         """Load achievement data."""
@@ -82,6 +188,11 @@ class AchievementSystem:
                 pass
         return {"unlocked": [], "progress": {}, "total_points": 0}
 
+    @property
+    def counters(self) -> dict[str, Any]:
+        """Return the persisted event counters."""
+        return self.achievement_data.setdefault("counters", _empty_counters())
+
     def _save_achievements(self) -> None:
         """Save achievement data."""
         self.achievement_file.write_text(
@@ -91,9 +202,7 @@ class AchievementSystem:
 
     def _define_achievements(self) -> list[Achievement]:
         """Define all available achievements."""
-        completed_count = len(self.progress_data.get("completed", []))
-        self.progress_data.get("streak_data", {}).get("current", 0)
-        best_streak = self.progress_data.get("streak_data", {}).get("best", 0)
+        total_problems = self.total_problems
 
         return [
             # Getting Started
@@ -104,7 +213,9 @@ class AchievementSystem:
                 "🌟",
                 "Bronze",
                 "Getting Started",
-                lambda: completed_count >= 1,
+                EventType.PROBLEM_SOLVED,
+                "solved",
+                1,
                 10,
             ),
             Achievement(
@@ -114,7 +225,9 @@ class AchievementSystem:
                 "🔰",
                 "Bronze",
                 "Getting Started",
-                lambda: completed_count >= 5,
+                EventType.PROBLEM_SOLVED,
+                "solved",
+                5,
                 25,
             ),
             Achievement(
@@ -124,7 +237,9 @@ class AchievementSystem:
                 "📈",
                 "Silver",
                 "Getting Started",
-                lambda: completed_count >= 10,
+                EventType.PROBLEM_SOLVED,
+                "solved",
+                10,
                 50,
             ),
             Achievement(
@@ -134,17 +249,21 @@ class AchievementSystem:
                 "💪",
                 "Silver",
                 "Getting Started",
-                lambda: completed_count >= 20,
+                EventType.PROBLEM_SOLVED,
+                "solved",
+                20,
                 100,
             ),
             Achievement(
                 "all_solved",
                 "Master",
-                "Solved all 35 problems!",
+                f"Solved all {total_problems} problems!",
                 "🏅",
                 "Gold",
                 "Getting Started",
-                lambda: completed_count >= 35,
+                EventType.PROBLEM_SOLVED,
+                "solved",
+                max(total_problems, 1),
                 500,
             ),
             # Streaks
@@ -155,7 +274,9 @@ class AchievementSystem:
                 "🔥",
                 "Bronze",
                 "Streaks",
-                lambda: best_streak >= 3,
+                EventType.STREAK_EXTENDED,
+                "best_streak",
+                3,
                 30,
             ),
             Achievement(
@@ -165,7 +286,9 @@ class AchievementSystem:
                 "⚡",
                 "Silver",
                 "Streaks",
-                lambda: best_streak >= 7,
+                EventType.STREAK_EXTENDED,
+                "best_streak",
+                7,
                 70,
             ),
             Achievement(
@@ -175,7 +298,9 @@ class AchievementSystem:
                 "🚀",
                 "Gold",
                 "Streaks",
-                lambda: best_streak >= 30,
+                EventType.STREAK_EXTENDED,
+                "best_streak",
+                30,
                 300,
             ),
             Achievement(
@@ -185,7 +310,9 @@ class AchievementSystem:
                 "💎",
                 "Diamond",
                 "Streaks",
-                lambda: best_streak >= 100,
+                EventType.STREAK_EXTENDED,
+                "best_streak",
+                100,
                 1000,
             ),
             # Speed Challenges
@@ -196,7 +323,9 @@ class AchievementSystem:
                 "⚡",
                 "Silver",
                 "Speed",
-                lambda: False,  # TODO: Track this
+                EventType.PROBLEM_SOLVED,
+                "solved_today",
+                5,
                 100,
             ),
             Achievement(
@@ -206,28 +335,176 @@ class AchievementSystem:
                 "🏃",
                 "Gold",
                 "Speed",
-                lambda: False,  # TODO: Track this
+                EventType.PROBLEM_SOLVED,
+                "solved_this_week",
+                10,
                 200,
             ),
+            # Topics
+            Achievement(
+                "first_topic",
+                "Topic Specialist",
+                "Solved every problem in a topic!",
+                "🎓",
+                "Bronze",
+                "Topics",
+                EventType.TOPIC_COMPLETED,
+                "topics_completed",
+                1,
+                50,
+            ),
+            Achievement(
+                "five_topics",
+                "Well-Rounded",
+                "Solved every problem in 5 topics!",
+                "🧭",
+                "Silver",
+                "Topics",
+                EventType.TOPIC_COMPLETED,
+                "topics_completed",
+                5,
+                150,
+            ),
+            Achievement(
+                "ten_topics",
+                "Polymath",
+                "Solved every problem in 10 topics!",
+                "🧠",
+                "Gold",
+                "Topics",
+                EventType.TOPIC_COMPLETED,
+                "topics_completed",
+                10,
+                300,
+            ),
         ]
 
-    def check_achievements(self) -> list[Achievement]:
-        """Check for newly unlocked achievements."""
-        newly_unlocked = []
+    def _build_index(self) -> dict[tuple[EventType, str], list[Achievement]]:
+        """Index locked achievements by the event and counter they depend on.
 
+        Each list is sorted by descending threshold, so the achievements an
+        update can unlock are always at the end.
+        """
+        unlocked = set(self.achievement_data["unlocked"])
+        index: dict[tuple[EventType, str], list[Achievement]] = {}
         for achievement in self.achievements:
-            if achievement.id not in self.achievement_data["unlocked"]:
-                try:
-                    if achievement.condition_fn():
-                        self.achievement_data["unlocked"].append(achievement.id)
-                        self.achievement_data["total_points"] += achievement.points
-                        newly_unlocked.append(achievement)
-                except Exception:
-                    pass
+            if achievement.id not in unlocked:
+                key = (achievement.event, achievement.counter)
+                index.setdefault(key, []).append(achievement)
+        for pending in index.values():
+            pending.sort(key=lambda achievement: -achievement.threshold)
+        return index
+
+    def _unlock_reached(
+        self, event: EventType, counter: str, value: int
+    ) -> list[Achievement]:
+        """Unlock every pending achievement on ``counter`` that ``value`` reaches."""
+        pending = self.index.get((event, counter))
+        unlocked = []
+        while pending and pending[-1].threshold <= value:
+            achievement = pending.pop()
+            self.achievement_data["unlocked"].append(achievement.id)
+            self.achievement_data["total_points"] += achievement.points
+            unlocked.append(achievement)
+        return unlocked
+
+    def _count(self, event: ProgressEvent) -> None:
+        """Update the counters affected by one event."""
+        counters = self.counters
+        if event.type is EventType.PROBLEM_SOLVED:
+            day = event.timestamp.date()
+            if counters["day"] != day.isoformat():
+                counters["day"], counters["solved_today"] = day.isoformat(), 0
+            if counters["week"] != week_key(day):
+                counters["week"], counters["solved_this_week"] = week_key(day), 0
+            counters["solved"] += 1
+            counters["solved_today"] += 1
+            counters["solved_this_week"] += 1
+        elif event.type is EventType.STREAK_EXTENDED:
+            counters["best_streak"] = max(counters["best_streak"], event.streak)
+        elif event.type is EventType.TOPIC_COMPLETED:
+            counters["topics_completed"] += 1
+
+    def record(self, events: Iterable[ProgressEvent]) -> list[Achievement]:
+        """Apply progress events and return the achievements they unlock.
+
+        Only achievements indexed under each event's counters are looked at.
+        """
+        newly_unlocked = []
+        for event in events:
+            self._count(event)
+            for counter in EVENT_COUNTERS[event.type]:
+                newly_unlocked += self._unlock_reached(
+                    event.type, counter, self.counters[counter]
+                )
 
-        if newly_unlocked:
-            self._save_achievements()
+        self._save_achievements()
+        return newly_unlocked
+
+    def _in_sync(self) -> bool:
+        """Check whether the counters still describe the progress data."""
+        counters = self.achievement_data.get("counters")
+        streak = self.progress_data.get("streak_data", {})
+        return (
+            counters is not None
+            and counters["solved"] == len(self.progress_data.get("completed", []))
+            and counters["best_streak"] == streak.get("best", 0)
+        )
+
+    def _rebuild_counters(self) -> dict[str, int]:
+        """Recompute counters from progress data; return peak values reached."""
+        completed = set(self.progress_data.get("completed", []))
+        attempts = self.progress_data.get("attempts", {})
+
+        # Day each completed problem was first solved, for the speed counters.
+        solved_on = []
+        for problem_id in completed:
+            dates = [
+                attempt["date"]
+                for attempt in attempts.get(problem_id, [])
+                if attempt.get("solved")
+            ]
+            if dates:
+                solved_on.append(datetime.fromisoformat(min(dates)).date())
+        per_day = Counter(day.isoformat() for day in solved_on)
+        per_week = Counter(week_key(day) for day in solved_on)
+
+        today = date.today()
+        counters = _empty_counters()
+        counters.update(
+            solved=len(completed),
+            best_streak=self.progress_data.get("streak_data", {}).get("best", 0),
+            topics_completed=sum(
+                1 for problems in self.topic_problems.values() if problems <= completed
+            ),
+            day=today.isoformat(),
+            week=week_key(today),
+            solved_today=per_day[today.isoformat()],
+            solved_this_week=per_week[week_key(today)],
+        )
+        self.achievement_data["counters"] = counters
+
+        return {
+            **counters,
+            "solved_today": max(per_day.values(), default=0),
+            "solved_this_week": max(per_week.values(), default=0),
+        }
+
+    def check_achievements(self) -> list[Achievement]:
+        """Catch up with progress that was recorded without events.
 
+        This is a constant-time check unless the progress data changed behind
+        the system's back (older versions, edits or un-marked problems), in
+        which case counters are rebuilt once from the progress data.
+        """
+        if self._in_sync():
+            return []
+
+        peaks = self._rebuild_counters()
+        newly_unlocked = []
+        for event, counter in list(self.index):
+            newly_unlocked += self._unlock_reached(event, counter, peaks[counter])
+        self._save_achievements()
         return newly_unlocked
 
     def display_achievements(self, show_locked: bool = True) -> None:
@@ -315,30 +592,19 @@ class AchievementSystem:
         print(colorize("\n🎯 NEXT ACHIEVEMENTS\n", "bold"))
         print("=" * 70)
 
-        # Find locked achievements that are close to unlocking
-        completed_count = len(self.progress_data.get("completed", []))
-
-        next_milestones = [
-            ("first_solve", 1, completed_count),
-            ("five_solved", 5, completed_count),
-            ("ten_solved", 10, completed_count),
-            ("twenty_solved", 20, completed_count),
-            ("all_solved", 35, completed_count),
-        ]
-
-        for achievement_id, target, current in next_milestones:
-            achievement = next(
-                (a for a in self.achievements if a.id == achievement_id), None
-            )
-
-            if achievement and achievement_id not in self.achievement_data["unlocked"]:
-                remaining = target - current
-                print(f"\n{achievement.icon} {colorize(achievement.name, 'yellow')}")
-                print(f"   {achievement.description}")
-                print(f"   Progress: {current}/{target} problems")
-                if remaining > 0:
-                    print(colorize(f"   🎯 {remaining} more to unlock!", "cyan"))
-                break
+        self.check_achievements()
+        current = self.counters["solved"]
+        pending = self.index.get((EventType.PROBLEM_SOLVED, "solved"))
+
+        if pending:
+            # Lists are sorted so the closest milestone is last.
+            achievement = pending[-1]
+            remaining = achievement.threshold - current
+            print(f"\n{achievement.icon} {colorize(achievement.name, 'yellow')}")
+            print(f"   {achievement.description}")
+            print(f"   Progress: {current}/{achievement.threshold} problems")
+            if remaining > 0:
+                print(colorize(f"   🎯 {remaining} more to unlock!", "cyan"))
 
         print()
 
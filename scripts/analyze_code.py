@@ -11,16 +11,27 @@ Analyzes solution code for:
 Usage:
     python scripts/analyze_code.py solutions/01-two-sum.py
     python scripts/analyze_code.py solutions/ --all
+    python scripts/analyze_code.py solutions/ --all --summary --workers 8
     python scripts/analyze_code.py solutions/15-valid-palindrome.py --detailed
 """
 
 from __future__ import annotations
 
 import ast
+import hashlib
+import json
+import os
 import re
+import tempfile
 from pathlib import Path
 from typing import Any
 
+# Bump when the analysis output changes so cached results are discarded.
+ANALYZER_VERSION = 1
+# Below this many uncached files, starting a process pool costs more than it saves.
+PARALLEL_THRESHOLD = 16
+CACHE_FILE_NAME = ".code_analysis_cache.json"
+
 # Color codes
 COLORS = {
     "green": "\033[92m",
@@ -38,6 +49,184 @@ def colorize(text: str, color: str) -> str:
     return f"{COLORS.get(color, '')}{text}{COLORS['reset']}"
 
 
+class _MetricsVisitor(ast.NodeVisitor):
+    """Collect every AST-based metric in a single traversal."""
+
+    def __init__(self) -> None:
+        """Initialize counters."""
+        self.functions = 0
+        self.classes = 0
+        self.cyclomatic = 1
+        self.max_loop_depth = 0
+        self.recursion = False
+        self.function_docstrings = 0
+        self.list_comps = 0
+        self.has_annotations = False
+        self.magic_numbers: list[Any] = []
+        self._loop_depth = 0
+        self._function_names: list[str] = []
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        """Count a function and track its name for recursion checks."""
+        self.functions += 1
+        if ast.get_docstring(node):
+            self.function_docstrings += 1
+        if node.returns:
+            self.has_annotations = True
+
+        self._function_names.append(node.name)
+        self.generic_visit(node)
+        self._function_names.pop()
+
+    def visit_ClassDef(self, node: ast.ClassDef) -> None:
+        """Count a class."""
+        self.classes += 1
+        self.generic_visit(node)
+
+    def _visit_loop(self, node: ast.For | ast.While) -> None:
+        """Count a branch and track loop nesting depth."""
+        self.cyclomatic += 1
+        self._loop_depth += 1
+        self.max_loop_depth = max(self.max_loop_depth, self._loop_depth)
+        self.generic_visit(node)
+        self._loop_depth -= 1
+
+    visit_For = _visit_loop
+    visit_While = _visit_loop
+
+    def visit_If(self, node: ast.If) -> None:
+        """Count a branch."""
+        self.cyclomatic += 1
+        self.generic_visit(node)
+
+    def visit_ExceptHandler(self, node: ast.ExceptHandler) -> None:
+        """Count a branch."""
+        self.cyclomatic += 1
+        self.generic_visit(node)
+
+    def visit_BoolOp(self, node: ast.BoolOp) -> None:
+        """Count each short-circuit operand as a branch."""
+        self.cyclomatic += len(node.values) - 1
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        """Detect calls to an enclosing function by name."""
+        if isinstance(node.func, ast.Name) and node.func.id in self._function_names:
+            self.recursion = True
+        self.generic_visit(node)
+
+    def visit_ListComp(self, node: ast.ListComp) -> None:
+        """Count a list comprehension."""
+        self.list_comps += 1
+        self.generic_visit(node)
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        """Record numeric literals other than common ones."""
+        value = node.value
+        if isinstance(value, (int, float, complex)) and not isinstance(value, bool):
+            if value not in [0, 1, -1, 2]:  # Common acceptable numbers
+                self.magic_numbers.append(value)
+
+
+def _analyze_source(file: str, code: str) -> dict[str, Any]:
+    """Analyze source text; a module-level function so pool workers can run it."""
+    return CodeAnalyzer().analyze_source(code, file)
+
+
+class AnalysisCache:
+    """Analysis results keyed by a hash of the file contents.
+
+    Each entry also lists the files it was seen for, so a run over one
+    directory can prune its own stale entries without touching the rest.
+    """
+
+    def __init__(self, cache_file: Path):
+        """Load cached results from ``cache_file``."""
+        self.cache_file = cache_file
+        self.entries: dict[str, dict[str, Any]] = {}
+        # Keys looked up or stored during this run.
+        self.used: set[str] = set()
+        self.dirty = False
+
+        if self.cache_file.exists():
+            try:
+                data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+                if data.get("version") == ANALYZER_VERSION:
+                    self.entries = data["entries"]
+            except Exception:
+                pass
+
+    @staticmethod
+    def key(code: str) -> str:
+        """Return the cache key for some source text."""
+        return hashlib.sha256(code.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, path: Path) -> dict[str, Any] | None:
+        """Return the cached analysis of ``path``'s contents, if any."""
+        self.used.add(key)
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        paths = entry.setdefault("paths", [])
+        name = str(path.resolve())
+        if name not in paths:
+            paths.append(name)
+            self.dirty = True
+        return {k: v for k, v in entry.items() if k != "paths"}
+
+    def put(self, key: str, analysis: dict[str, Any], path: Path) -> None:
+        """Remember the analysis of ``path``'s contents under ``key``."""
+        entry = {k: v for k, v in analysis.items() if k != "file"}
+        entry["paths"] = [str(path.resolve())]
+        self.entries[key] = entry
+        self.used.add(key)
+        self.dirty = True
+
+    def prune(self, roots: list[Path]) -> None:
+        """Drop entries this run did not use whose files are under ``roots`` or gone.
+
+        Such a file was edited, renamed or deleted since it was cached.
+        Entries for files elsewhere that still exist belong to other runs
+        and are kept.
+        """
+        resolved = [root.resolve() for root in roots]
+
+        def stale(name: str) -> bool:
+            path = Path(name)
+            return any(path.is_relative_to(root) for root in resolved) or (
+                not path.exists()
+            )
+
+        kept = {
+            key: entry
+            for key, entry in self.entries.items()
+            if key in self.used or not all(map(stale, entry.get("paths", [])))
+        }
+        if len(kept) != len(self.entries):
+            self.entries = kept
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache atomically if it changed."""
+        if not self.dirty:
+            return
+
+        # A unique temporary name, so concurrent runs never share one.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.cache_file.parent, prefix=self.cache_file.name + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(
+                    {"version": ANALYZER_VERSION, "entries": self.entries}, handle
+                )
+            os.replace(tmp_name, self.cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        self.dirty = False
+
+
 class CodeAnalyzer:
     """Analyze code quality and complexity."""
 
@@ -51,17 +240,26 @@ class CodeAnalyzer:
         """Analyze a Python file."""
         try:
             code = file_path.read_text(encoding="utf-8")
+        except Exception as e:
+            return {"error": str(e), "file": str(file_path)}
+        return self.analyze_source(code, str(file_path))
+
+    def analyze_source(self, code: str, file: str = "<string>") -> dict[str, Any]:
+        """Analyze Python source text."""
+        try:
             tree = ast.parse(code)
+            metrics = _MetricsVisitor()
+            metrics.visit(tree)
 
             analysis = {
-                "file": str(file_path),
+                "file": file,
                 "lines": len(code.split("\n")),
-                "functions": self._count_functions(tree),
-                "classes": self._count_classes(tree),
-                "complexity": self._analyze_complexity(tree, code),
+                "functions": metrics.functions,
+                "classes": metrics.classes,
+                "complexity": self._analyze_complexity(metrics, code),
                 "style": self._analyze_style(code),
-                "documentation": self._analyze_documentation(tree, code),
-                "best_practices": self._check_best_practices(tree, code),
+                "documentation": self._analyze_documentation(tree, metrics),
+                "best_practices": self._check_best_practices(metrics, code),
                 "score": 0,
             }
 
@@ -71,80 +269,80 @@ class CodeAnalyzer:
             return analysis
 
         except Exception as e:
-            return {"error": str(e), "file": str(file_path)}
+            return {"error": str(e), "file": file}
+
+    def analyze_paths(
+        self,
+        paths: list[Path],
+        workers: int | None = None,
+        cache: AnalysisCache | None = None,
+    ) -> list[dict[str, Any]]:
+        """Analyze many files, skipping cached ones and fanning out the rest.
+
+        Files whose contents hash to a cached entry are not parsed again; the
+        remaining files are analyzed in a process pool when there are enough
+        of them to pay for starting one.
+        """
+        results: list[dict[str, Any] | None] = [None] * len(paths)
+        pending: list[tuple[int, str, str]] = []
+        keys: list[str | None] = [None] * len(paths)
+
+        for index, path in enumerate(paths):
+            try:
+                code = path.read_text(encoding="utf-8")
+            except Exception as e:
+                results[index] = {"error": str(e), "file": str(path)}
+                continue
+
+            if cache is not None:
+                keys[index] = key = cache.key(code)
+                cached = cache.get(key, path)
+                if cached is not None:
+                    results[index] = {**cached, "file": str(path)}
+                    continue
+            pending.append((index, str(path), code))
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers > 1 and len(pending) >= PARALLEL_THRESHOLD:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                analyses = list(
+                    pool.map(
+                        _analyze_source,
+                        [file for _, file, _ in pending],
+                        [code for _, _, code in pending],
+                        chunksize=max(1, len(pending) // (workers * 4)),
+                    )
+                )
+        else:
+            analyses = [self.analyze_source(code, file) for _, file, code in pending]
 
-    def _count_functions(self, tree: ast.AST) -> int:
-        """Count function definitions."""
-        return sum(1 for node in ast.walk(tree) if isinstance(node, ast.FunctionDef))
+        for (index, _, _), analysis in zip(pending, analyses, strict=True):
+            results[index] = analysis
+            cache_key = keys[index]
+            if cache is not None and cache_key is not None and "error" not in analysis:
+                cache.put(cache_key, analysis, paths[index])
 
-    def _count_classes(self, tree: ast.AST) -> int:
-        """Count class definitions."""
-        return sum(1 for node in ast.walk(tree) if isinstance(node, ast.ClassDef))
+        return [analysis for analysis in results if analysis is not None]
 
-    def _analyze_complexity(self, tree: ast.AST, code: str) -> dict[str, Any]:
+    def _analyze_complexity(
+        self, metrics: _MetricsVisitor, code: str
+    ) -> dict[str, Any]:
         """Analyze time and space complexity."""
-        complexity = {
-            "time": "Unknown",
-            "space": "Unknown",
-            "cyclomatic": self._calculate_cyclomatic(tree),
-            "nested_loops": self._count_nested_loops(tree),
-            "recursion": self._has_recursion(tree),
+        return {
+            "time": self._estimate_time_complexity(metrics, code),
+            "space": self._estimate_space_complexity(metrics, code),
+            "cyclomatic": metrics.cyclomatic,
+            "nested_loops": metrics.max_loop_depth,
+            "recursion": metrics.recursion,
         }
 
-        # Try to detect complexity from code
-        complexity["time"] = self._estimate_time_complexity(tree, code)
-        complexity["space"] = self._estimate_space_complexity(tree, code)
-
-        return complexity
-
-    def _calculate_cyclomatic(self, tree: ast.AST) -> int:
-        """Calculate cyclomatic complexity."""
-        complexity = 1
-
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
-                complexity += 1
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
-
-        return complexity
-
-    def _count_nested_loops(self, tree: ast.AST) -> int:
-        """Count maximum nesting level of loops."""
-
-        def count_depth(node: ast.AST, current_depth: int = 0) -> int:
-            depth = current_depth
-            if isinstance(node, (ast.For, ast.While)):
-                depth += 1
-
-            max_found = depth
-            for child in ast.iter_child_nodes(node):
-                child_depth = count_depth(child, depth)
-                max_found = max(max_found, child_depth)
-
-            return max_found
-
-        return count_depth(tree)
-
-    def _has_recursion(self, tree: ast.AST) -> bool:
-        """Check if code uses recursion."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                func_name = node.name
-                # Check if function calls itself
-                for child in ast.walk(node):
-                    if isinstance(child, ast.Call):
-                        if (
-                            isinstance(child.func, ast.Name)
-                            and child.func.id == func_name
-                        ):
-                            return True
-        return False
-
-    def _estimate_time_complexity(self, tree: ast.AST, code: str) -> str:
+    def _estimate_time_complexity(self, metrics: _MetricsVisitor, code: str) -> str:
         """Estimate time complexity."""
         # Check for common patterns
-        nested_loops = self._count_nested_loops(tree)
+        nested_loops = metrics.max_loop_depth
 
         if nested_loops >= 3:
             return "O(n³) or worse"
@@ -155,17 +353,17 @@ class CodeAnalyzer:
             if "//2" in code or "left" in code and "right" in code:
                 return "O(n log n) or O(n)"
             return "O(n)"
-        elif self._has_recursion(tree):
+        elif metrics.recursion:
             return "O(2ⁿ) or O(n)"
         else:
             return "O(1) or O(n)"
 
-    def _estimate_space_complexity(self, tree: ast.AST, code: str) -> str:
+    def _estimate_space_complexity(self, metrics: _MetricsVisitor, code: str) -> str:
         """Estimate space complexity."""
         # Simple heuristic based on data structure usage
         if "dict" in code.lower() or "set" in code.lower():
             return "O(n)"
-        elif self._has_recursion(tree):
+        elif metrics.recursion:
             return "O(n) recursion stack"
         else:
             return "O(1)"
@@ -191,20 +389,16 @@ class CodeAnalyzer:
 
         return style
 
-    def _analyze_documentation(self, tree: ast.AST, code: str) -> dict[str, Any]:
+    def _analyze_documentation(
+        self, tree: ast.AST, metrics: _MetricsVisitor
+    ) -> dict[str, Any]:
         """Analyze documentation quality."""
         doc = {
             "has_module_docstring": ast.get_docstring(tree) is not None,
-            "function_docstrings": 0,
-            "total_functions": 0,
+            "function_docstrings": metrics.function_docstrings,
+            "total_functions": metrics.functions,
         }
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                doc["total_functions"] += 1
-                if ast.get_docstring(node):
-                    doc["function_docstrings"] += 1
-
         if doc["total_functions"] > 0:
             doc["docstring_coverage"] = (
                 doc["function_docstrings"] / doc["total_functions"] * 100
@@ -214,36 +408,23 @@ class CodeAnalyzer:
 
         return doc
 
-    def _check_best_practices(self, tree: ast.AST, code: str) -> list[str]:
+    def _check_best_practices(self, metrics: _MetricsVisitor, code: str) -> list[str]:
         """Check for best practices."""
         practices = []
 
         # Check for list comprehensions vs loops
-        list_comps = sum(1 for node in ast.walk(tree) if isinstance(node, ast.ListComp))
-        if list_comps > 0:
+        if metrics.list_comps > 0:
             practices.append("✅ Uses list comprehensions")
 
         # Check for type hints
-        has_annotations = False
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.returns:
-                has_annotations = True
-                break
-
-        if has_annotations:
+        if metrics.has_annotations:
             practices.append("✅ Uses type hints")
         else:
             practices.append("⚠️  Consider adding type hints")
 
         # Check for magic numbers
-        magic_numbers = []
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Num) and not isinstance(node.n, bool):
-                if node.n not in [0, 1, -1, 2]:  # Common acceptable numbers
-                    magic_numbers.append(node.n)
-
-        if magic_numbers:
-            practices.append(f"⚠️  Magic numbers found: {set(magic_numbers)}")
+        if metrics.magic_numbers:
+            practices.append(f"⚠️  Magic numbers found: {set(metrics.magic_numbers)}")
 
         # Check for early returns
         if "return" in code:
@@ -338,6 +519,29 @@ class CodeAnalyzer:
         print()
 
 
+def display_summary(analyses: list[dict[str, Any]]) -> None:
+    """Display one line per analyzed file plus the average score."""
+    print(colorize(f"\n📊 CODE ANALYSIS SUMMARY ({len(analyses)} files)\n", "bold"))
+
+    scores = []
+    for analysis in sorted(analyses, key=lambda a: a["file"]):
+        if "error" in analysis:
+            print(colorize(f"   ERR  {analysis['file']}: {analysis['error']}", "red"))
+            continue
+
+        score = analysis["score"]
+        scores.append(score)
+        color = "green" if score >= 80 else "yellow" if score >= 60 else "red"
+        print(
+            f"   {colorize(f'{score:3d}', color)}  "
+            f"{analysis['complexity']['time']:<20} {analysis['file']}"
+        )
+
+    if scores:
+        print(colorize(f"\n🎯 Average Score: {sum(scores) / len(scores):.1f}", "cyan"))
+    print()
+
+
 def main() -> None:
     """Main entry point."""
     import argparse
@@ -350,6 +554,22 @@ def main() -> None:
     parser.add_argument(
         "--detailed", "-d", action="store_true", help="Show detailed analysis"
     )
+    parser.add_argument(
+        "--summary",
+        "-s",
+        action="store_true",
+        help="Show one line per file instead of full reports",
+    )
+    parser.add_argument(
+        "--workers",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker processes for directories (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Re-analyze files even if unchanged"
+    )
 
     args = parser.parse_args()
 
@@ -360,9 +580,25 @@ def main() -> None:
         analysis = analyzer.analyze_file(path)
         analyzer.display_analysis(analysis, detailed=args.detailed)
     elif path.is_dir() and args.all:
-        for py_file in path.glob("**/*.py"):
-            if "__pycache__" not in str(py_file):
-                analysis = analyzer.analyze_file(py_file)
+        py_files = sorted(
+            py_file
+            for py_file in path.glob("**/*.py")
+            if "__pycache__" not in py_file.parts
+        )
+
+        cache = None
+        if not args.no_cache:
+            cache = AnalysisCache(Path(__file__).parent.parent / CACHE_FILE_NAME)
+        analyses = analyzer.analyze_paths(py_files, workers=args.workers, cache=cache)
+        if cache is not None:
+            # Drop entries for files here that were deleted, renamed or edited.
+            cache.prune([path])
+            cache.save()
+
+        if args.summary:
+            display_summary(analyses)
+        else:
+            for analysis in analyses:
                 analyzer.display_analysis(analysis, detailed=args.detailed)
     else:
         print(colorize("❌ Invalid path or missing --all flag for directory", "red"))
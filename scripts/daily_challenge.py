@@ -2,7 +2,7 @@
 """Daily Challenge System for Interview Prep.
 
 Generates a personalized daily coding challenge based on:
-- Spaced repetition algorithm
+- SM-2 spaced repetition scheduling
 - Topics that need review
 - Your skill progression
 - Problems you haven't attempted
@@ -11,16 +11,19 @@ Usage:
     python scripts/daily_challenge.py
     python scripts/daily_challenge.py --difficulty easy
     python scripts/daily_challenge.py --topic arrays
+    python scripts/daily_challenge.py --complete 01-two-sum --quality 4
 """
 
 from __future__ import annotations
 
-import json
-import random
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from journal_store import JournalStore
+from problem_catalog import get_catalog
+from review_queue import ReviewQueue, sm2_update
+
 # Color codes
 COLORS = {
     "green": "\033[92m",
@@ -50,103 +53,78 @@ class DailyChallengeSystem:
         self.problems_dir = self.workspace_root / "languages" / "python" / "problems"
         self.challenge_file = self.workspace_root / ".daily_challenge.json"
 
-        self.problems = self._discover_problems()
-        self.challenge_data = self._load_challenge_data()
+        self.store = JournalStore(
+            self.challenge_file, default=self._default_challenge_data
+        )
+        self.challenge_data = self.store.data
+        self._problems: dict[str, dict[str, Any]] | None = None
+        self._queue: ReviewQueue | None = None
+
+    @property
+    def problems(self) -> dict[str, dict[str, Any]]:
+        """Return all problems, discovered on first use."""
+        if self._problems is None:
+            self._problems = self._discover_problems()
+        return self._problems
 
     def _discover_problems(self) -> dict[str, dict[str, Any]]:
-        """Discover all problems from markdown files."""
+        """Discover all problems from the shared problem catalog."""
         problems = {}
 
-        if not self.problems_dir.exists():
-            return problems
-
-        for md_file in self.problems_dir.glob("*.md"):
-            if md_file.name in ["README.md", "ISSUES_SEED.md"]:
-                continue
-
-            problem_id = md_file.stem
-            content = md_file.read_text(encoding="utf-8")
-
-            # Extract problem details
-            difficulty = "Medium"
-            topics = []
-            statement = ""
-
-            lines = content.split("\n")
-            for i, line in enumerate(lines[:20]):
-                if line.startswith("Difficulty:"):
-                    difficulty = line.split(":", 1)[1].strip()
-                elif line.startswith("Topics:"):
-                    topics = [t.strip() for t in line.split(":", 1)[1].split(",")]
-                elif line.startswith("Statement"):
-                    # Get the next few lines for statement
-                    statement = "\n".join(lines[i + 1 : i + 4]).strip()
-
+        for problem_id, entry in get_catalog(self.workspace_root).problems.items():
             problems[problem_id] = {
                 "id": problem_id,
-                "name": md_file.stem.replace("-", " ").title(),
-                "difficulty": difficulty,
-                "topics": topics,
-                "statement": statement,
-                "file": str(md_file.relative_to(self.workspace_root)),
+                "name": entry["name"],
+                "difficulty": entry["difficulty"] or "Medium",
+                "topics": entry["topics"],
+                "statement": entry["statement"],
+                "file": entry["file"],
             }
 
         return problems
 
-    def _load_challenge_data(self) -> dict[str, Any]:
-        """Load challenge history data."""
-        if self.challenge_file.exists():
-            try:
-                return json.loads(self.challenge_file.read_text(encoding="utf-8"))
-            except Exception:
-                pass
-
+    @staticmethod
+    def _default_challenge_data() -> dict[str, Any]:
+        """Return challenge data for a fresh workspace."""
         return {
             "history": [],
             "problem_stats": {},
             "last_challenge_date": None,
         }
 
-    def _save_challenge_data(self) -> None:
-        """Save challenge data."""
-        self.challenge_file.write_text(
-            json.dumps(self.challenge_data, indent=2),
-            encoding="utf-8",
-        )
-
-    def _calculate_review_score(self, problem_id: str) -> float:
-        """Calculate when a problem should be reviewed (lower = sooner).
-
-        Uses spaced repetition algorithm.
+    @property
+    def queue(self) -> ReviewQueue:
+        """Return the review queue, building it on first use."""
+        if self._queue is None:
+            self._queue = ReviewQueue(
+                self.problems, self.challenge_data["problem_stats"]
+            )
+        return self._queue
+
+    def _sync_queue(self) -> None:
+        """Apply stats other processes committed since the queue was built.
+
+        Call inside a transaction. Only the rescheduled problems are pushed;
+        the queue is rebuilt only when the store had to reload everything
+        (after another process compacted the journal).
         """
-        if problem_id not in self.challenge_data["problem_stats"]:
-            return 0.0  # Never seen, high priority
-
-        stats = self.challenge_data["problem_stats"][problem_id]
-        last_attempt = datetime.fromisoformat(stats["last_attempt"])
-        days_since = (datetime.now() - last_attempt).days
-
-        # Calculate interval based on success rate
-        success_count = stats.get("success_count", 0)
-        attempt_count = stats.get("attempt_count", 0)
-        success_rate = success_count / attempt_count if attempt_count > 0 else 0
-
-        # Spaced repetition intervals: 1, 3, 7, 14, 30 days
-        if success_rate < 0.5:
-            target_interval = 1  # Review frequently if struggling
-        elif success_rate < 0.7:
-            target_interval = 3
-        elif success_rate < 0.85:
-            target_interval = 7
-        elif success_rate < 0.95:
-            target_interval = 14
-        else:
-            target_interval = 30  # Mastered, review monthly
-
-        # Score: negative if overdue for review, positive if not yet time
-        score = target_interval - days_since
+        if self._queue is None:
+            return
+        ops = self.store.refreshed_ops
+        if ops is None:
+            self._queue = None
+            return
 
-        return score
+        problem_stats = self.challenge_data["problem_stats"]
+        for _, path, _ in ops:
+            if path[0] != "problem_stats":
+                continue
+            if len(path) == 1:
+                self._queue = None
+                return
+            stats = problem_stats.get(path[1])
+            if stats:
+                self._queue.update(path[1], stats)
 
     def select_daily_challenge(
         self,
@@ -156,90 +134,73 @@ class DailyChallengeSystem:
         """Select today's challenge."""
         today = datetime.now().date().isoformat()
 
-        # Check if already challenged today
-        if self.challenge_data.get("last_challenge_date") == today:
-            # Return today's challenge from history
-            for challenge in reversed(self.challenge_data["history"]):
-                if challenge["date"] == today:
-                    return self.problems.get(challenge["problem_id"])
-
-        # Filter problems by criteria
-        candidates = []
-
-        for problem_id, problem in self.problems.items():
-            # Apply filters
-            if difficulty and problem["difficulty"] != difficulty:
-                continue
-            if topic and topic not in problem["topics"]:
-                continue
-
-            candidates.append((problem_id, problem))
-
-        if not candidates:
-            return None
-
-        # Score each candidate
-        scored = []
-        for problem_id, problem in candidates:
-            # Calculate multiple factors
-            review_score = self._calculate_review_score(problem_id)
-
-            # Bonus for never attempted
-            stats = self.challenge_data["problem_stats"].get(problem_id, {})
-            novelty_bonus = 100 if not stats else 0
-
-            # Slight randomness for variety
-            randomness = random.uniform(-5, 5)
-
-            total_score = review_score + novelty_bonus + randomness
-            scored.append((total_score, problem_id, problem))
-
-        # Sort by score (lower = higher priority)
-        scored.sort()
-
-        # Select the top problem
-        selected_problem_id = scored[0][1]
-        selected_problem = scored[0][2]
-
-        # Record the challenge
-        self.challenge_data["history"].append(
-            {
-                "date": today,
-                "problem_id": selected_problem_id,
-                "completed": False,
-            }
-        )
-        self.challenge_data["last_challenge_date"] = today
-        self._save_challenge_data()
-
-        return selected_problem
+        # Decide and record under the store's lock, so two runs on the same
+        # day can't both pick (and record) a challenge.
+        with self.store.transaction() as data:
+            # Check if already challenged today
+            if data.get("last_challenge_date") == today:
+                # Return today's challenge from history
+                for challenge in reversed(data["history"]):
+                    if challenge["date"] == today:
+                        return self.problems.get(challenge["problem_id"])
+
+            # Pick the most overdue review, falling back to an unseen problem.
+            self._sync_queue()
+            selected_problem_id = self.queue.next_problem(
+                datetime.now().date(), difficulty=difficulty, topic=topic
+            )
+            if selected_problem_id is None:
+                return None
+
+            # Record the challenge
+            self.store.append(
+                ("history",),
+                {
+                    "date": today,
+                    "problem_id": selected_problem_id,
+                    "completed": False,
+                },
+            )
+            self.store.set(("last_challenge_date",), today)
+
+        return self.problems[selected_problem_id]
+
+    def complete_challenge(
+        self, problem_id: str, success: bool = True, quality: int | None = None
+    ) -> None:
+        """Mark today's challenge as complete.
+
+        ``quality`` grades the recall from 0 to 5 as in SM-2 and, when given,
+        decides ``success`` (3 or more passes); when omitted a success counts
+        as 4 and a failure as 2.
+        """
+        if quality is None:
+            quality = 4 if success else 2
+        else:
+            success = quality >= 3
 
-    def complete_challenge(self, problem_id: str, success: bool = True) -> None:
-        """Mark today's challenge as complete."""
         today = datetime.now().date().isoformat()
 
-        # Update history
-        for challenge in reversed(self.challenge_data["history"]):
-            if challenge["date"] == today and challenge["problem_id"] == problem_id:
-                challenge["completed"] = True
-                challenge["success"] = success
-                break
-
-        # Update problem stats
-        if problem_id not in self.challenge_data["problem_stats"]:
-            self.challenge_data["problem_stats"][problem_id] = {
-                "attempt_count": 0,
-                "success_count": 0,
-                "last_attempt": datetime.now().isoformat(),
-            }
+        # Rescheduling builds on the stored stats, so read them and write the
+        # result under the store's lock; another process may have updated them.
+        with self.store.transaction() as data:
+            self._sync_queue()
+
+            # Update history
+            history = data["history"]
+            for index in range(len(history) - 1, -1, -1):
+                challenge = history[index]
+                if challenge["date"] == today and challenge["problem_id"] == problem_id:
+                    self.store.set(("history", index, "completed"), True)
+                    self.store.set(("history", index, "success"), success)
+                    break
 
-        stats = self.challenge_data["problem_stats"][problem_id]
-        stats["attempt_count"] += 1
-        if success:
-            stats["success_count"] += 1
-        stats["last_attempt"] = datetime.now().isoformat()
+            # Reschedule the next review
+            stats = sm2_update(data["problem_stats"].get(problem_id), quality)
+            self.store.set(("problem_stats", problem_id), stats)
 
-        self._save_challenge_data()
+        if self._queue is not None:
+            self._queue.update(problem_id, stats)
 
     def display_challenge(self, problem: dict[str, Any] | None) -> None:
         """Display today's challenge."""
@@ -279,6 +240,8 @@ class DailyChallengeSystem:
             last = datetime.fromisoformat(stats["last_attempt"])
             days_ago = (datetime.now() - last).days
             print(f"   Last Attempt: {days_ago} days ago")
+            if "due" in stats:
+                print(f"   Next Review: {stats['due']}")
         else:
             print(colorize("\n✨ This is your first attempt at this problem!", "green"))
 
@@ -367,6 +330,13 @@ def main() -> None:
     parser.add_argument(
         "--success", "-s", action="store_true", help="Mark completion as successful"
     )
+    parser.add_argument(
+        "--quality",
+        "-q",
+        type=int,
+        choices=range(6),
+        help="Grade recall from 0 (blackout) to 5 (perfect) when completing",
+    )
     parser.add_argument("--history", action="store_true", help="Show challenge history")
 
     args = parser.parse_args()
@@ -374,7 +344,9 @@ def main() -> None:
     system = DailyChallengeSystem()
 
     if args.complete:
-        system.complete_challenge(args.complete, success=args.success)
+        system.complete_challenge(
+            args.complete, success=args.success, quality=args.quality
+        )
         print(colorize(f"✅ Marked {args.complete} as complete!", "green"))
         return
 
@@ -3,16 +3,32 @@
 
 Provides progressive hints without spoiling the solution.
 
+Hints live in ``learn/resources/hints/<language>/<problem-id>.json``, one
+shard per problem, so showing a hint reads a single small file no matter how
+many problems have hints. ``index.json`` next to the language folders lists
+every problem and is only read for ``--list``. Each hint shown is appended to
+``usage.log`` in the same folder.
+
 Usage python scripts/hints.py 01-two-sum
     python scripts/hints.py 15-valid-palindrome --level 2
     python scripts/hints.py 35-coin-change --all
+    python scripts/hints.py 01-two-sum --language javascript
+    python scripts/hints.py --stats
 """
 
 from __future__ import annotations
 
 import json
+import os
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+DEFAULT_LANGUAGE = "python"
+PROBLEM_ID_PATTERN = re.compile(r"^[A-Za-z0-9][\w.-]*$")
 
 # Color codes
 COLORS = {
@@ -31,6 +47,177 @@ def colorize(text: str, color: str) -> str:
     return f"{COLORS.get(color, '')}{text}{COLORS['reset']}"
 
 
+@dataclass
+class ProblemHints:
+    """Hints for one problem in one language, keyed by level."""
+
+    problem_id: str
+    name: str
+    levels: dict[int, str]
+    approaches: list[str] = field(default_factory=list)
+    time_complexity: str = "N/A"
+    space_complexity: str = "N/A"
+
+    @classmethod
+    def from_dict(cls, problem_id: str, data: dict[str, Any]) -> ProblemHints:
+        """Build from the shard format (a ``hints`` list of level/hint pairs)."""
+        return cls(
+            problem_id=problem_id,
+            name=data.get("name", problem_id),
+            levels={hint["level"]: hint["hint"] for hint in data.get("hints", [])},
+            approaches=list(data.get("approaches", [])),
+            time_complexity=data.get("time_complexity", "N/A"),
+            space_complexity=data.get("space_complexity", "N/A"),
+        )
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write ``text`` to ``path`` through a temporary file and rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_name(path.name + ".tmp")
+    tmp_file.write_text(text, encoding="utf-8")
+    os.replace(tmp_file, path)
+
+
+class HintStore:
+    """Per-problem hint shards with a small index and an append-only usage log."""
+
+    def __init__(self, root: Path):
+        """Point the store at ``root``; nothing is read until it is needed."""
+        self.root = Path(root)
+        self.index_file = self.root / "index.json"
+        self.usage_file = self.root / "usage.log"
+        self._shards: dict[tuple[str, str], ProblemHints | None] = {}
+
+    def shard_path(self, problem_id: str, language: str = DEFAULT_LANGUAGE) -> Path:
+        """Return the shard file for a problem, rejecting ids that are not names."""
+        if not PROBLEM_ID_PATTERN.match(problem_id) or not PROBLEM_ID_PATTERN.match(
+            language
+        ):
+            raise ValueError(f"Invalid problem id or language: {problem_id!r}")
+        return self.root / language / f"{problem_id}.json"
+
+    def get(
+        self, problem_id: str, language: str = DEFAULT_LANGUAGE
+    ) -> ProblemHints | None:
+        """Load (once) and return the hints for a problem, if there are any."""
+        key = (problem_id, language)
+        if key not in self._shards:
+            try:
+                path = self.shard_path(problem_id, language)
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._shards[key] = None
+            else:
+                self._shards[key] = ProblemHints.from_dict(problem_id, data)
+        return self._shards[key]
+
+    def load_index(self) -> dict[str, Any]:
+        """Return ``{problem_id: {"name", "languages": {language: count}}}``."""
+        try:
+            return json.loads(self.index_file.read_text(encoding="utf-8"))["problems"]
+        except (OSError, ValueError, KeyError):
+            return self.rebuild_index()
+
+    def _save_index(self, problems: dict[str, Any]) -> None:
+        """Write the index with one problem per line so diffs stay small."""
+        lines = [
+            f"    {json.dumps(problem_id)}: {json.dumps(entry, ensure_ascii=False)}"
+            for problem_id, entry in sorted(problems.items())
+        ]
+        body = ",\n".join(lines)
+        _write_atomic(self.index_file, '{\n  "problems": {\n' + body + "\n  }\n}\n")
+
+    def rebuild_index(self) -> dict[str, Any]:
+        """Recreate the index by scanning every shard."""
+        problems: dict[str, Any] = {}
+        for path in sorted(self.root.glob("*/*.json")):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            entry = problems.setdefault(
+                path.stem, {"name": data.get("name", path.stem), "languages": {}}
+            )
+            entry["languages"][path.parent.name] = len(data.get("hints", []))
+        self._save_index(problems)
+        return problems
+
+    def put(
+        self, problem_id: str, data: dict[str, Any], language: str = DEFAULT_LANGUAGE
+    ) -> None:
+        """Write one problem's shard and its index entry."""
+        path = self.shard_path(problem_id, language)
+        _write_atomic(path, json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+        self._shards.pop((problem_id, language), None)
+
+        problems = self.load_index()
+        entry = problems.setdefault(problem_id, {"languages": {}})
+        entry["name"] = data.get("name", problem_id)
+        entry["languages"][language] = len(data.get("hints", []))
+        self._save_index(problems)
+
+    def import_legacy(self, legacy_file: Path, language: str = DEFAULT_LANGUAGE) -> int:
+        """Shard a single-file ``HINTS.json`` database; return problems imported."""
+        try:
+            database = json.loads(legacy_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return 0
+
+        problems = self.load_index()
+        imported = 0
+        for problem_id, data in database.items():
+            try:
+                path = self.shard_path(problem_id, language)
+            except ValueError:
+                continue
+            if path.exists():
+                continue  # shipped hints win over the old local copy
+            _write_atomic(path, json.dumps(data, indent=2, ensure_ascii=False) + "\n")
+            problems[problem_id] = {
+                "name": data.get("name", problem_id),
+                "languages": {
+                    **problems.get(problem_id, {}).get("languages", {}),
+                    language: len(data.get("hints", [])),
+                },
+            }
+            imported += 1
+        if imported:
+            self._save_index(problems)
+        return imported
+
+    def record_usage(self, problem_id: str, level: int, language: str) -> None:
+        """Append one usage line; the log is never rewritten."""
+        line = json.dumps(
+            {
+                "problem_id": problem_id,
+                "language": language,
+                "level": level,
+                "time": int(time.time()),
+            }
+        )
+        self.root.mkdir(parents=True, exist_ok=True)
+        # One O_APPEND write per line keeps concurrent CLIs from interleaving.
+        fd = os.open(self.usage_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, (line + "\n").encode("utf-8"))
+        finally:
+            os.close(fd)
+
+    def iter_usage(self) -> Iterator[dict[str, Any]]:
+        """Yield every recorded usage entry, skipping a torn final line."""
+        try:
+            handle = open(self.usage_file, encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with handle:
+            for line in handle:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
 class HintSystem:
     """Progressive hint system for coding problems."""
 
@@ -40,223 +227,51 @@ class HintSystem:
             workspace_root = Path(__file__).parent.parent
 
         self.workspace_root = Path(workspace_root)
-        self.hints_file = self.workspace_root / "learn" / "resources" / "HINTS.json"
+        self.hints_dir = self.workspace_root / "learn" / "resources" / "hints"
+        self.store = HintStore(self.hints_dir)
 
-        # Load or create hints database
-        self.hints_db = self._load_hints()
-        if not self.hints_db:
-            self.hints_db = self._create_default_hints()
-            self._save_hints()
-
-    def _load_hints(self) -> dict[str, Any]:
-        """Load hints from file."""
-        if self.hints_file.exists():
-            try:
-                return json.loads(self.hints_file.read_text(encoding="utf-8"))
-            except Exception:
-                pass
-        return {}
-
-    def _save_hints(self) -> None:
-        """Save hints to file."""
-        self.hints_file.parent.mkdir(parents=True, exist_ok=True)
-        self.hints_file.write_text(
-            json.dumps(self.hints_db, indent=2),
-            encoding="utf-8",
-        )
-
-    def _create_default_hints(self) -> dict[str, Any]:
-        """Create default hints for common problems."""
-        return {
-            "01-two-sum": {
-                "name": "Two Sum",
-                "hints": [
-                    {
-                        "level": 1,
-                        "hint": "Think about what data structure allows O(1) lookup time.",
-                    },
-                    {
-                        "level": 2,
-                        "hint": (
-                            "For each number, you need to find target - number."
-                            " Store seen numbers as you iterate."
-                        ),
-                    },
-                    {
-                        "level": 3,
-                        "hint": "Use a hash table (dictionary) to store {value: index} pairs.",
-                    },
-                    {
-                        "level": 4,
-                        "hint": "For each num, check if (target - num) exists in your hash table.",
-                    },
-                    {
-                        "level": 5,
-                        "hint": "Time: O(n), Space: O(n). One pass through the array.",
-                    },
-                ],
-                "approaches": ["Hash Table", "Brute Force (O(n²))"],
-                "time_complexity": "O(n)",
-                "space_complexity": "O(n)",
-            },
-            "15-valid-palindrome": {
-                "name": "Valid Palindrome",
-                "hints": [
-                    {
-                        "level": 1,
-                        "hint": "A palindrome reads the same forwards and backwards.",
-                    },
-                    {
-                        "level": 2,
-                        "hint": "Use two pointers, one at each end of the string.",
-                    },
-                    {
-                        "level": 3,
-                        "hint": (
-                            "Ignore non-alphanumeric characters"
-                            " and compare case-insensitively."
-                        ),
-                    },
-                    {
-                        "level": 4,
-                        "hint": (
-                            "Move pointers inward while they match."
-                            " If they meet, it's a palindrome."
-                        ),
-                    },
-                    {
-                        "level": 5,
-                        "hint": "Time: O(n), Space: O(1). In-place comparison.",
-                    },
-                ],
-                "approaches": ["Two Pointers", "Reverse and Compare"],
-                "time_complexity": "O(n)",
-                "space_complexity": "O(1)",
-            },
-            "21-binary-search": {
-                "name": "Binary Search",
-                "hints": [
-                    {"level": 1, "hint": "Exploit the fact that the array is sorted."},
-                    {
-                        "level": 2,
-                        "hint": (
-                            "Each comparison allows you to eliminate"
-                            " half of the remaining elements."
-                        ),
-                    },
-                    {
-                        "level": 3,
-                        "hint": "Maintain left and right pointers. Check the middle element.",
-                    },
-                    {
-                        "level": 4,
-                        "hint": (
-                            "If target < mid, search left half."
-                            " If target > mid, search right half."
-                        ),
-                    },
-                    {
-                        "level": 5,
-                        "hint": "Time: O(log n), Space: O(1). Classic divide and conquer.",
-                    },
-                ],
-                "approaches": ["Iterative Binary Search", "Recursive Binary Search"],
-                "time_complexity": "O(log n)",
-                "space_complexity": "O(1)",
-            },
-            "26-reverse-linked-list": {
-                "name": "Reverse Linked List",
-                "hints": [
-                    {
-                        "level": 1,
-                        "hint": "You need to reverse the direction of all pointers.",
-                    },
-                    {
-                        "level": 2,
-                        "hint": "Think about reversing one connection at a time.",
-                    },
-                    {
-                        "level": 3,
-                        "hint": "Keep track of previous, current, and next nodes.",
-                    },
-                    {
-                        "level": 4,
-                        "hint": (
-                            "Iterate: save next, point current to previous,"
-                            " advance all pointers."
-                        ),
-                    },
-                    {"level": 5, "hint": "Time: O(n), Space: O(1). In-place reversal."},
-                ],
-                "approaches": ["Iterative", "Recursive"],
-                "time_complexity": "O(n)",
-                "space_complexity": "O(1)",
-            },
-            "35-coin-change": {
-                "name": "Coin Change",
-                "hints": [
-                    {
-                        "level": 1,
-                        "hint": "This is a classic dynamic programming problem.",
-                    },
-                    {
-                        "level": 2,
-                        "hint": "Build up solutions for smaller amounts first.",
-                    },
-                    {
-                        "level": 3,
-                        "hint": "Create a DP array where dp[i] = minimum coins for amount i.",
-                    },
-                    {
-                        "level": 4,
-                        "hint": (
-                            "For each amount, try using each coin:"
-                            " dp[i] = min(dp[i], dp[i-coin] + 1)."
-                        ),
-                    },
-                    {
-                        "level": 5,
-                        "hint": "Time: O(amount × coins), Space: O(amount). Bottom-up DP.",
-                    },
-                ],
-                "approaches": ["Dynamic Programming", "BFS", "DFS with Memoization"],
-                "time_complexity": "O(amount × coins)",
-                "space_complexity": "O(amount)",
-            },
-        }
+        # Hints saved by older versions as one JSON file are sharded once.
+        legacy_file = self.workspace_root / "learn" / "resources" / "HINTS.json"
+        if legacy_file.exists():
+            self.store.import_legacy(legacy_file)
+            legacy_file.rename(legacy_file.with_name("HINTS.json.imported"))
 
     def show_hints(
         self,
         problem_id: str,
         level: int | None = None,
         show_all: bool = False,
+        language: str = DEFAULT_LANGUAGE,
     ) -> None:
         """Show hints for a problem."""
-        if problem_id not in self.hints_db:
+        try:
+            problem_hints = self.store.get(problem_id, language)
+        except ValueError:
+            problem_hints = None
+        if problem_hints is None:
             print(colorize(f"\n❌ No hints available for {problem_id}", "red"))
             print(colorize("\n💡 Tip: Try solving without hints first!", "cyan"))
             return
 
-        problem_hints = self.hints_db[problem_id]
-        hints = problem_hints["hints"]
-
-        print(colorize(f"\n💡 HINTS: {problem_hints['name']}\n", "bold"))
+        levels = problem_hints.levels
+        print(colorize(f"\n💡 HINTS: {problem_hints.name}\n", "bold"))
         print("=" * 60)
 
         if show_all:
             # Show all hints
-            for hint in hints:
-                lvl = hint["level"]
+            for lvl, hint in sorted(levels.items()):
                 print(f"\n{colorize(f'Level {lvl}:', 'yellow')}")
-                print(f"   {hint['hint']}")
+                print(f"   {hint}")
+            shown = max(levels, default=0)
         elif level is not None:
             # Show specific level
-            hint = next((h for h in hints if h["level"] == level), None)
-            if hint:
+            if level in levels:
                 print(f"\n{colorize(f'Level {level} Hint:', 'yellow')}")
-                print(f"   {hint['hint']}")
+                print(f"   {levels[level]}")
+                shown = level
             else:
                 print(colorize(f"\n❌ No hint at level {level}", "red"))
+                shown = 0
         else:
             # Show progressive hints
             print(
@@ -264,23 +279,28 @@ class HintSystem:
                     "Progressive Hints (use --level N for specific hint):\n", "cyan"
                 )
             )
-            print(colorize("Level 1 (Concept):", "green"))
-            print(f"   {hints[0]['hint']}")
+            first, *rest = sorted(levels) or [0]
+            print(colorize(f"Level {first} (Concept):", "green"))
+            print(f"   {levels.get(first, 'No hints written yet.')}")
+            shown = first
 
-            if len(hints) > 1:
+            if rest:
                 print(colorize("\n💭 Need more help? Use:", "dim"))
-                for i in range(1, len(hints)):
-                    print(f"   --level {i+1} for Level {i+1} hint")
+                for lvl in rest:
+                    print(f"   --level {lvl} for Level {lvl} hint")
+
+        if shown:
+            self.store.record_usage(problem_id, shown, language)
 
         # Show complexity
         print(colorize("\n⚡ Target Complexity:", "cyan"))
-        print(f"   Time: {problem_hints.get('time_complexity', 'N/A')}")
-        print(f"   Space: {problem_hints.get('space_complexity', 'N/A')}")
+        print(f"   Time: {problem_hints.time_complexity}")
+        print(f"   Space: {problem_hints.space_complexity}")
 
         # Show approaches
-        if "approaches" in problem_hints:
+        if problem_hints.approaches:
             print(colorize("\n🎯 Possible Approaches:", "cyan"))
-            for approach in problem_hints["approaches"]:
+            for approach in problem_hints.approaches:
                 print(f"   • {approach}")
 
         print("\n" + "=" * 60)
@@ -291,15 +311,37 @@ class HintSystem:
         print(colorize("\n📚 AVAILABLE HINTS\n", "bold"))
         print("=" * 60)
 
-        for problem_id, data in sorted(self.hints_db.items()):
-            name = data.get("name", problem_id)
-            hint_count = len(data.get("hints", []))
-            print(f"  {colorize(problem_id, 'cyan')}: {name} ({hint_count} hints)")
+        for problem_id, entry in sorted(self.store.load_index().items()):
+            counts = entry.get("languages", {})
+            name = entry.get("name", problem_id)
+            languages = ", ".join(f"{lang}: {n}" for lang, n in sorted(counts.items()))
+            print(f"  {colorize(problem_id, 'cyan')}: {name} ({languages} hints)")
 
         print("\n" + "=" * 60)
         print(colorize("\nUsage: python scripts/hints.py <problem-id>", "dim"))
         print()
 
+    def show_stats(self, top: int = 10) -> None:
+        """Show which problems needed the most hints."""
+        views: Counter[str] = Counter()
+        deepest: dict[str, int] = {}
+        for entry in self.store.iter_usage():
+            problem_id = entry.get("problem_id", "?")
+            views[problem_id] += 1
+            deepest[problem_id] = max(deepest.get(problem_id, 0), entry.get("level", 0))
+
+        print(colorize("\n📊 HINT USAGE\n", "bold"))
+        print("=" * 60)
+        if not views:
+            print("  No hints used yet. 💪")
+        for problem_id, count in views.most_common(top):
+            print(
+                f"  {colorize(problem_id, 'cyan')}: {count} views,"
+                f" deepest level {deepest[problem_id]}"
+            )
+        print("\n" + "=" * 60)
+        print()
+
 
 def main() -> None:
     """Main entry point."""
@@ -312,20 +354,30 @@ def main() -> None:
     parser.add_argument(
         "--list", action="store_true", help="List all problems with hints"
     )
+    parser.add_argument(
+        "--language",
+        default=DEFAULT_LANGUAGE,
+        help=f"Hint language track (default: {DEFAULT_LANGUAGE})",
+    )
+    parser.add_argument(
+        "--stats", action="store_true", help="Show which hints were used most"
+    )
 
     args = parser.parse_args()
 
     system = HintSystem()
 
-    if args.list:
-        system.list_available()
+    if args.stats:
+        system.show_stats()
         return
 
-    if not args.problem_id:
+    if args.list or not args.problem_id:
         system.list_available()
         return
 
-    system.show_hints(args.problem_id, level=args.level, show_all=args.all)
+    system.show_hints(
+        args.problem_id, level=args.level, show_all=args.all, language=args.language
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""Append-only JSON Store for Interview Prep.
+
+Keeps a JSON document such as ``.progress_data.json`` in memory and records
+each committed change as one line in a companion ``.log`` journal instead of
+rewriting the whole file. Every ``compact_every`` commits the journal is
+folded back into the snapshot with an atomic rename.
+
+All disk access happens under an exclusive lock on a ``.lock`` file, a commit
+is a single appended line (so it lands completely or not at all), and the
+snapshot and journal share a generation number so a crash during compaction
+never replays a change twice.
+
+Changes that depend on the current contents (incrementing a counter,
+rescheduling from the previous stats) belong in ``transaction()``: it holds
+the lock, catches up with commits from other processes, and commits before
+releasing the lock, so concurrent writers cannot lose each other's updates.
+
+Usage:
+    store = JournalStore(Path(".progress_data.json"), default=dict)
+    with store.transaction() as data:
+        store.append(("completed",), "01-two-sum")
+        store.set(("streak_data", "current"), data["streak_data"]["current"] + 1)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Sequence
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+META_KEY = "__journal__"
+
+logger = logging.getLogger(__name__)
+
+
+def _apply(data: dict[str, Any], op: list[Any]) -> None:
+    """Apply one journal operation (``[kind, path, value]``) to ``data``."""
+    kind, path, value = op
+    target: Any = data
+    for key in path[:-1]:
+        target = target[key]
+
+    if kind == "set":
+        target[path[-1]] = value
+    elif kind == "append":
+        target[path[-1]].append(value)
+    elif kind == "remove":
+        target[path[-1]].remove(value)
+    else:
+        raise ValueError(f"Unknown journal operation: {kind}")
+
+
+def _replay(data: dict[str, Any], op: list[Any]) -> None:
+    """Apply a committed operation, logging (not raising) if it no longer fits."""
+    try:
+        _apply(data, op)
+    except (KeyError, IndexError, TypeError, ValueError) as error:
+        logger.warning("Skipping journal operation %r: %r", op, error)
+
+
+class JournalStore:
+    """JSON document persisted as a snapshot plus an append-only journal."""
+
+    def __init__(
+        self,
+        path: Path,
+        default: Callable[[], dict[str, Any]],
+        compact_every: int = 100,
+    ):
+        """Load the snapshot and replay any journaled changes."""
+        self.path = Path(path)
+        self.journal_path = self.path.with_name(self.path.name + ".log")
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.default = default
+        self.compact_every = compact_every
+
+        self.data: dict[str, Any] = {}
+        self._pending: list[str] = []
+        self._generation = 0
+        self._journal_entries = 0
+        # How much of the journal (in bytes, 0 = none) and which snapshot
+        # file ``data`` reflects; None when that is unknown.
+        self._journal_offset: int | None = None
+        self._snapshot_seen: tuple[int, int, int] | None = None
+        # Operations the last transaction() caught up on, or None if it had
+        # to reload the whole document.
+        self.refreshed_ops: list[list[Any]] | None = None
+        self.reload()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive inter-process lock for the duration of the block."""
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a+b") as handle:
+            if sys.platform == "win32":
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            else:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if sys.platform == "win32":
+                    handle.seek(0)
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+                else:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _snapshot_id(self) -> tuple[int, int, int] | None:
+        """Identify the current snapshot file; compaction replaces it."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _read_state(self) -> tuple[dict[str, Any], int, int, int | None]:
+        """Return the replayed document, its generation, journal entry count
+        and the journal bytes it covers (None if the journal was not used).
+        """
+        data = self.default()
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except Exception:
+                pass
+        generation = data.pop(META_KEY, {}).get("generation", 0)
+
+        entries = 0
+        offset: int | None = 0
+        if self.journal_path.exists():
+            with open(self.journal_path, "rb") as handle:
+                header = handle.readline()
+                offset = len(header) if header else 0
+                try:
+                    journal_generation = json.loads(header)["generation"]
+                except (ValueError, KeyError, TypeError):
+                    journal_generation = None
+
+                # A journal from an older generation was already folded into
+                # the snapshot by a compaction that was interrupted.
+                if journal_generation == generation:
+                    for line in handle:
+                        if not line.endswith(b"\n"):
+                            break  # torn tail from an interrupted write
+                        try:
+                            ops = json.loads(line)
+                        except ValueError:
+                            break
+                        for op in ops:
+                            _replay(data, op)
+                        entries += 1
+                        offset += len(line)
+                elif header:
+                    offset = None
+
+        return data, generation, entries, offset
+
+    def _replace_data(self, data: dict[str, Any]) -> None:
+        """Swap in new contents while keeping ``self.data`` the same object."""
+        self.data.clear()
+        self.data.update(data)
+
+    def _reload_locked(self) -> None:
+        """Re-read the committed state and reapply uncommitted operations."""
+        self.refreshed_ops = None
+        self._snapshot_seen = self._snapshot_id()
+        data, self._generation, self._journal_entries, self._journal_offset = (
+            self._read_state()
+        )
+        for encoded in self._pending:
+            _replay(data, json.loads(encoded))
+        self._replace_data(data)
+
+    def _catch_up_locked(self) -> list[list[Any]] | None:
+        """Apply only the journal lines committed since ``data`` was read.
+
+        Returns the operations applied, or None when that isn't possible
+        (uncommitted changes, or the snapshot or journal were replaced).
+        """
+        if (
+            self._pending
+            or self._journal_offset is None
+            or self._snapshot_id() != self._snapshot_seen
+        ):
+            return None
+        try:
+            size = self.journal_path.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size == self._journal_offset:
+            return []
+        if size < self._journal_offset:
+            return None
+
+        ops: list[list[Any]] = []
+        with open(self.journal_path, "rb") as handle:
+            header = handle.readline()
+            try:
+                if json.loads(header)["generation"] != self._generation:
+                    return None
+            except (ValueError, KeyError, TypeError):
+                return None
+            offset = max(self._journal_offset, len(header))
+            handle.seek(offset)
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    line_ops = json.loads(line)
+                except ValueError:
+                    break
+                for op in line_ops:
+                    _replay(self.data, op)
+                ops += line_ops
+                self._journal_entries += 1
+                offset += len(line)
+        self._journal_offset = offset
+        return ops
+
+    def _refresh_locked(self) -> None:
+        """Bring ``data`` up to date, incrementally when possible."""
+        ops = self._catch_up_locked()
+        if ops is None:
+            self._reload_locked()
+        else:
+            self.refreshed_ops = ops
+
+    @contextmanager
+    def transaction(self) -> Iterator[dict[str, Any]]:
+        """Read, modify and commit the document under one lock.
+
+        On entry the document is brought up to date with changes committed
+        by other processes, so values read inside the block are current.
+        Operations recorded in the block are committed on exit, or discarded
+        if the block raises.
+        """
+        with self._locked():
+            self._refresh_locked()
+            pending = len(self._pending)
+            try:
+                yield self.data
+            except BaseException:
+                del self._pending[pending:]
+                self._reload_locked()
+                raise
+            self._commit_locked()
+
+    def reload(self) -> dict[str, Any]:
+        """Re-read the snapshot and journal, discarding uncommitted changes."""
+        with self._locked():
+            self._pending.clear()
+            self._reload_locked()
+        return self.data
+
+    def _record(self, kind: str, path: Sequence[str | int], value: Any) -> None:
+        """Apply an operation in memory and queue it for the next commit."""
+        op = [kind, list(path), value]
+        # Serialize now so later in-place edits to ``value`` are not journaled twice.
+        encoded = json.dumps(op)
+        _apply(self.data, json.loads(encoded))
+        self._pending.append(encoded)
+
+    def set(self, path: Sequence[str | int], value: Any) -> None:
+        """Set the value at ``path``."""
+        self._record("set", path, value)
+
+    def append(self, path: Sequence[str | int], value: Any) -> None:
+        """Append ``value`` to the list at ``path``."""
+        self._record("append", path, value)
+
+    def remove(self, path: Sequence[str | int], value: Any) -> None:
+        """Remove the first occurrence of ``value`` from the list at ``path``."""
+        self._record("remove", path, value)
+
+    def _journal_end(self) -> int:
+        """Return the journal size, first cutting off any torn final line."""
+        try:
+            size = self.journal_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+        with open(self.journal_path, "rb+") as handle:
+            position = size
+            while position > 0:
+                step = min(4096, position)
+                position -= step
+                handle.seek(position)
+                chunk = handle.read(step)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    end = position + newline + 1
+                    if end != size:
+                        handle.truncate(end)
+                    return end
+            handle.truncate(0)
+            return 0
+
+    def _journal_generation(self) -> int | None:
+        """Read the generation recorded in the journal header, if any."""
+        try:
+            with open(self.journal_path, "rb") as handle:
+                return json.loads(handle.readline())["generation"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def commit(self) -> None:
+        """Append all pending operations to the journal as one transaction."""
+        if self._pending:
+            with self._locked():
+                self._commit_locked()
+
+    def _commit_locked(self) -> None:
+        """Append pending operations; the caller holds the lock."""
+        if not self._pending:
+            return
+
+        line = ("[" + ",".join(self._pending) + "]\n").encode("utf-8")
+        journal_end = self._journal_end()
+        caught_up = self._journal_offset == journal_end
+        journal_generation = self._journal_generation()
+        if journal_end and (
+            journal_generation is None or journal_generation < self._generation
+        ):
+            # Left behind by an interrupted compaction; its changes are
+            # already in the snapshot, so start a fresh journal.
+            self.journal_path.write_bytes(b"")
+            journal_end = 0
+            caught_up = False
+
+        with open(self.journal_path, "ab") as handle:
+            if journal_end == 0:
+                handle.write(
+                    json.dumps({"generation": self._generation}).encode() + b"\n"
+                )
+            handle.write(line)
+            handle.flush()
+            os.fsync(handle.fileno())
+            end = handle.tell()
+        # Our own line needs no replay; anything from other processes still does.
+        self._journal_offset = end if caught_up else None
+        self._pending.clear()
+        self._journal_entries += 1
+
+        if self._journal_entries >= self.compact_every:
+            self._compact_locked()
+
+    def compact(self) -> None:
+        """Fold the journal into a fresh snapshot."""
+        with self._locked():
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        """Write a new snapshot generation and restart the journal."""
+        data, generation, _, _ = self._read_state()
+        generation += 1
+
+        tmp_file = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as handle:
+            json.dump({**data, META_KEY: {"generation": generation}}, handle, indent=2)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_file, self.path)
+
+        with open(self.journal_path, "wb") as handle:
+            handle.write(json.dumps({"generation": generation}).encode() + b"\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+            self._journal_offset = handle.tell()
+        self._snapshot_seen = self._snapshot_id()
+
+        self._generation = generation
+        self._journal_entries = 0
+        self._replace_data(data)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Single Entry Point for the Interview Prep Scripts.
+
+Dispatches ``prep <command> [args]`` to the matching script's ``main()``.
+Only the selected script is imported, so ``prep hints 01-two-sum`` never
+pays for the progress tracker, achievements or code analyzer. ``prep
+prompt`` prints a one-line status for shell prompts from the progress
+files alone, without importing any other script.
+
+Usage:
+    python scripts/prep.py progress --detailed
+    python scripts/prep.py hints 01-two-sum --level 2
+    python scripts/prep.py prompt
+    python scripts/prep.py --profile-imports achievements
+
+Shell prompt (bash):
+    alias prep="python /path/to/repo/scripts/prep.py"
+    PS1='$(prep prompt) '"$PS1"
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# command -> (module, description); modules are imported only when dispatched.
+COMMANDS = {
+    "progress": ("progress_tracker", "Track solved problems and streaks"),
+    "challenge": ("daily_challenge", "Today's spaced-repetition challenge"),
+    "achievements": ("achievements", "Badges and unlock progress"),
+    "hints": ("hints", "Progressive hints for a problem"),
+    "analyze": ("analyze_code", "Code quality analysis for solutions"),
+    "visualize": ("visualize", "Step-by-step algorithm visualizer"),
+    "catalog": ("problem_catalog", "Rebuild the cached problem catalog"),
+    "verify": ("verify_setup", "Check the development environment"),
+}
+PROFILE_FLAG = "--profile-imports"
+PROFILE_TOP = 15
+
+
+def print_usage() -> None:
+    """Print the list of commands."""
+    print("usage: prep [--profile-imports] <command> [args]\n\ncommands:")
+    for name, (_, description) in COMMANDS.items():
+        print(f"  {name:<13} {description}")
+    print(f"  {'prompt':<13} One-line status for shell prompts")
+    print("\nRun 'prep <command> --help' for command options.")
+
+
+def prompt_status(workspace_root: Path | None = None) -> str:
+    """Return a short status line: live streak, solved count, challenge open."""
+    from datetime import date, timedelta
+
+    from journal_store import JournalStore
+
+    if workspace_root is None:
+        workspace_root = Path(__file__).parent.parent
+
+    # Same default shapes as the owning scripts so journal replays apply.
+    progress = JournalStore(
+        workspace_root / ".progress_data.json",
+        default=lambda: {
+            "completed": [],
+            "attempts": {},
+            "streak_data": {"current": 0, "best": 0, "last_date": None},
+            "achievements": [],
+        },
+    ).data
+    challenge = JournalStore(
+        workspace_root / ".daily_challenge.json",
+        default=lambda: {
+            "history": [],
+            "problem_stats": {},
+            "last_challenge_date": None,
+        },
+    ).data
+
+    today = date.today()
+    streak = progress.get("streak_data", {})
+    # A streak only counts while it could still be extended today.
+    live_dates = {today.isoformat(), (today - timedelta(days=1)).isoformat()}
+    current = streak.get("current", 0) if streak.get("last_date") in live_dates else 0
+
+    parts = [f"🔥{current}", f"✓{len(progress.get('completed', []))}"]
+    history = challenge.get("history") or [{}]
+    if history[-1].get("date") != today.isoformat() or not history[-1].get("completed"):
+        parts.append("📅")  # today's challenge is still open
+    return " ".join(parts)
+
+
+def summarize_importtime(stderr: str, top: int = PROFILE_TOP) -> list[str]:
+    """Turn ``-X importtime`` output into a report of the slowest imports."""
+    imports: list[tuple[int, int, str, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((int(own), int(cumulative), name.strip(), depth))
+
+    top_level = sorted((i for i in imports if i[3] == 0), key=lambda i: -i[1])
+    total_ms = sum(cumulative for _, cumulative, _, _ in top_level) / 1000
+    lines = [f"import time: {total_ms:.1f}ms across {len(imports)} modules", ""]
+    lines.append(f"{'cumulative':>11} {'self':>9}  top-level import")
+    for self_us, cumulative_us, name, _ in top_level[:top]:
+        lines.append(f"{cumulative_us / 1000:>9.1f}ms {self_us / 1000:>7.1f}ms  {name}")
+    lines.append("")
+    lines.append(f"{'self':>11}  slowest modules")
+    for self_us, _, name, _ in sorted(imports, key=lambda i: -i[0])[:top]:
+        lines.append(f"{self_us / 1000:>9.1f}ms  {name}")
+    return lines
+
+
+def profile_imports(args: list[str]) -> int:
+    """Run a command under ``-X importtime`` and print a summary afterwards."""
+    import subprocess
+    import time
+
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", __file__, *args],
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    errors = [
+        line
+        for line in completed.stderr.splitlines()
+        if not line.startswith("import time:")
+    ]
+    if errors:
+        print("\n".join(errors), file=sys.stderr)
+
+    print(f"\n⏱️  prep {' '.join(args)}: {elapsed_ms:.1f}ms wall clock")
+    print("\n".join(summarize_importtime(completed.stderr)))
+    return completed.returncode
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point."""
+    args = sys.argv[1:] if argv is None else argv
+
+    if args and args[0] == PROFILE_FLAG:
+        return profile_imports(args[1:])
+
+    if not args or args[0] in ("-h", "--help"):
+        print_usage()
+        return 0
+
+    command, rest = args[0], args[1:]
+    if command == "prompt":
+        print(prompt_status())
+        return 0
+    if command not in COMMANDS:
+        print(f"prep: unknown command '{command}'\n", file=sys.stderr)
+        print_usage()
+        return 2
+
+    import importlib
+
+    module = importlib.import_module(COMMANDS[command][0])
+    # Each script parses sys.argv itself; make its usage read "prep <command>".
+    sys.argv = [f"prep {command}", *rest]
+    result = module.main()
+    return result if isinstance(result, int) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Cached Problem Catalog for Interview Prep.
+
+Parses the header of every problem markdown file once and caches the result
+in ``.problem_catalog.json``, keyed by each file's mtime and size. Later runs
+only stat the files and re-parse the ones that changed, so the progress
+tracker, daily challenge and achievement scripts all start from the same
+index without re-reading every problem statement.
+
+Usage:
+    python scripts/problem_catalog.py
+    python scripts/problem_catalog.py --rebuild
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+CATALOG_VERSION = 1
+EXCLUDED_FILES = {"README.md", "ISSUES_SEED.md"}
+HEADER_LINES = 20
+
+
+def parse_problem_header(content: str) -> dict[str, Any]:
+    """Extract difficulty, topics and a short statement from a problem file."""
+    difficulty = None
+    topics: list[str] = []
+    statement = ""
+
+    lines = content.split("\n")
+    for i, line in enumerate(lines[:HEADER_LINES]):
+        if line.startswith("Difficulty:"):
+            difficulty = line.split(":", 1)[1].strip()
+        elif line.startswith("Topics:"):
+            topics = [t.strip() for t in line.split(":", 1)[1].split(",")]
+        elif line.startswith("Statement"):
+            statement = "\n".join(lines[i + 1 : i + 4]).strip()
+
+    return {"difficulty": difficulty, "topics": topics, "statement": statement}
+
+
+class ProblemCatalog:
+    """Incrementally maintained index of problem markdown headers."""
+
+    def __init__(self, workspace_root: Path | None = None):
+        """Initialize the catalog."""
+        if workspace_root is None:
+            workspace_root = Path(__file__).parent.parent
+
+        self.workspace_root = Path(workspace_root)
+        self.problems_dir = self.workspace_root / "languages" / "python" / "problems"
+        self.cache_file = self.workspace_root / ".problem_catalog.json"
+        self._problems: dict[str, dict[str, Any]] | None = None
+
+    def _load_cache(self) -> dict[str, Any]:
+        """Load cached entries, discarding caches from other versions."""
+        if self.cache_file.exists():
+            try:
+                data = json.loads(self.cache_file.read_text(encoding="utf-8"))
+                if data.get("version") == CATALOG_VERSION:
+                    return data["files"]
+            except Exception:
+                pass
+        return {}
+
+    def _save_cache(self, files: dict[str, Any]) -> None:
+        """Write the cache atomically so concurrent readers never see half a file."""
+        # A unique temporary name per writer: concurrent refreshes must not
+        # write into (or rename away) each other's temporary file.
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.cache_file.parent, prefix=self.cache_file.name + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"version": CATALOG_VERSION, "files": files}, handle)
+            os.replace(tmp_name, self.cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+    def refresh(self) -> dict[str, dict[str, Any]]:
+        """Stat every problem file and re-parse only new or modified ones."""
+        cached = self._load_cache()
+        files: dict[str, Any] = {}
+        changed = False
+
+        if self.problems_dir.exists():
+            with os.scandir(self.problems_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".md") or entry.name in EXCLUDED_FILES:
+                        continue
+
+                    stat = entry.stat()
+                    previous = cached.get(entry.name)
+                    if (
+                        previous is not None
+                        and previous["mtime_ns"] == stat.st_mtime_ns
+                        and previous["size"] == stat.st_size
+                    ):
+                        files[entry.name] = previous
+                        continue
+
+                    content = Path(entry.path).read_text(encoding="utf-8")
+                    files[entry.name] = {
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        **parse_problem_header(content),
+                    }
+                    changed = True
+
+        if changed or files.keys() != cached.keys():
+            self._save_cache(files)
+
+        relative_dir = self.problems_dir.relative_to(self.workspace_root)
+        self._problems = {}
+        for name in sorted(files):
+            problem_id = name[: -len(".md")]
+            entry = files[name]
+            self._problems[problem_id] = {
+                "id": problem_id,
+                "name": problem_id.replace("-", " ").title(),
+                "difficulty": entry["difficulty"],
+                "topics": list(entry["topics"]),
+                "statement": entry["statement"],
+                "file": str(relative_dir / name),
+            }
+        return self._problems
+
+    @property
+    def problems(self) -> dict[str, dict[str, Any]]:
+        """Return catalog entries keyed by problem ID, refreshing on first use."""
+        if self._problems is None:
+            return self.refresh()
+        return self._problems
+
+    def rebuild(self) -> dict[str, dict[str, Any]]:
+        """Discard the cache and parse every problem file again."""
+        self.cache_file.unlink(missing_ok=True)
+        return self.refresh()
+
+
+_CATALOGS: dict[Path, ProblemCatalog] = {}
+
+
+def get_catalog(workspace_root: Path | None = None) -> ProblemCatalog:
+    """Return the shared catalog for a workspace, creating it on first use."""
+    catalog = ProblemCatalog(workspace_root)
+    key = catalog.workspace_root.resolve()
+    if key not in _CATALOGS:
+        _CATALOGS[key] = catalog
+    return _CATALOGS[key]
+
+
+def main() -> None:
+    """Main entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the cached problem catalog")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Ignore the cache and re-parse all files"
+    )
+
+    args = parser.parse_args()
+
+    catalog = get_catalog()
+    problems = catalog.rebuild() if args.rebuild else catalog.refresh()
+    print(f"Indexed {len(problems)} problems into {catalog.cache_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,14 @@ import json
 from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from journal_store import JournalStore
+from problem_catalog import get_catalog
+
+if TYPE_CHECKING:
+    # Imported where used: only commands that touch achievements pay for them.
+    from achievements import AchievementSystem, ProgressEvent
 
 # Color codes for terminal output
 COLORS = {
@@ -68,51 +75,51 @@ class ProgressTracker:
         self.tests_dir = self.problems_dir / "tests"
         self.progress_file = self.workspace_root / ".progress_data.json"
 
-        self.problems = self._discover_problems()
-        self.progress_data = self._load_progress_data()
+        self.store = JournalStore(
+            self.progress_file, default=self._default_progress_data
+        )
+        self.progress_data = self.store.data
+        self._problems: dict[str, dict[str, Any]] | None = None
+        self._achievement_system: AchievementSystem | None = None
+
+    @property
+    def problems(self) -> dict[str, dict[str, Any]]:
+        """Return all problems, discovered on first use."""
+        if self._problems is None:
+            self._problems = self._discover_problems()
+        return self._problems
+
+    @property
+    def achievement_system(self) -> AchievementSystem:
+        """Return the achievement system, created on first use."""
+        if self._achievement_system is None:
+            from achievements import AchievementSystem
+
+            self._achievement_system = AchievementSystem(
+                self.workspace_root, progress_data=self.progress_data
+            )
+            # Bring its counters up to date before any new events arrive.
+            self._achievement_system.check_achievements()
+        return self._achievement_system
 
     def _discover_problems(self) -> dict[str, dict[str, Any]]:
-        """Discover all problems from markdown files."""
+        """Discover all problems from the shared problem catalog."""
         problems = {}
 
-        if not self.problems_dir.exists():
-            return problems
-
-        for md_file in self.problems_dir.glob("*.md"):
-            if md_file.name == "README.md" or md_file.name == "ISSUES_SEED.md":
-                continue
-
-            problem_id = md_file.stem
-            content = md_file.read_text(encoding="utf-8")
-
-            # Extract difficulty and topics
-            difficulty = "Unknown"
-            topics = []
-
-            for line in content.split("\n")[:10]:
-                if line.startswith("Difficulty:"):
-                    difficulty = line.split(":", 1)[1].strip()
-                elif line.startswith("Topics:"):
-                    topics = [t.strip() for t in line.split(":", 1)[1].split(",")]
-
+        for problem_id, entry in get_catalog(self.workspace_root).problems.items():
             problems[problem_id] = {
                 "id": problem_id,
-                "name": md_file.stem.replace("-", " ").title(),
-                "difficulty": difficulty,
-                "topics": topics,
-                "file": str(md_file),
+                "name": entry["name"],
+                "difficulty": entry["difficulty"] or "Unknown",
+                "topics": entry["topics"],
+                "file": str(self.workspace_root / entry["file"]),
             }
 
         return problems
 
-    def _load_progress_data(self) -> dict[str, Any]:
-        """Load progress data from file."""
-        if self.progress_file.exists():
-            try:
-                return json.loads(self.progress_file.read_text(encoding="utf-8"))
-            except Exception:
-                pass
-
+    @staticmethod
+    def _default_progress_data() -> dict[str, Any]:
+        """Return progress data for a fresh workspace."""
         return {
             "completed": [],
             "attempts": {},
@@ -120,13 +127,6 @@ class ProgressTracker:
             "achievements": [],
         }
 
-    def _save_progress_data(self) -> None:
-        """Save progress data to file."""
-        self.progress_file.write_text(
-            json.dumps(self.progress_data, indent=2),
-            encoding="utf-8",
-        )
-
     def _check_completed_problems(self) -> list[str]:
         """Check which problems have been completed based on solution files."""
         completed = []
@@ -146,30 +146,52 @@ class ProgressTracker:
 
     def update_progress(self, problem_id: str, solved: bool = True) -> None:
         """Manually update progress for a problem."""
-        if solved and problem_id not in self.progress_data["completed"]:
-            self.progress_data["completed"].append(problem_id)
-            self._update_streak()
-        elif not solved and problem_id in self.progress_data["completed"]:
-            self.progress_data["completed"].remove(problem_id)
-
-        # Record attempt
-        if problem_id not in self.progress_data["attempts"]:
-            self.progress_data["attempts"][problem_id] = []
-
-        self.progress_data["attempts"][problem_id].append(
-            {
-                "date": datetime.now().isoformat(),
-                "solved": solved,
-            }
-        )
-
-        self._check_achievements()
-        self._save_progress_data()
+        from achievements import EventType, ProgressEvent
+
+        # Streak and achievement updates build on the stored values, so read
+        # them and write the results under the store's lock.
+        with self.store.transaction() as data:
+            events = []
+            if solved and problem_id not in data["completed"]:
+                # Sync achievement counters while they still match the old progress.
+                achievement_system = self.achievement_system
+                streak = data["streak_data"]
+                last_date = streak.get("last_date")
+
+                self.store.append(("completed",), problem_id)
+                self._update_streak()
+
+                events.append(ProgressEvent(EventType.PROBLEM_SOLVED, problem_id))
+                if streak.get("last_date") != last_date:
+                    events.append(
+                        ProgressEvent(
+                            EventType.STREAK_EXTENDED, streak=streak["current"]
+                        )
+                    )
+                events += self._completed_topic_events(problem_id)
+            elif not solved and problem_id in data["completed"]:
+                self.store.remove(("completed",), problem_id)
+
+            # Record attempt
+            if problem_id not in data["attempts"]:
+                self.store.set(("attempts", problem_id), [])
+
+            self.store.append(
+                ("attempts", problem_id),
+                {
+                    "date": datetime.now().isoformat(),
+                    "solved": solved,
+                },
+            )
+
+            if events:
+                self._check_achievements(achievement_system, events)
 
     def _update_streak(self) -> None:
-        """Update streak data."""
+        """Update streak data (inside a store transaction)."""
         today = datetime.now().date().isoformat()
-        last_date = self.progress_data["streak_data"].get("last_date")
+        streak = self.progress_data["streak_data"]
+        last_date = streak.get("last_date")
 
         if last_date == today:
             return  # Already counted today
@@ -180,81 +202,41 @@ class ProgressTracker:
 
             if last == yesterday:
                 # Continue streak
-                self.progress_data["streak_data"]["current"] += 1
+                self.store.set(("streak_data", "current"), streak["current"] + 1)
             elif last < yesterday:
                 # Streak broken, reset
-                self.progress_data["streak_data"]["current"] = 1
+                self.store.set(("streak_data", "current"), 1)
         else:
             # First problem
-            self.progress_data["streak_data"]["current"] = 1
+            self.store.set(("streak_data", "current"), 1)
 
-        self.progress_data["streak_data"]["last_date"] = today
+        self.store.set(("streak_data", "last_date"), today)
 
         # Update best streak
-        current = self.progress_data["streak_data"]["current"]
-        best = self.progress_data["streak_data"]["best"]
-        if current > best:
-            self.progress_data["streak_data"]["best"] = current
-
-    def _check_achievements(self) -> None:
-        """Check and unlock achievements."""
-        achievements = [
-            (
-                "first_solve",
-                "First Steps",
-                "Solved your first problem!",
-                lambda: len(self.progress_data["completed"]) >= 1,
-            ),
-            (
-                "five_solved",
-                "Getting Started",
-                "Solved 5 problems!",
-                lambda: len(self.progress_data["completed"]) >= 5,
-            ),
-            (
-                "ten_solved",
-                "Warming Up",
-                "Solved 10 problems!",
-                lambda: len(self.progress_data["completed"]) >= 10,
-            ),
-            (
-                "twenty_solved",
-                "Making Progress",
-                "Solved 20 problems!",
-                lambda: len(self.progress_data["completed"]) >= 20,
-            ),
-            (
-                "all_solved",
-                "Master",
-                "Solved all problems!",
-                lambda: len(self.progress_data["completed"]) >= len(self.problems),
-            ),
-            (
-                "streak_3",
-                "Consistent",
-                "3-day streak!",
-                lambda: self.progress_data["streak_data"]["current"] >= 3,
-            ),
-            (
-                "streak_7",
-                "Dedicated",
-                "7-day streak!",
-                lambda: self.progress_data["streak_data"]["current"] >= 7,
-            ),
-            (
-                "streak_30",
-                "Unstoppable",
-                "30-day streak!",
-                lambda: self.progress_data["streak_data"]["current"] >= 30,
-            ),
+        if streak["current"] > streak["best"]:
+            self.store.set(("streak_data", "best"), streak["current"])
+
+    def _completed_topic_events(self, problem_id: str) -> list[ProgressEvent]:
+        """Return events for topics that solving ``problem_id`` just finished."""
+        from achievements import EventType, ProgressEvent
+
+        completed = set(self.progress_data["completed"])
+        topic_problems = self.achievement_system.topic_problems
+        return [
+            ProgressEvent(EventType.TOPIC_COMPLETED, topic=topic)
+            for topic in self.problems.get(problem_id, {}).get("topics", [])
+            if topic_problems.get(topic, set()) <= completed
         ]
 
-        for achievement_id, name, description, condition in achievements:
-            if achievement_id not in self.progress_data["achievements"]:
-                if condition():
-                    self.progress_data["achievements"].append(achievement_id)
-                    print(colorize(f"🏆 Achievement Unlocked: {name}", "yellow"))
-                    print(f"   {description}\n")
+    def _check_achievements(
+        self, achievement_system: AchievementSystem, events: list[ProgressEvent]
+    ) -> None:
+        """Unlock the achievements affected by new progress events."""
+        for achievement in achievement_system.record(events):
+            if achievement.id not in self.progress_data["achievements"]:
+                self.store.append(("achievements",), achievement.id)
+            print(colorize(f"🏆 Achievement Unlocked: {achievement.name}", "yellow"))
+            print(f"   {achievement.description}\n")
 
     def display_progress(self, detailed: bool = False) -> None:
         """Display current progress."""
@@ -341,14 +323,8 @@ class ProgressTracker:
         if self.progress_data["achievements"]:
             print(colorize("\n🏆 Achievements Unlocked", "yellow"))
             achievement_names = {
-                "first_solve": "First Steps",
-                "five_solved": "Getting Started",
-                "ten_solved": "Warming Up",
-                "twenty_solved": "Making Progress",
-                "all_solved": "Master",
-                "streak_3": "Consistent",
-                "streak_7": "Dedicated",
-                "streak_30": "Unstoppable",
+                achievement.id: achievement.name
+                for achievement in self.achievement_system.achievements
             }
 
             for achievement_id in self.progress_data["achievements"]:
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""Spaced-Repetition Review Queue for Interview Prep.
+
+Schedules problem reviews with the SM-2 interval model and keeps them in
+due-date min-heaps indexed by difficulty and topic, so the daily challenge
+can pick the next problem in O(log n) instead of re-scoring and sorting every
+tracked problem. The schedule itself (ease, interval, due date) lives in the
+``problem_stats`` section of ``.daily_challenge.json``, with the due date also
+stored as a day ordinal. A filter's heap is only built when that filter is
+first asked for, from those ordinals: one pass and a heapify, no date parsing.
+
+Usage:
+    queue = ReviewQueue(problems, challenge_data["problem_stats"])
+    problem_id = queue.next_problem(date.today(), difficulty="Easy")
+    stats = sm2_update(challenge_data["problem_stats"].get(problem_id), quality=4)
+    queue.update(problem_id, stats)
+"""
+
+from __future__ import annotations
+
+import heapq
+import random
+from datetime import date, datetime, timedelta
+from typing import Any
+
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+PASSING_QUALITY = 3
+
+# Intervals used before SM-2 scheduling was introduced, by success-rate band.
+LEGACY_INTERVALS = ((0.5, 1), (0.7, 3), (0.85, 7), (0.95, 14))
+
+IndexKey = tuple[str | None, str | None]
+
+
+def sm2_update(
+    stats: dict[str, Any] | None,
+    quality: int,
+    now: datetime | None = None,
+) -> dict[str, Any]:
+    """Return new review stats after an attempt graded ``quality`` (0-5)."""
+    if not 0 <= quality <= 5:
+        raise ValueError(f"Quality must be between 0 and 5, got {quality}")
+
+    now = now or datetime.now()
+    stats = stats or {}
+    ease = stats.get("ease", DEFAULT_EASE)
+    interval = stats.get("interval", 0)
+    repetitions = stats.get("repetitions", 0)
+
+    if quality >= PASSING_QUALITY:
+        if repetitions == 0:
+            interval = 1
+        elif repetitions == 1:
+            interval = 6
+        else:
+            interval = round(interval * ease)
+        repetitions += 1
+    else:
+        repetitions = 0
+        interval = 1
+
+    ease = max(MIN_EASE, ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    due = now.date() + timedelta(days=interval)
+
+    return {
+        "attempt_count": stats.get("attempt_count", 0) + 1,
+        "success_count": stats.get("success_count", 0)
+        + int(quality >= PASSING_QUALITY),
+        "last_attempt": now.isoformat(),
+        "ease": round(ease, 2),
+        "interval": interval,
+        "repetitions": repetitions,
+        "due": due.isoformat(),
+        "due_ordinal": due.toordinal(),
+    }
+
+
+def due_ordinal(stats: dict[str, Any]) -> int:
+    """Return the due date of ``stats`` as a proleptic Gregorian ordinal."""
+    if "due_ordinal" in stats:
+        return stats["due_ordinal"]
+    # Stats recorded before the ordinal was stored alongside the date.
+    if "due" in stats:
+        return date.fromisoformat(stats["due"]).toordinal()
+
+    # Stats recorded before SM-2 scheduling: derive a due date from the
+    # success rate the way the old scorer did.
+    attempt_count = stats.get("attempt_count", 0)
+    success_rate = stats.get("success_count", 0) / attempt_count if attempt_count else 0
+    interval = next(
+        (days for limit, days in LEGACY_INTERVALS if success_rate < limit), 30
+    )
+    last_attempt = datetime.fromisoformat(stats["last_attempt"]).date()
+    return last_attempt.toordinal() + interval
+
+
+class ReviewQueue:
+    """Due-date min-heaps of problems, indexed by difficulty and topic.
+
+    Each ``(difficulty, topic)`` filter gets its own pair of heaps, built the
+    first time that filter is used: problems that have been reviewed sit in
+    ``_reviews`` ordered by due date; problems never attempted sit in ``_new``
+    in shuffled order. Updates push a new entry into every built heap the
+    problem belongs to and bump the problem's version; stale entries are
+    dropped lazily when they surface.
+    """
+
+    def __init__(
+        self,
+        problems: dict[str, dict[str, Any]],
+        problem_stats: dict[str, dict[str, Any]],
+        seed: int | None = None,
+    ):
+        """Track the catalog and persisted review stats; heaps come later."""
+        self._problems = problems
+        self._problem_stats = problem_stats
+        self._random = random.Random(seed)
+        self._due: dict[str, int] = {}  # due ordinals updated since construction
+        self._versions: dict[str, int] = {}
+        self._sizes: dict[IndexKey, int] = {}
+        self._reviews: dict[IndexKey, list[tuple[int, float, str, int]]] = {}
+        self._new: dict[IndexKey, list[tuple[float, str, int]]] = {}
+
+    @staticmethod
+    def _matches(problem: dict[str, Any], key: IndexKey) -> bool:
+        """Return whether a problem passes a ``(difficulty, topic)`` filter."""
+        difficulty, topic = key
+        return (difficulty is None or problem["difficulty"] == difficulty) and (
+            topic is None or topic in problem["topics"]
+        )
+
+    def _build(self, key: IndexKey) -> None:
+        """Build the heaps for one filter from the stored due ordinals."""
+        reviews: list[tuple[int, float, str, int]] = []
+        new: list[tuple[float, str, int]] = []
+        for problem_id, problem in self._problems.items():
+            if not self._matches(problem, key):
+                continue
+            version = self._versions.get(problem_id, 0)
+            due = self._due.get(problem_id)
+            if due is None:
+                stats = self._problem_stats.get(problem_id)
+                if stats:
+                    due = due_ordinal(stats)
+            if due is None:
+                new.append((self._random.random(), problem_id, version))
+            else:
+                reviews.append((due, self._random.random(), problem_id, version))
+
+        heapq.heapify(reviews)
+        heapq.heapify(new)
+        self._sizes[key] = len(reviews) + len(new)
+        self._reviews[key] = reviews
+        self._new[key] = new
+
+    def __len__(self) -> int:
+        """Return the number of tracked problems."""
+        return len(self._problems)
+
+    def _peek(self, heap: list[Any] | None) -> Any:
+        """Return the smallest live entry of ``heap``, discarding stale ones."""
+        while heap:
+            entry = heap[0]
+            if self._versions.get(entry[-2], 0) == entry[-1]:
+                return entry
+            heapq.heappop(heap)
+        return None
+
+    def update(self, problem_id: str, stats: dict[str, Any]) -> None:
+        """Reschedule a problem after its review stats changed."""
+        problem = self._problems.get(problem_id)
+        if problem is None:
+            return
+
+        version = self._versions.get(problem_id, 0) + 1
+        self._versions[problem_id] = version
+        due = self._due[problem_id] = due_ordinal(stats)
+        entry = (due, self._random.random(), problem_id, version)
+
+        for key, heap in self._reviews.items():
+            if not self._matches(problem, key):
+                continue
+            heapq.heappush(heap, entry)
+            if len(heap) > 2 * self._sizes[key] + 32:
+                heap[:] = [e for e in heap if self._versions.get(e[2], 0) == e[3]]
+                heapq.heapify(heap)
+
+    def next_problem(
+        self,
+        today: date,
+        difficulty: str | None = None,
+        topic: str | None = None,
+    ) -> str | None:
+        """Pick the next problem to practice, optionally filtered.
+
+        Reviews that are due come first (most overdue first), then problems
+        never attempted, then whichever review falls due soonest.
+        """
+        key = (difficulty, topic)
+        if key not in self._reviews:
+            self._build(key)
+        review = self._peek(self._reviews.get(key))
+        if review is not None and review[0] <= today.toordinal():
+            return review[2]
+
+        new = self._peek(self._new.get(key))
+        if new is not None:
+            return new[1]
+
+        return review[2] if review is not None else None
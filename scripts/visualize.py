@@ -3,27 +3,47 @@
 
 Provides step-by-step visualization of common algorithms.
 
+Each algorithm is a generator that yields ``Step`` records (a message, the
+cells that changed, highlights and counters) without printing or sleeping.
+Renderers consume the trace separately:
+
+- the terminal renderer keeps a frame buffer and only redraws changed cells,
+- ``--headless`` builds the whole trace at full speed and prints it as JSON,
+- ``--export trace.json`` / ``--export trace.html`` write a trace that
+  ``scripts/visualizer.html`` can replay.
+
 Supported algorithms:
 - Two Sum (hash table approach)
 - Binary Search
 - Merge Sort
-- Quick Sort
 - BFS/DFS traversal
-- Dynamic Programming patterns
+- Sliding Window
 
 Usage:
     python scripts/visualize.py two-sum --array "[2,7,11,15]" --target 9
     python scripts/visualize.py binary-search --array "[1,2,3,4,5]" --target 3
     python scripts/visualize.py merge-sort --array "[5,2,8,1,9]"
     python scripts/visualize.py bfs --graph "{'A':['B','C'],'B':['D'],'C':['D'],'D':[]}" --start A
+    python scripts/visualize.py merge-sort --random 5000 --delay 0
+    python scripts/visualize.py merge-sort --array "[5,2,8,1,9]" --export sort.html
 """
 
 from __future__ import annotations
 
 import ast
 import json
+import sys
 import time
-from typing import Any
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+VISUALIZER_HTML = Path(__file__).parent / "visualizer.html"
+TRACE_VERSION = 1
+# Redraw limit when stepping at full speed (--delay 0).
+MAX_FPS = 30
 
 # Color codes
 COLORS = {
@@ -38,6 +58,9 @@ COLORS = {
     "reset": "\033[0m",
 }
 
+# Cell classes shared with visualizer.html.
+CLASS_COLORS = {"checking": "yellow", "found": "green", "window": "blue"}
+
 
 def colorize(text: str, color: str) -> str:
     """Apply color to text."""
@@ -49,358 +72,618 @@ def pause(delay: float = 0.8) -> None:
     time.sleep(delay)
 
 
-class AlgorithmVisualizer:
-    """Visualize algorithm execution step-by-step."""
-
-    def __init__(self, delay: float = 0.8):
-        """Initialize visualizer."""
-        self.delay = delay
-        self.step_count = 0
-
-    def print_step(self, description: str) -> None:
-        """Print a step with counter."""
-        self.step_count += 1
-        print(colorize(f"\n📍 Step {self.step_count}: {description}", "cyan"))
-        pause(self.delay)
-
-    def print_array(
-        self,
-        array: list[Any],
-        highlight: list[int] | None = None,
-        label: str = "",
-    ) -> None:
-        """Print array with optional highlighting."""
-        if label:
-            print(f"   {label}: ", end="")
-        else:
-            print("   ", end="")
-
-        for i, val in enumerate(array):
-            if highlight and i in highlight:
-                print(colorize(f"[{val}]", "yellow"), end=" ")
-            else:
-                print(colorize(f" {val} ", "dim"), end=" ")
-        print()
+# ---------------------------------------------------------------------------
+# Traces
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class Step:
+    """One step of an algorithm run.
+
+    ``array`` replaces the displayed array; ``writes`` patches single cells of
+    the current one (a write just past the end appends), so large sorts and
+    traversals do not store a full copy per step.
+    """
+
+    message: str
+    array: list[Any] | None = None
+    writes: dict[int, Any] | None = None
+    highlights: list[int] | None = None
+    classes: dict[int, str] | None = None
+    state: dict[str, str] | None = None
+    comparisons: int = 0
+    status: str = ""  # "found" or "missing" on the final step
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON form used by visualizer.html (empty fields omitted)."""
+        data: dict[str, Any] = {"message": self.message}
+        for name in ("array", "writes", "highlights", "classes", "state", "status"):
+            value = getattr(self, name)
+            if value:
+                data[name] = value
+        data["comparisons"] = self.comparisons
+        return data
+
+
+@dataclass
+class Algorithm:
+    """A traceable algorithm and how to describe it."""
+
+    title: str
+    complexity: str
+    trace: Callable[..., Iterator[Step]]
+    inputs: tuple[str, ...]
+
+
+@dataclass
+class Trace:
+    """A complete run: metadata plus every step in order."""
+
+    algorithm: str
+    title: str
+    complexity: str
+    inputs: dict[str, Any]
+    steps: list[Step] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the JSON document replayed by visualizer.html."""
+        return {
+            "version": TRACE_VERSION,
+            "algorithm": self.algorithm,
+            "title": self.title,
+            "complexity": self.complexity,
+            "inputs": self.inputs,
+            "steps": [step.to_dict() for step in self.steps],
+        }
+
+
+def preview(items: Any, limit: int = 12) -> str:
+    """Show at most ``limit`` items so per-step state stays O(1) to build."""
+    shown = list(islice(items.items() if isinstance(items, dict) else items, limit))
+    more = f", … +{len(items) - limit}" if len(items) > limit else ""
+    if isinstance(items, dict):
+        return "{" + ", ".join(f"{k}: {v}" for k, v in shown) + more + "}"
+    return "[" + ", ".join(str(item) for item in shown) + more + "]"
+
+
+def trace_two_sum(nums: list[int], target: int) -> Iterator[Step]:
+    """Trace Two Sum with a hash table of seen values."""
+    seen: dict[int, int] = {}
+    comparisons = 0
+    yield Step(
+        f"Looking for two numbers that sum to {target}",
+        array=list(nums),
+        state={"seen": "{}"},
+    )
 
-    def visualize_two_sum(self, nums: list[int], target: int) -> None:
-        """Visualize Two Sum algorithm using hash table."""
-        print(colorize("\n🎯 TWO SUM VISUALIZATION", "bold"))
-        print("=" * 60)
-        print(f"\nInput: nums = {nums}, target = {target}")
-        print(f"\nGoal: Find two indices where nums[i] + nums[j] = {target}")
+    for i, num in enumerate(nums):
+        complement = target - num
+        comparisons += 1
+        yield Step(
+            f"Check index {i}, value = {num}: need complement {target} - {num}"
+            f" = {complement}",
+            highlights=[i],
+            classes={i: "checking"},
+            state={"seen": preview(seen)},
+            comparisons=comparisons,
+        )
+
+        if complement in seen:
+            j = seen[complement]
+            yield Step(
+                f"✅ Found! {complement} at index {j}, {num} at index {i}:"
+                f" answer [{j}, {i}]",
+                classes={j: "found", i: "found"},
+                state={"seen": preview(seen)},
+                comparisons=comparisons,
+                status="found",
+            )
+            return
 
-        self.print_step("Initialize empty hash table to store seen numbers")
-        seen = {}
-        print("   seen = {}")
+        seen[num] = i
+        yield Step(
+            f"Store seen[{num}] = {i}",
+            highlights=[i],
+            state={"seen": preview(seen)},
+            comparisons=comparisons,
+        )
+
+    yield Step("❌ No solution found", comparisons=comparisons, status="missing")
+
+
+def trace_binary_search(nums: list[int], target: int) -> Iterator[Step]:
+    """Trace Binary Search over a sorted array."""
+    left, right = 0, len(nums) - 1
+    comparisons = 0
+    yield Step(
+        f"Search for {target}: left = {left}, right = {right}",
+        array=list(nums),
+        state={"left": str(left), "right": str(right)},
+    )
 
-        self.print_step("Iterate through array")
+    while left <= right:
+        mid = (left + right) // 2
+        comparisons += 1
+        state = {"left": str(left), "mid": str(mid), "right": str(right)}
+        yield Step(
+            f"mid = ({left} + {right}) // 2 = {mid}, nums[mid] = {nums[mid]}",
+            highlights=[left, mid, right],
+            classes={mid: "checking"},
+            state=state,
+            comparisons=comparisons,
+        )
+
+        if nums[mid] == target:
+            yield Step(
+                f"✅ Found! Target {target} at index {mid}",
+                classes={mid: "found"},
+                state=state,
+                comparisons=comparisons,
+                status="found",
+            )
+            return
+        if nums[mid] < target:
+            left = mid + 1
+            message = f"{nums[mid]} < {target}, search right half: left = {left}"
+        else:
+            right = mid - 1
+            message = f"{nums[mid]} > {target}, search left half: right = {right}"
+        yield Step(
+            message,
+            highlights=[i for i in (left, right) if 0 <= i < len(nums)],
+            state={"left": str(left), "right": str(right)},
+            comparisons=comparisons,
+        )
+
+    yield Step(
+        f"❌ Target {target} not found in array",
+        comparisons=comparisons,
+        status="missing",
+    )
 
-        for i, num in enumerate(nums):
-            self.print_step(f"Check index {i}, value = {num}")
-            self.print_array(nums, highlight=[i], label="Array")
 
-            complement = target - num
-            print(f"   Complement needed: {target} - {num} = {complement}")
+def trace_merge_sort(nums: list[int]) -> Iterator[Step]:
+    """Trace top-down Merge Sort; each merge writes its range back in place."""
+    work = list(nums)
+    comparisons = 0
+    yield Step("Sort array using divide-and-conquer", array=list(work))
 
-            if complement in seen:
-                self.print_step(
-                    f"✅ Found! {complement} at index {seen[complement]}, {num} at index {i}"
-                )
-                print(colorize(f"   Answer: [{seen[complement]}, {i}]", "green"))
-                print(
-                    f"   Verification: {nums[seen[complement]]} + {nums[i]} = {target}"
-                )
-                return
+    def sort(lo: int, hi: int) -> Iterator[Step]:
+        nonlocal comparisons
+        if hi - lo <= 1:
+            return
+        mid = (lo + hi) // 2
+        yield Step(
+            f"Divide [{lo}:{hi}] at {mid}",
+            highlights=list(range(lo, hi)),
+            comparisons=comparisons,
+        )
+        yield from sort(lo, mid)
+        yield from sort(mid, hi)
+
+        merged = []
+        i, j = lo, mid
+        while i < mid and j < hi:
+            comparisons += 1
+            if work[i] <= work[j]:
+                merged.append(work[i])
+                i += 1
+            else:
+                merged.append(work[j])
+                j += 1
+        merged.extend(work[i:mid])
+        merged.extend(work[j:hi])
+
+        writes = {
+            lo + k: value for k, value in enumerate(merged) if work[lo + k] != value
+        }
+        work[lo:hi] = merged
+        yield Step(
+            f"Merge [{lo}:{mid}] and [{mid}:{hi}]",
+            writes=writes,
+            highlights=list(range(lo, hi)),
+            comparisons=comparisons,
+        )
+
+    yield from sort(0, len(work))
+    yield Step(
+        "✅ Array sorted",
+        classes=dict.fromkeys(range(len(work)), "found") if len(work) <= 64 else None,
+        comparisons=comparisons,
+        status="found",
+    )
 
-            seen[num] = i
-            print(f"   Store: seen[{num}] = {i}")
-            print(f"   seen = {seen}")
 
-        print(colorize("\n❌ No solution found", "red"))
+def _trace_graph(
+    graph: dict[str, list[str]], start: str, breadth_first: bool
+) -> Iterator[Step]:
+    """Trace BFS (queue) or DFS (stack); the array shows the visit order."""
+    name = "queue" if breadth_first else "stack"
+    frontier: deque[str] = deque([start])
+    # A dict keeps visited nodes in visit order for display.
+    visited: dict[str, None] = {start: None} if breadth_first else {}
+    order: list[str] = []
 
-    def visualize_binary_search(self, nums: list[int], target: int) -> None:
-        """Visualize Binary Search algorithm."""
-        print(colorize("\n🎯 BINARY SEARCH VISUALIZATION", "bold"))
-        print("=" * 60)
-        print(f"\nInput: nums = {nums}, target = {target}")
-        print(f"\nGoal: Find index of {target} in sorted array")
-
-        left, right = 0, len(nums) - 1
-
-        self.print_step("Initialize pointers: left = 0, right = len(nums) - 1")
-        print(f"   left = {left}, right = {right}")
-
-        while left <= right:
-            mid = (left + right) // 2
-
-            self.print_step(f"Calculate mid = (left + right) // 2 = {mid}")
-            self.print_array(nums, highlight=[left, mid, right], label="Array")
-            print(f"   left = {left}, mid = {mid}, right = {right}")
-            print(f"   nums[mid] = {nums[mid]}")
-
-            if nums[mid] == target:
-                self.print_step(f"✅ Found! Target {target} at index {mid}")
-                print(colorize(f"   Answer: {mid}", "green"))
-                return
-            elif nums[mid] < target:
-                self.print_step(
-                    f"nums[mid] ({nums[mid]}) < target ({target}), search right half"
-                )
-                left = mid + 1
-                print(f"   Update: left = {left}")
-            else:
-                self.print_step(
-                    f"nums[mid] ({nums[mid]}) > target ({target}), search left half"
-                )
-                right = mid - 1
-                print(f"   Update: right = {right}")
+    def state() -> dict[str, str]:
+        return {name: preview(frontier), "visited": preview(visited.keys())}
 
-        print(colorize(f"\n❌ Target {target} not found in array", "red"))
+    yield Step(f"Initialize {name} with start node {start}", array=[], state=state())
 
-    def visualize_merge_sort(self, nums: list[int]) -> None:
-        """Visualize Merge Sort algorithm."""
-        print(colorize("\n🎯 MERGE SORT VISUALIZATION", "bold"))
-        print("=" * 60)
-        print(f"\nInput: nums = {nums}")
-        print("\nGoal: Sort array using divide-and-conquer")
-
-        def merge_sort_helper(arr: list[int], level: int = 0) -> list[int]:
-            indent = "  " * level
-
-            if len(arr) <= 1:
-                print(f"{indent}Base case: {arr}")
-                return arr
-
-            mid = len(arr) // 2
-            self.print_step(f"Divide array at mid = {mid}")
-            print(f"{indent}Left:  {arr[:mid]}")
-            print(f"{indent}Right: {arr[mid:]}")
-
-            left = merge_sort_helper(arr[:mid], level + 1)
-            right = merge_sort_helper(arr[mid:], level + 1)
-
-            self.print_step(f"Merge {left} and {right}")
-            result = []
-            i = j = 0
-
-            while i < len(left) and j < len(right):
-                if left[i] <= right[j]:
-                    result.append(left[i])
-                    i += 1
-                else:
-                    result.append(right[j])
-                    j += 1
+    while frontier:
+        node = frontier.popleft() if breadth_first else frontier.pop()
+        if not breadth_first:
+            if node in visited:
+                yield Step(f"{node} already visited, skip", state=state())
+                continue
+            visited[node] = None
+        order.append(node)
+        neighbors = graph.get(node, [])
+        yield Step(
+            f"Visit {node}; neighbors {neighbors}",
+            writes={len(order) - 1: node},
+            classes={len(order) - 1: "checking"},
+            state=state(),
+        )
+
+        # DFS pushes in reverse so neighbors pop in left-to-right order.
+        for neighbor in neighbors if breadth_first else reversed(neighbors):
+            if neighbor in visited:
+                continue
+            frontier.append(neighbor)
+            if breadth_first:
+                visited[neighbor] = None
+        yield Step(f"Updated {name}", state=state())
+
+    yield Step(
+        f"✅ {'BFS' if breadth_first else 'DFS'} order: {' → '.join(order)}",
+        classes=dict.fromkeys(range(len(order)), "found"),
+        state=state(),
+        status="found",
+    )
 
-            result.extend(left[i:])
-            result.extend(right[j:])
 
-            print(f"{indent}Result: {result}")
-            return result
+def trace_bfs(graph: dict[str, list[str]], start: str) -> Iterator[Step]:
+    """Trace breadth-first traversal."""
+    return _trace_graph(graph, start, breadth_first=True)
 
-        sorted_arr = merge_sort_helper(nums)
-        print(colorize(f"\n✅ Final sorted array: {sorted_arr}", "green"))
 
-    def visualize_bfs(self, graph: dict[str, list[str]], start: str) -> None:
-        """Visualize BFS traversal."""
-        print(colorize("\n🎯 BREADTH-FIRST SEARCH VISUALIZATION", "bold"))
-        print("=" * 60)
-        print(f"\nGraph: {graph}")
-        print(f"Start node: {start}")
-        print("\nGoal: Visit all nodes using BFS (level-by-level)")
+def trace_dfs(graph: dict[str, list[str]], start: str) -> Iterator[Step]:
+    """Trace depth-first traversal."""
+    return _trace_graph(graph, start, breadth_first=False)
 
-        from collections import deque
 
-        self.print_step("Initialize queue with start node")
-        queue = deque([start])
-        visited = {start}
+def trace_sliding_window(nums: list[int] | str, k: int) -> Iterator[Step]:
+    """Trace the maximum sum of any window of size ``k``."""
+    # Strings are treated as their character codes.
+    values = [ord(c) for c in nums] if isinstance(nums, str) else list(nums)
+    if len(values) < k or k < 1:
+        yield Step("❌ Array too small for window size", status="missing")
+        return
 
-        print(f"   queue = {list(queue)}")
-        print(f"   visited = {visited}")
+    window_sum = sum(values[:k])
+    max_sum = window_sum
+    yield Step(
+        f"Initialize window of size {k}: sum = {window_sum}",
+        array=values,
+        classes=dict.fromkeys(range(k), "window"),
+        state={"sum": str(window_sum), "max": str(max_sum)},
+    )
 
-        order = []
+    for i in range(k, len(values)):
+        window_sum += values[i] - values[i - k]
+        max_sum = max(max_sum, window_sum)
+        yield Step(
+            f"Slide to [{i - k + 1}:{i + 1}]: - {values[i - k]} + {values[i]}"
+            f" = {window_sum}",
+            highlights=[i - k, i],
+            classes=dict.fromkeys(range(i - k + 1, i + 1), "window"),
+            state={"sum": str(window_sum), "max": str(max_sum)},
+            comparisons=i - k + 1,
+        )
+
+    yield Step(
+        f"✅ Maximum window sum: {max_sum}",
+        state={"max": str(max_sum)},
+        comparisons=len(values) - k,
+        status="found",
+    )
 
-        while queue:
-            self.print_step("Dequeue node from front")
-            node = queue.popleft()
-            order.append(node)
 
-            print(f"   Current node: {colorize(node, 'yellow')}")
-            print(f"   queue = {list(queue)}")
-            print(f"   visited = {visited}")
+ALGORITHMS: dict[str, Algorithm] = {
+    "two-sum": Algorithm("TWO SUM", "O(n)", trace_two_sum, ("nums", "target")),
+    "binary-search": Algorithm(
+        "BINARY SEARCH", "O(log n)", trace_binary_search, ("nums", "target")
+    ),
+    "merge-sort": Algorithm("MERGE SORT", "O(n log n)", trace_merge_sort, ("nums",)),
+    "bfs": Algorithm("BREADTH-FIRST SEARCH", "O(V + E)", trace_bfs, ("graph", "start")),
+    "dfs": Algorithm("DEPTH-FIRST SEARCH", "O(V + E)", trace_dfs, ("graph", "start")),
+    "sliding-window": Algorithm(
+        "SLIDING WINDOW", "O(n)", trace_sliding_window, ("nums", "k")
+    ),
+}
 
-            neighbors = graph.get(node, [])
-            self.print_step(f"Check neighbors of {node}: {neighbors}")
 
-            for neighbor in neighbors:
-                if neighbor not in visited:
-                    print(f"   ➕ Add {neighbor} to queue")
-                    queue.append(neighbor)
-                    visited.add(neighbor)
+def run_headless(algorithm: str, **inputs: Any) -> Trace:
+    """Run an algorithm to completion without rendering and return its trace."""
+    spec = ALGORITHMS[algorithm]
+    trace = Trace(algorithm, spec.title, spec.complexity, inputs)
+    trace.steps.extend(spec.trace(**inputs))
+    return trace
+
+
+def resolve_frames(steps: Iterable[Step]) -> Iterator[tuple[Step, list[Any]]]:
+    """Yield each step with the array as it looks after the step's writes."""
+    array: list[Any] = []
+    for step in steps:
+        if step.array is not None:
+            array = list(step.array)
+        if step.writes:
+            for index, value in step.writes.items():
+                if index == len(array):
+                    array.append(value)  # traces grow arrays one cell at a time
                 else:
-                    print(f"   ⏭️  {neighbor} already visited, skip")
-
-            print(f"   queue = {list(queue)}")
-            print(f"   visited = {visited}")
+                    array[index] = value
+        yield step, array
 
-        print(colorize(f"\n✅ BFS order: {' → '.join(order)}", "green"))
 
-    def visualize_dfs(self, graph: dict[str, list[str]], start: str) -> None:
-        """Visualize DFS traversal."""
-        print(colorize("\n🎯 DEPTH-FIRST SEARCH VISUALIZATION", "bold"))
-        print("=" * 60)
-        print(f"\nGraph: {graph}")
-        print(f"Start node: {start}")
-        print("\nGoal: Visit all nodes using DFS (go deep first)")
-
-        self.print_step("Initialize stack with start node")
-        stack = [start]
-        visited = set()
-        order = []
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
 
-        print(f"   stack = {stack}")
-        print(f"   visited = {visited}")
 
-        while stack:
-            self.print_step("Pop node from stack")
-            node = stack.pop()
+def export_trace(trace: Trace, path: Path) -> None:
+    """Write ``trace`` as JSON, or as a self-playing copy of visualizer.html."""
+    document = json.dumps(trace.to_dict(), separators=(",", ":"), ensure_ascii=False)
+    if path.suffix.lower() != ".html":
+        path.write_text(document, encoding="utf-8")
+        return
 
-            if node in visited:
-                print(f"   {node} already visited, skip")
+    # "</" would end the inline script early.
+    script = (
+        "<script>window.PRELOADED_TRACE = "
+        + document.replace("</", "<\\/")
+        + ";</script>\n"
+    )
+    html = VISUALIZER_HTML.read_text(encoding="utf-8")
+    path.write_text(html.replace("</body>", script + "</body>", 1), encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Terminal rendering
+# ---------------------------------------------------------------------------
+
+Cell = tuple[str, str]  # (text, color)
+Row = list[Cell]
+
+
+def build_frame(
+    trace: Trace, step: Step, index: int, total: int, array: list[Any]
+) -> list[Row]:
+    """Lay out one step as rows of colored cells."""
+    status_color = {"found": "green", "missing": "red"}.get(step.status, "cyan")
+    rows: list[Row] = [
+        [(f"🎯 {trace.title} VISUALIZATION  ({trace.complexity})", "bold")],
+        [("=" * 60, "")],
+        [(f"📍 Step {index}/{total}: {step.message}", status_color)],
+        [],
+    ]
+
+    if array:
+        width = max(len(str(len(array) - 1)), *(len(str(v)) for v in array)) + 2
+        highlights = set(step.highlights or ())
+        classes = step.classes or {}
+        cells: Row = []
+        for i, value in enumerate(array):
+            if i in classes:
+                color = CLASS_COLORS.get(classes[i], "yellow")
+                cells.append((f"[{value}]".center(width), color))
+            elif i in highlights:
+                cells.append((f"[{value}]".center(width), "yellow"))
+            else:
+                cells.append((f" {value} ".center(width), "dim"))
+        rows.append([("   ", "")] + cells)
+        rows.append(
+            [("   ", "")] + [(str(i).center(width), "dim") for i in range(len(array))]
+        )
+        rows.append([])
+
+    for key, value in (step.state or {}).items():
+        rows.append([(f"   {key} = {value}", "")])
+    rows.append([(f"   comparisons: {step.comparisons}", "dim")])
+    return rows
+
+
+class TerminalRenderer:
+    """Frame-buffered renderer that only rewrites cells that changed."""
+
+    def __init__(self, stream: TextIO | None = None):
+        """Start with an empty frame buffer."""
+        self.stream = stream or sys.stdout
+        self.previous: list[Row] = []
+        self.cells_written = 0
+
+    @staticmethod
+    def _text(cells: Row) -> str:
+        return "".join(
+            colorize(text, color) if color else text for text, color in cells
+        )
+
+    def draw(self, frame: list[Row]) -> None:
+        """Update the screen from the previous frame to ``frame``."""
+        out = []
+        if not self.previous:
+            out.append("\033[2J")  # first frame: clear the screen once
+        for row_index in range(max(len(frame), len(self.previous))):
+            new = frame[row_index] if row_index < len(frame) else []
+            old = self.previous[row_index] if row_index < len(self.previous) else None
+            if new == old:
                 continue
+            same_layout = old is not None and [len(t) for t, _ in old] == [
+                len(t) for t, _ in new
+            ]
+            if same_layout and old:
+                # Rewrite only the cells whose text or color changed.
+                column = 1
+                for (text, color), previous in zip(new, old, strict=True):
+                    if (text, color) != previous:
+                        out.append(f"\033[{row_index + 1};{column}H")
+                        out.append(colorize(text, color) if color else text)
+                        self.cells_written += 1
+                    column += len(text)
+            else:
+                out.append(f"\033[{row_index + 1};1H\033[2K{self._text(new)}")
+                self.cells_written += len(new)
+        out.append(f"\033[{len(frame) + 1};1H")
+        self.stream.write("".join(out))
+        self.stream.flush()
+        self.previous = frame
 
-            visited.add(node)
-            order.append(node)
-
-            print(f"   Current node: {colorize(node, 'yellow')}")
-            print(f"   visited = {visited}")
 
-            neighbors = graph.get(node, [])
-            self.print_step(f"Add neighbors of {node}: {neighbors}")
+class PlainRenderer:
+    """Sequential renderer for pipes and files: prints every frame in full."""
 
-            for neighbor in reversed(
-                neighbors
-            ):  # Reverse to maintain left-to-right order
-                if neighbor not in visited:
-                    print(f"   ➕ Push {neighbor} to stack")
-                    stack.append(neighbor)
+    def __init__(self, stream: TextIO | None = None):
+        """Write to ``stream`` (stdout by default)."""
+        self.stream = stream or sys.stdout
 
-            print(f"   stack = {stack}")
+    def draw(self, frame: list[Row]) -> None:
+        """Print the frame's step line, array and state (not the header)."""
+        for row in frame[2:]:
+            self.stream.write("".join(text for text, _ in row) + "\n")
+        self.stream.flush()
 
-        print(colorize(f"\n✅ DFS order: {' → '.join(order)}", "green"))
 
-    def visualize_sliding_window(self, s: str, k: int) -> None:
-        """Visualize sliding window technique."""
-        print(colorize("\n🎯 SLIDING WINDOW VISUALIZATION", "bold"))
-        print("=" * 60)
-        print(f"\nInput: s = '{s}', k = {k}")
-        print(f"\nGoal: Find max sum of any subarray of size {k}")
-
-        if len(s) < k:
-            print(colorize("\n❌ Array too small for window size", "red"))
-            return
-
-        # Convert string to numbers for demo
-        nums = [ord(c) for c in s]
-
-        self.print_step(f"Initialize window of size {k}")
-        window_sum = sum(nums[:k])
-        max_sum = window_sum
+class AlgorithmVisualizer:
+    """Visualize algorithm execution step-by-step."""
 
-        print(f"   Window: {nums[:k]}")
-        print(f"   Sum: {window_sum}")
+    def __init__(self, delay: float = 0.8, renderer: Any = None):
+        """Initialize visualizer."""
+        self.delay = delay
+        if renderer is None:
+            renderer = TerminalRenderer() if sys.stdout.isatty() else PlainRenderer()
+        self.renderer = renderer
+        self.step_count = 0
 
-        for i in range(k, len(nums)):
-            self.print_step(f"Slide window to position {i-k+1}")
+    def play(self, trace: Trace) -> None:
+        """Render a trace; with no delay, redraws are capped at ``MAX_FPS``."""
+        total = len(trace.steps)
+        last_draw = 0.0
+        for index, (step, array) in enumerate(resolve_frames(trace.steps), 1):
+            self.step_count = index
+            now = time.perf_counter()
+            if self.delay <= 0 and index < total and now - last_draw < 1 / MAX_FPS:
+                continue  # skip intermediate frames, never the last one
+            self.renderer.draw(build_frame(trace, step, index, total, array))
+            last_draw = now
+            if self.delay > 0 and index < total:
+                pause(self.delay)
+
+    def visualize(self, algorithm: str, **inputs: Any) -> Trace:
+        """Trace ``algorithm`` at full speed, then render it."""
+        trace = run_headless(algorithm, **inputs)
+        self.play(trace)
+        return trace
+
+    def visualize_two_sum(self, nums: list[int], target: int) -> Trace:
+        """Visualize Two Sum algorithm using hash table."""
+        return self.visualize("two-sum", nums=nums, target=target)
 
-            # Remove leftmost element
-            removed = nums[i - k]
-            added = nums[i]
+    def visualize_binary_search(self, nums: list[int], target: int) -> Trace:
+        """Visualize Binary Search algorithm."""
+        return self.visualize("binary-search", nums=nums, target=target)
 
-            print(f"   Remove: {removed}")
-            print(f"   Add: {added}")
+    def visualize_merge_sort(self, nums: list[int]) -> Trace:
+        """Visualize Merge Sort algorithm."""
+        return self.visualize("merge-sort", nums=nums)
 
-            window_sum = window_sum - removed + added
-            max_sum = max(max_sum, window_sum)
+    def visualize_bfs(self, graph: dict[str, list[str]], start: str) -> Trace:
+        """Visualize BFS traversal."""
+        return self.visualize("bfs", graph=graph, start=start)
 
-            print(f"   Window: {nums[i-k+1:i+1]}")
-            print(f"   Sum: {window_sum}")
-            print(f"   Max so far: {max_sum}")
+    def visualize_dfs(self, graph: dict[str, list[str]], start: str) -> Trace:
+        """Visualize DFS traversal."""
+        return self.visualize("dfs", graph=graph, start=start)
 
-        print(colorize(f"\n✅ Maximum window sum: {max_sum}", "green"))
+    def visualize_sliding_window(self, nums: list[int] | str, k: int) -> Trace:
+        """Visualize sliding window technique."""
+        return self.visualize("sliding-window", nums=nums, k=k)
 
 
 def main() -> None:
     """Main entry point."""
     import argparse
+    import random
 
     parser = argparse.ArgumentParser(description="Visualize algorithm execution")
     parser.add_argument(
-        "algorithm",
-        choices=[
-            "two-sum",
-            "binary-search",
-            "merge-sort",
-            "bfs",
-            "dfs",
-            "sliding-window",
-        ],
-        help="Algorithm to visualize",
+        "algorithm", choices=list(ALGORITHMS), help="Algorithm to visualize"
     )
     parser.add_argument("--array", type=str, help="Input array (JSON format)")
+    parser.add_argument(
+        "--random", type=int, metavar="N", help="Use N random integers as the array"
+    )
     parser.add_argument("--target", type=int, help="Target value")
     parser.add_argument("--graph", type=str, help="Graph (JSON format)")
     parser.add_argument("--start", type=str, help="Start node for graph traversal")
     parser.add_argument(
-        "--delay", type=float, default=0.8, help="Delay between steps (seconds)"
+        "--delay",
+        type=float,
+        default=0.8,
+        help="Delay between steps in seconds (0 = full speed)",
     )
     parser.add_argument("--k", type=int, help="Window size for sliding window")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Print the complete trace as JSON instead of animating it",
+    )
+    parser.add_argument(
+        "--export",
+        type=Path,
+        help="Write the trace to a .json file or a self-playing .html page",
+    )
 
     args = parser.parse_args()
 
-    visualizer = AlgorithmVisualizer(delay=args.delay)
-
     try:
-        if args.algorithm == "two-sum":
-            if not args.array or args.target is None:
-                print("Error: --array and --target required for two-sum")
-                return
+        if args.random:
+            nums: Any = [random.randint(0, 99) for _ in range(args.random)]
+        elif args.array:
             nums = json.loads(args.array)
-            visualizer.visualize_two_sum(nums, args.target)
+        else:
+            nums = None
+        graph = ast.literal_eval(args.graph) if args.graph else None
+
+        provided = {
+            "nums": nums,
+            "target": args.target,
+            "graph": graph,
+            "start": args.start,
+            "k": args.k,
+        }
+        spec = ALGORITHMS[args.algorithm]
+        missing = [name for name in spec.inputs if provided[name] is None]
+        if missing:
+            flags = {"nums": "--array", "graph": "--graph"}
+            names = " and ".join(flags.get(name, f"--{name}") for name in missing)
+            print(f"Error: {names} required for {args.algorithm}")
+            return
 
-        elif args.algorithm == "binary-search":
-            if not args.array or args.target is None:
-                print("Error: --array and --target required for binary-search")
-                return
-            nums = json.loads(args.array)
-            visualizer.visualize_binary_search(sorted(nums), args.target)
+        inputs = {name: provided[name] for name in spec.inputs}
+        if args.algorithm == "binary-search":
+            inputs["nums"] = sorted(inputs["nums"])
 
-        elif args.algorithm == "merge-sort":
-            if not args.array:
-                print("Error: --array required for merge-sort")
-                return
-            nums = json.loads(args.array)
-            visualizer.visualize_merge_sort(nums)
-
-        elif args.algorithm == "bfs":
-            if not args.graph or not args.start:
-                print("Error: --graph and --start required for bfs")
-                return
-            graph = ast.literal_eval(args.graph)
-            visualizer.visualize_bfs(graph, args.start)
-
-        elif args.algorithm == "dfs":
-            if not args.graph or not args.start:
-                print("Error: --graph and --start required for dfs")
-                return
-            graph = ast.literal_eval(args.graph)
-            visualizer.visualize_dfs(graph, args.start)
-
-        elif args.algorithm == "sliding-window":
-            if not args.array or not args.k:
-                print("Error: --array and --k required for sliding-window")
-                return
-            s = json.loads(args.array)
-            visualizer.visualize_sliding_window(str(s), args.k)
+        if args.headless or args.export:
+            trace = run_headless(args.algorithm, **inputs)
+            if args.export:
+                export_trace(trace, args.export)
+                print(f"✅ {len(trace.steps)} steps written to {args.export}")
+            else:
+                print(json.dumps(trace.to_dict(), ensure_ascii=False))
+            return
+
+        AlgorithmVisualizer(delay=args.delay).visualize(args.algorithm, **inputs)
 
     except Exception as e:
         print(colorize(f"\n❌ Error: {e}", "red"))